@@ -9,9 +9,12 @@ Environment Variables:
     GCS_CACHE_BUCKET - GCS bucket name for caching
     GOOGLE_APPLICATION_CREDENTIALS - Path to service account JSON
     SECRET_KEY - Secret key for session encryption
+    REDIS_URL - Optional Redis URL for the shared Flask-Caching backend
 """
 
 import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
 from flask import Flask, request, make_response, redirect
 import dash
@@ -24,8 +27,9 @@ from app.config import (
     APP_NAME, APP_TITLE, SECRET_KEY, DASHBOARDS,
     BC_OPTIONS, COHORT_OPTIONS, DEFAULT_BC, DEFAULT_COHORT, DEFAULT_PLAN,
     METRICS_CONFIG, CHART_METRICS, ROLE_OPTIONS, ROLE_DISPLAY,
-    SESSION_TTL_DEFAULT, SESSION_TTL_REMEMBER
+    SESSION_TTL_DEFAULT, SESSION_TTL_REMEMBER, FLASK_CACHE_CONFIG
 )
+from app.cache import cache
 from app.theme import get_app_css, get_theme_colors, get_header_component, get_logo_component
 from app.auth import (
     authenticate, logout, is_authenticated, get_current_user, is_admin,
@@ -64,6 +68,7 @@ from app.dashboards.admin_panel import callbacks as admin_panel_callbacks
 # Create Flask server
 server = Flask(__name__)
 server.secret_key = SECRET_KEY
+cache.init_app(server, config=FLASK_CACHE_CONFIG)
 
 # Simple health endpoint (doesn't load data)
 @server.route('/health')
@@ -594,7 +599,7 @@ def navigate_back(back_click):
 )
 def handle_landing_bq_refresh(all_clicks):
     """Handle per-dashboard BQ refresh from landing page"""
-    if not any(c for c in all_clicks if c):
+    if not any(all_clicks):
         return no_update, no_update
     
     triggered = ctx.triggered_id
@@ -642,7 +647,7 @@ def handle_landing_bq_refresh(all_clicks):
 )
 def handle_landing_gcs_refresh(all_clicks):
     """Handle per-dashboard GCS refresh from landing page"""
-    if not any(c for c in all_clicks if c):
+    if not any(all_clicks):
         return no_update, no_update
     
     triggered = ctx.triggered_id
@@ -680,48 +685,117 @@ def handle_landing_gcs_refresh(all_clicks):
         return dbc.Alert(msg, color="success", dismissable=True), new_timestamps
     else:
         return dbc.Alert(msg, color="danger", dismissable=True), no_update
+
+
+# =============================================================================
+# DASHBOARD REFRESH JOBS
+# =============================================================================
+# A refresh runs minutes of BQ/GCS work. It runs on one background worker
+# (one refresh at a time) while the page polls for its result, so no Dash
+# request thread is held open for the duration. Job state lives in the
+# Flask-Caching backend under REFRESH_JOB_PREFIX + job id, so with REDIS_URL
+# set a poll can land on any gunicorn worker. Entries expire after
+# REFRESH_JOB_TTL and are removed once their result has been shown.
+
+_REFRESH_POOL = ThreadPoolExecutor(max_workers=1)
+REFRESH_JOB_PREFIX = "refresh_job:"
+REFRESH_JOB_TTL = 3600  # seconds; outlives the slowest refresh
+
+
+def _run_dashboard_refresh(kind):
+    """Run the BQ ("bq") or GCS ("gcs") refresh for ALL dashboards and return its status message and color"""
+    from app.dashboards.all_metrics_merged.data import (
+        refresh_merged_bq_to_staging, refresh_merged_gcs_from_staging
+    )
+    if kind == "bq":
+        # Refresh ICARUS, then Merged tables
+        success1, msg1 = refresh_bq_to_staging()
+        success2, msg2 = refresh_merged_bq_to_staging()
+    else:
+        success1, msg1 = refresh_gcs_from_staging()
+        success2, msg2 = refresh_merged_gcs_from_staging()
+
+    if success1 and success2:
+        return {"message": f"{msg1} | {msg2}", "color": "success"}
+    errors = []
+    if not success1: errors.append(msg1)
+    if not success2: errors.append(msg2)
+    return {"message": f"Partial failure: {' | '.join(errors)}", "color": "warning"}
+
+
+def _refresh_job(job_id, kind):
+    """Background job: run the refresh and record its outcome as {"status", "message", "color"}"""
+    with server.app_context():
+        try:
+            state = _run_dashboard_refresh(kind)
+        except Exception as e:
+            state = {"message": f"Refresh failed: {str(e)}", "color": "danger"}
+        state["status"] = "done"
+        cache.set(REFRESH_JOB_PREFIX + job_id, state, timeout=REFRESH_JOB_TTL)
+
+
+# Instant feedback: lock both buttons and show progress before the server answers
+clientside_callback(
+    """
+    function(bqClicks, gcsClicks) {
+        return ["Refreshing\u2026", true, true];
+    }
+    """,
+    Output('refresh-status', 'children', allow_duplicate=True),
+    Output('refresh-bq-btn', 'disabled', allow_duplicate=True),
+    Output('refresh-gcs-btn', 'disabled', allow_duplicate=True),
+    Input('refresh-bq-btn', 'n_clicks'),
+    Input('refresh-gcs-btn', 'n_clicks'),
+    prevent_initial_call=True
+)
+
+
 @callback(
-    Output('refresh-status', 'children'),
+    Output('refresh-job-id', 'data'),
+    Output('refresh-poll', 'disabled', allow_duplicate=True),
     Input('refresh-bq-btn', 'n_clicks'),
     Input('refresh-gcs-btn', 'n_clicks'),
     prevent_initial_call=True
 )
 def handle_refresh(bq_clicks, gcs_clicks):
-    """Handle data refresh for ALL dashboards"""
-    if not ctx.triggered_id:
-        return no_update
-    
+    """Start the data refresh for ALL dashboards in the background and begin polling"""
     if ctx.triggered_id == "refresh-bq-btn":
-        # Refresh ICARUS
-        success1, msg1 = refresh_bq_to_staging()
-        # Refresh Merged tables
-        from app.dashboards.all_metrics_merged.data import refresh_merged_bq_to_staging
-        success2, msg2 = refresh_merged_bq_to_staging()
-        
-        if success1 and success2:
-            return dbc.Alert(f"{msg1} | {msg2}", color="success", dismissable=True)
-        else:
-            errors = []
-            if not success1: errors.append(msg1)
-            if not success2: errors.append(msg2)
-            return dbc.Alert(f"Partial failure: {' | '.join(errors)}", color="warning", dismissable=True)
-    
+        kind = "bq"
     elif ctx.triggered_id == "refresh-gcs-btn":
-        # Refresh ICARUS
-        success1, msg1 = refresh_gcs_from_staging()
-        # Refresh Merged tables
-        from app.dashboards.all_metrics_merged.data import refresh_merged_gcs_from_staging
-        success2, msg2 = refresh_merged_gcs_from_staging()
-        
-        if success1 and success2:
-            return dbc.Alert(f"{msg1} | {msg2}", color="success", dismissable=True)
-        else:
-            errors = []
-            if not success1: errors.append(msg1)
-            if not success2: errors.append(msg2)
-            return dbc.Alert(f"Partial failure: {' | '.join(errors)}", color="warning", dismissable=True)
-    
-    return no_update
+        kind = "gcs"
+    else:
+        return no_update, no_update
+
+    job_id = uuid.uuid4().hex
+    cache.set(REFRESH_JOB_PREFIX + job_id, {"status": "running"}, timeout=REFRESH_JOB_TTL)
+    _REFRESH_POOL.submit(_refresh_job, job_id, kind)
+    return job_id, False
+
+
+@callback(
+    Output('refresh-status', 'children', allow_duplicate=True),
+    Output('refresh-poll', 'disabled', allow_duplicate=True),
+    Output('refresh-bq-btn', 'disabled', allow_duplicate=True),
+    Output('refresh-gcs-btn', 'disabled', allow_duplicate=True),
+    Input('refresh-poll', 'n_intervals'),
+    State('refresh-job-id', 'data'),
+    prevent_initial_call=True
+)
+def poll_refresh(n_intervals, job_id):
+    """Show the refresh result once its job finishes, then stop polling"""
+    key = REFRESH_JOB_PREFIX + job_id if job_id else None
+    state = cache.get(key) if key else None
+    if state is None:
+        alert = dbc.Alert("Refresh status unavailable.", color="warning", dismissable=True)
+        return alert, True, False, False
+    if state["status"] != "done":
+        return no_update, no_update, no_update, no_update
+
+    cache.delete(key)
+    alert = dbc.Alert(state["message"], color=state["color"], dismissable=True)
+    return alert, True, False, False
+
+
 @callback(
     Output("page-store", "data", allow_duplicate=True),
     Input("nav-btn-daedalus", "n_clicks"),
@@ -746,6 +820,7 @@ def navigate_to_admin(n_clicks):
 # GLOBAL FULLSCREEN FEATURE
 # Injects SVG fullscreen buttons into:
 #   - Every Plotly chart modebar (.js-plotly-plot)  → works in ALL dashboards
+#     (plus a Download CSV button built from the chart's own trace data)
 #   - Every AG Grid title row (.vg-grid-fs-title)   → dashboards using grid_section()
 # Zero per-dashboard configuration required for charts.
 # For grids: wrap with grid_section() from app.components (one import per dashboard).
@@ -812,6 +887,8 @@ clientside_callback(
                          'M18,8.5 L11.5,8.5 L11.5,2 L13,2 L13,7 L18,7Z ' +
                          'M2,11.5 L8.5,11.5 L8.5,18 L7,18 L7,13 L2,13Z ' +
                          'M18,11.5 L11.5,11.5 L11.5,18 L13,18 L13,13 L18,13Z';
+        var CSV_PATH   = 'M9,2 L11,2 L11,10.5 L14,7.5 L15.4,8.9 L10,14.3 L4.6,8.9 L6,7.5 L9,10.5Z ' +
+                         'M3,16 L17,16 L17,18 L3,18Z';
 
         function makeSvg(path, size) {
             return '<svg viewBox="0 0 20 20" width="' + size + '" height="' + size +
@@ -821,13 +898,25 @@ clientside_callback(
 
         var processed = new WeakSet();
 
+        /* Fullscreen button → element it toggles. Buttons carry no listeners of
+           their own; the two document-level handlers below serve all of them */
+        var fsTargets = new WeakMap();
+
         function attachFullscreen(btn, target) {
-            document.addEventListener('fullscreenchange', function() {
-                if (document.fullscreenElement === target) {
+            btn.classList.add('vg-fs-toggle');
+            fsTargets.set(btn, target);
+        }
+
+        document.addEventListener('fullscreenchange', function() {
+            var fsEl = document.fullscreenElement;
+            document.querySelectorAll('.vg-fs-toggle').forEach(function(btn) {
+                var target = fsTargets.get(btn);
+                if (!target) return;
+                if (fsEl === target) {
                     btn.innerHTML     = makeSvg(EXIT_PATH, 14);
                     btn.title         = 'Exit Fullscreen (Esc)';
                     btn.style.opacity = '1';
-                } else if (!document.fullscreenElement) {
+                } else if (!fsEl) {
                     btn.innerHTML     = makeSvg(ENTER_PATH, 14);
                     btn.title         = 'Fullscreen';
                     btn.style.opacity = '0.5';
@@ -839,14 +928,55 @@ clientside_callback(
                     }, 100);
                 }
             });
-            btn.addEventListener('click', function(e) {
+        });
+
+        /* Capture phase so stopPropagation still keeps the click from reaching the chart/grid */
+        document.addEventListener('click', function(e) {
+            if (!e.target.closest) return;
+            var csvBtn = e.target.closest('.vg-csv-modebar-btn');
+            if (csvBtn) {
                 e.stopPropagation();
-                if (document.fullscreenElement === target) {
-                    document.exitFullscreen();
-                } else if (target.requestFullscreen) {
-                    target.requestFullscreen();
+                var plotEl = csvBtn.closest('.js-plotly-plot');
+                if (plotEl) downloadCsv(plotEl);
+                return;
+            }
+            var btn = e.target.closest('.vg-fs-toggle');
+            var target = btn && fsTargets.get(btn);
+            if (!target) return;
+            e.stopPropagation();
+            if (document.fullscreenElement === target) {
+                document.exitFullscreen();
+            } else if (target.requestFullscreen) {
+                target.requestFullscreen();
+            }
+        }, true);
+
+        /* ── CSV export from the traces the chart already holds ── */
+        function csvCell(v) {
+            if (v === null || v === undefined) return '';
+            var str = String(v);
+            return /[",\\n]/.test(str) ? '"' + str.replace(/"/g, '""') + '"' : str;
+        }
+
+        function downloadCsv(plotEl) {
+            /* _fullData holds decoded arrays (typed-array specs are expanded there) */
+            var traces = plotEl._fullData || plotEl.data || [];
+            var rows = ['series,x,y'];
+            traces.forEach(function(t) {
+                var x = t.x || [], y = t.y || [];
+                var name = csvCell(t.name || '');
+                for (var i = 0; i < y.length; i++) {
+                    rows.push(name + ',' + csvCell(x[i]) + ',' + csvCell(y[i]));
                 }
             });
+            var url = URL.createObjectURL(new Blob([rows.join('\\n')], { type: 'text/csv' }));
+            var a = document.createElement('a');
+            a.href     = url;
+            a.download = 'chart.csv';
+            document.body.appendChild(a);
+            a.click();
+            a.remove();
+            setTimeout(function() { URL.revokeObjectURL(url); }, 0);
         }
 
         /* ── Chart injection with retry (handles async Plotly rendering) ── */
@@ -886,8 +1016,15 @@ clientside_callback(
 
             attachFullscreen(btn, plotEl);
 
+            var csvBtn = document.createElement('a');
+            csvBtn.className = 'vg-fs-btn modebar-btn vg-csv-modebar-btn';
+            csvBtn.title     = 'Download CSV';
+            csvBtn.innerHTML = makeSvg(CSV_PATH, 14);
+
             var groups = modebar.querySelectorAll('.modebar-group');
-            (groups.length ? groups[groups.length - 1] : modebar).appendChild(btn);
+            var group = groups.length ? groups[groups.length - 1] : modebar;
+            group.appendChild(csvBtn);
+            group.appendChild(btn);
         }
 
         /* ── Grid injection ── */
@@ -913,6 +1050,14 @@ clientside_callback(
                 m.addedNodes.forEach(function(node) {
                     if (node.nodeType !== 1) return;
 
+                    /* Cheap pre-filter: leaf nodes that aren't targets themselves, and
+                       our own injected buttons, can't contain plots/modebars/grid titles */
+                    var cls = node.classList;
+                    if (cls.contains('vg-fs-btn')) return;
+                    if (!node.firstElementChild &&
+                        !(cls.contains('js-plotly-plot') || cls.contains('modebar-container') ||
+                          cls.contains('modebar') || cls.contains('vg-grid-fs-title'))) return;
+
                     /* Strategy A: watch for .js-plotly-plot (long fallback timeout) */
                     var plots = node.classList.contains('js-plotly-plot')
                         ? [node]
@@ -13,7 +13,7 @@ import hashlib
 from datetime import datetime, timezone, timedelta
 from functools import wraps
 
-from flask import session, redirect, url_for, request
+from flask import session, redirect, url_for, request, g, has_request_context
 from app.config import (
     DEFAULT_USERS, DASHBOARDS, ROLE_DISPLAY,
     GCS_USERS_FILE, GCS_SESSIONS_PREFIX,
@@ -95,6 +95,22 @@ def generate_session_id():
     return str(uuid.uuid4())
 
 
+def _request_sessions():
+    """Sessions already looked up during the current request (None outside one)"""
+    if not has_request_context():
+        return None
+    if "auth_sessions" not in g:
+        g.auth_sessions = {}
+    return g.auth_sessions
+
+
+def _forget_request_session(session_id):
+    """Drop a session from the per-request lookup cache after it changes"""
+    sessions = _request_sessions()
+    if sessions is not None:
+        sessions.pop(session_id, None)
+
+
 def get_session_path(session_id):
     """Get GCS path for a session"""
     return f"{GCS_SESSIONS_PREFIX}{session_id}.json"
@@ -140,6 +156,7 @@ def load_session_from_gcs(session_id):
 
 def save_session_to_gcs(session_id, data):
     """Save session data to GCS (with in-memory fallback)"""
+    _forget_request_session(session_id)
     bucket = get_gcs_bucket()
 
     # Fallback to in-memory storage if GCS is not available
@@ -161,6 +178,7 @@ def save_session_to_gcs(session_id, data):
 
 def delete_session_from_gcs(session_id):
     """Delete session from GCS (with in-memory fallback)"""
+    _forget_request_session(session_id)
     bucket = get_gcs_bucket()
 
     # Fallback to in-memory storage if GCS is not available
@@ -277,10 +295,15 @@ def authenticate(username, password, remember_me=False):
 
 
 def get_session_data(session_id):
-    """Get session data from GCS"""
+    """Get session data from GCS - CACHED for the rest of the current request"""
     if not session_id:
         return None
-    return load_session_from_gcs(session_id)
+    sessions = _request_sessions()
+    if sessions is None:
+        return load_session_from_gcs(session_id)
+    if session_id not in sessions:
+        sessions[session_id] = load_session_from_gcs(session_id)
+    return sessions[session_id]
 
 
 def logout(session_id):
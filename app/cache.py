@@ -0,0 +1,8 @@
+"""
+Shared Flask-Caching instance
+Bound to the Flask server in app.py; import `cache` to memoize callback work
+"""
+
+from flask_caching import Cache
+
+cache = Cache()
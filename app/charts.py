@@ -10,13 +10,19 @@ Customizations:
 - Lines start from first data point
 """
 
-import plotly.graph_objects as go
+import copy
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+import plotly.io as pio
 from app.colors import build_plan_color_map
 from app.theme import get_theme_colors
 
 
+@lru_cache(maxsize=256)
 def hex_to_rgba(hex_color, opacity=1.0):
-    """Convert hex color to rgba string"""
+    """Convert hex color to rgba string - CACHED per (color, opacity)"""
     hex_color = hex_color.lstrip('#')
     r = int(hex_color[0:2], 16)
     g = int(hex_color[2:4], 16)
@@ -36,27 +42,138 @@ def build_legend_data(plans, color_map):
     return legend_items
 
 
-def build_line_chart(data, display_name, format_type="dollar", date_range=None, theme="dark"):
+# Default template, resolved once - go.Figure would embed it on every build, so
+# the plain figure dicts below carry it too to keep the same look
+_DEFAULT_TEMPLATE = pio.templates[pio.templates.default].to_plotly_json()
+
+# Max points per trace handed to Plotly (browser render cost is linear in points)
+DOWNSAMPLE_POINTS = 1500
+
+
+def lttb_downsample(x, y, n_out=DOWNSAMPLE_POINTS):
     """
-    Build a line chart for a metric by Plan over time
+    Largest-Triangle-Three-Buckets downsampling for a single sorted series
+    
+    Keeps the first and last points and, for every bucket in between, the
+    point forming the largest triangle with the previously kept point and
+    the average of the next bucket - preserves the visual shape of the line.
+    
+    Args:
+        x: NumPy array of x values (numeric or datetime64), sorted ascending
+        y: NumPy array of float y values
+        n_out: Target number of points
+    
+    Returns:
+        (x, y) arrays with at most n_out points
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return x, y
+    
+    xs = x.view("i8").astype(np.float64) if np.issubdtype(x.dtype, np.datetime64) else x.astype(np.float64)
+    ys = y.astype(np.float64)
+    
+    every = (n - 2) / (n_out - 2)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0] = 0
+    a = 0
+    for i in range(n_out - 2):
+        # Average of the next bucket (the third triangle vertex)
+        next_start = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x = xs[next_start:next_end].mean()
+        avg_y = ys[next_start:next_end].mean()
+        
+        # Pick the point in the current bucket with the largest triangle area
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        area = np.abs(
+            (xs[a] - avg_x) * (ys[start:end] - ys[a])
+            - (xs[a] - xs[start:end]) * (avg_y - ys[a])
+        )
+        a = start + int(area.argmax())
+        keep[i + 1] = a
+    keep[-1] = n - 1
+    
+    return x[keep], y[keep]
+
+
+# Above this many rows, skip the pandas groupby and partition with one lexsort
+PARTITION_SORT_MIN_ROWS = 200_000
+
+
+def partition_sort(plan_codes, dates_i8, values, n_plans):
+    """
+    Sort flat (plan, date, value) columns into contiguous per-plan runs
+    
+    Args:
+        plan_codes: int array of plan codes (0..n_plans-1)
+        dates_i8: int64 array of dates (datetime64[ns] viewed as i8)
+        values: float64 array of metric values
+        n_plans: Number of distinct plan codes
+    
+    Returns:
+        (offsets, sorted_dates, sorted_values) - plan k spans
+        offsets[k]:offsets[k + 1] in the sorted arrays
+    """
+    order = np.lexsort((dates_i8, plan_codes))  # stable: ties keep input order
+    offsets = np.zeros(n_plans + 1, dtype=np.int64)
+    np.cumsum(np.bincount(plan_codes, minlength=n_plans), out=offsets[1:])
+    return offsets, dates_i8[order], values[order]
+
+
+def _split_by_plan(data):
+    """
+    Split chart data into per-plan series sorted by date
     
     Args:
         data: Dict with Plan_Name, Reporting_Date, metric_value lists
-        display_name: Chart title
-        format_type: 'dollar', 'percent', or 'number'
-        date_range: Tuple of (min_date, max_date) for x-axis range
-        theme: 'dark' or 'light'
     
     Returns:
-        Plotly figure and list of unique plans
+        (unique_plans, [(plan, dates datetime64[ns] array, values float64 array), ...])
     """
+    if len(data["Plan_Name"]) > PARTITION_SORT_MIN_ROWS:
+        # Very large input: SoA partition over integer plan codes
+        plan_names, plan_codes = np.unique(np.asarray(data["Plan_Name"], dtype=object), return_inverse=True)
+        dates_i8 = pd.to_datetime(data["Reporting_Date"]).to_numpy(dtype="datetime64[ns]").view("i8")
+        values = np.nan_to_num(np.asarray(data["metric_value"], dtype=np.float64), nan=0.0)
+        offsets, dates_i8, values = partition_sort(plan_codes, dates_i8, values, len(plan_names))
+        dates = dates_i8.view("datetime64[ns]")
+        
+        unique_plans = plan_names.tolist()
+        series = [
+            (plan, dates[offsets[k]:offsets[k + 1]], values[offsets[k]:offsets[k + 1]])
+            for k, plan in enumerate(unique_plans)
+        ]
+        return unique_plans, series
+    
+    # Sort once by (plan, date) - stable mergesort keeps ties in input order
+    df = pd.DataFrame({
+        "p": data["Plan_Name"],
+        "d": pd.to_datetime(data["Reporting_Date"]),
+        "v": data["metric_value"]
+    })
+    df["v"] = df["v"].fillna(0)
+    df = df.sort_values(["p", "d"], kind="mergesort")
     
+    # Unique plans come out already sorted
+    unique_plans = df["p"].unique().tolist()
+    series = [
+        (plan, sub["d"].to_numpy(dtype="datetime64[ns]"), sub["v"].to_numpy(dtype=np.float64))
+        for plan, sub in df.groupby("p", sort=False)
+    ]
+    return unique_plans, series
+
+
+@lru_cache(maxsize=4)
+def _empty_fig_template(theme):
+    """Empty-state figure dict for a theme - CACHED, treat as read-only"""
     colors = get_theme_colors(theme)
     
-    # Check for empty data
-    if not data or "Plan_Name" not in data or len(data["Plan_Name"]) == 0:
-        fig = go.Figure()
-        fig.update_layout(
+    return {
+        "data": [],
+        "layout": dict(
+            template=_DEFAULT_TEMPLATE,
             height=350,
             paper_bgcolor=colors["card_bg"],
             plot_bgcolor=colors["card_bg"],
@@ -71,66 +188,21 @@ def build_line_chart(data, display_name, format_type="dollar", date_range=None,
                 "font": {"size": 14, "color": colors["text_secondary"]}
             }]
         )
-        return fig, []
-    
-    # Get unique plans and build color map
-    unique_plans = sorted(set(data["Plan_Name"]))
-    color_map = build_plan_color_map(unique_plans)
-    
-    # Organize data by plan
-    plan_data = {}
-    for i in range(len(data["Plan_Name"])):
-        plan = data["Plan_Name"][i]
-        date = data["Reporting_Date"][i]
-        value = data["metric_value"][i]
-        
-        if plan not in plan_data:
-            plan_data[plan] = {"dates": [], "values": []}
-        plan_data[plan]["dates"].append(date)
-        plan_data[plan]["values"].append(value if value is not None else 0)
-    
-    # Create figure
-    fig = go.Figure()
-    
-    # Line opacity for semi-transparency
-    LINE_OPACITY = 0.7
-    LINE_WIDTH = 1.6  # Thin lines
-    
-    # Add trace for each plan
-    for plan in unique_plans:
-        if plan in plan_data:
-            # Sort by date
-            sorted_pairs = sorted(zip(plan_data[plan]["dates"], plan_data[plan]["values"]))
-            dates = [p[0] for p in sorted_pairs]
-            values = [p[1] for p in sorted_pairs]
-            
-            base_color = color_map.get(plan, "#6B7280")
-            line_color = hex_to_rgba(base_color, LINE_OPACITY)
-            
-           # Clean tooltip: plan name + value only (date shown once via x unified)
-            if format_type == "dollar":
-                hover_template = f'{plan}  $%{{y:,.2f}}<extra></extra>'
-            elif format_type == "percent":
-                hover_template = f'{plan}  %{{y:.2%}}<extra></extra>'
-            else:
-                hover_template = f'{plan}  %{{y:,.0f}}<extra></extra>'
-            
-            fig.add_trace(
-                go.Scatter(
-                    x=dates,
-                    y=values,
-                    mode='lines',  # No markers, just lines
-                    name=plan,
-                    line=dict(
-                        color=line_color,
-                        width=LINE_WIDTH,
-                        shape='linear'  # Sharp corners (not spline)
-                    ),
-                    hovertemplate=hover_template,
-                    showlegend=False,
-                    connectgaps=False  # Don't connect gaps in data
-                )
-            )
+    }
+
+
+def _empty_figure(theme):
+    """Deep copy of the cached empty-state figure - safe for callers to mutate"""
+    return copy.deepcopy(_empty_fig_template(theme))
+
+
+@lru_cache(maxsize=16)
+def _base_layout(theme, format_type):
+    """
+    Line chart layout for a theme + format - CACHED, treat as read-only
+    (callers deep-copy it; the nested axis/legend/font dicts are shared)
+    """
+    colors = get_theme_colors(theme)
     
     # Y-axis formatting
     if format_type == "dollar":
@@ -143,12 +215,8 @@ def build_line_chart(data, display_name, format_type="dollar", date_range=None,
         yaxis_tickprefix = ""
         yaxis_tickformat = ",d"
     
-    # X-axis range (full selected range)
-    xaxis_range = None
-    if date_range:
-        xaxis_range = [date_range[0], date_range[1]]
-    
-    fig.update_layout(
+    return dict(
+        template=_DEFAULT_TEMPLATE,
         height=420,
         margin=dict(l=60, r=20, t=20, b=50),
         hovermode="x unified",
@@ -170,7 +238,6 @@ def build_line_chart(data, display_name, format_type="dollar", date_range=None,
             tickfont=dict(color=colors["text_secondary"]),
             tickformat="%b %d, '%y",  # Day-level format (Feb 02, '26)  # Month Year format (Jan 2024)
             hoverformat="%b %d, '%y",  # Full date in tooltip (Dec 13, '25)
-            range=xaxis_range,
             fixedrange=False  # Allow zoom on x-axis
         ),
         yaxis=dict(
@@ -188,16 +255,92 @@ def build_line_chart(data, display_name, format_type="dollar", date_range=None,
         # Enable drag modes for zoom/pan
         dragmode="zoom"  # Default to zoom mode
     )
+
+
+def build_line_chart(data, display_name, format_type="dollar", date_range=None, theme="dark",
+                     downsample=DOWNSAMPLE_POINTS):
+    """
+    Build a line chart for a metric by Plan over time
     
-    return fig, unique_plans
+    Args:
+        data: Dict with Plan_Name, Reporting_Date, metric_value lists
+        display_name: Chart title
+        format_type: 'dollar', 'percent', or 'number'
+        date_range: Tuple of (min_date, max_date) for x-axis range
+        theme: 'dark' or 'light'
+        downsample: Max points per plan trace (LTTB), or None to plot every point
+    
+    Returns:
+        Plotly figure dict and list of unique plans
+    """
+    
+    # Check for empty data
+    if not data or "Plan_Name" not in data or len(data["Plan_Name"]) == 0:
+        return _empty_figure(theme), []
+    
+    # Split into per-plan series sorted by date
+    unique_plans, series = _split_by_plan(data)
+    color_map = build_plan_color_map(unique_plans)
+    
+    # Line opacity for semi-transparency
+    LINE_OPACITY = 0.7
+    LINE_WIDTH = 1.6  # Thin lines
+    
+    # float32 halves the y payload; dollar series keep float64 so hover cents
+    # stay exact (float32 drifts by a cent above ~$131k)
+    value_dtype = np.float64 if format_type == "dollar" else np.float32
+    
+    # One trace per plan - typed NumPy arrays serialize in one shot
+    traces = []
+    for plan, dates, values in series:
+        if downsample and len(values) > downsample:
+            dates, values = lttb_downsample(dates, values, downsample)
+        
+        base_color = color_map.get(plan, "#6B7280")
+        line_color = hex_to_rgba(base_color, LINE_OPACITY)
+        
+       # Clean tooltip: plan name + value only (date shown once via x unified)
+        if format_type == "dollar":
+            hover_template = f'{plan}  $%{{y:,.2f}}<extra></extra>'
+        elif format_type == "percent":
+            hover_template = f'{plan}  %{{y:.2%}}<extra></extra>'
+        else:
+            hover_template = f'{plan}  %{{y:,.0f}}<extra></extra>'
+        
+        # Raw trace dict - skips go.Scatter schema validation
+        traces.append({
+            "type": "scatter",
+            "x": dates,
+            "y": values.astype(value_dtype, copy=False),
+            "mode": "lines",  # No markers, just lines
+            "name": plan,
+            "line": {
+                "color": line_color,
+                "width": LINE_WIDTH,
+                "shape": "linear"  # Sharp corners (not spline)
+            },
+            "hovertemplate": hover_template,
+            "showlegend": False,
+            "connectgaps": False  # Don't connect gaps in data
+        })
+    
+    # Deep copy of the cached base layout so per-chart edits never leak into it
+    layout = copy.deepcopy(_base_layout(theme, format_type))
+    layout["xaxis"]["range"] = [date_range[0], date_range[1]] if date_range else None
+    
+    # Plain figure dict - dcc.Graph accepts it as-is
+    return {"data": traces, "layout": layout}, unique_plans
 
 
 def get_chart_config():
-    """Get Plotly chart configuration with zoom, pan, and download enabled"""
+    """Get Plotly chart configuration with zoom, pan, and download enabled
+    
+    CSV download is a clientside modebar button injected in app.py, built
+    from the (downsampled) trace data already in the browser.
+    """
     return {
         'displayModeBar': True,
         'displaylogo': False,
-        'modeBarButtonsToAdd': ['downloadCsv'],
         'modeBarButtonsToRemove': ['lasso2d', 'select2d'],
         'toImageButtonOptions': {
             'format': 'png',
@@ -5,6 +5,8 @@ Color System for Variant Analytics Dashboard
 - Color map building for charts
 """
 
+from functools import lru_cache
+
 from app.config import APP_COLORS
 
 
@@ -118,6 +120,13 @@ def build_plan_color_map(plans):
     Returns:
         Dictionary mapping plan_name -> hex_color
     """
+    # Copy so callers can't mutate the cached map
+    return dict(_build_plan_color_map_cached(tuple(plans)))
+
+
+@lru_cache(maxsize=64)
+def _build_plan_color_map_cached(plans):
+    """build_plan_color_map body - CACHED per plans tuple (same plan set across charts)"""
     # Group plans by App
     app_plans = {}
     for plan in plans:
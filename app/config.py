@@ -45,6 +45,19 @@ SESSION_TTL_DEFAULT = 86400  # 1 day in seconds
 SESSION_TTL_REMEMBER = 2592000  # 30 days in seconds
 SECRET_KEY = os.environ.get("SECRET_KEY", "variant-dashboard-secret-key-change-in-production")
 
+# =============================================================================
+# SERVER-SIDE CACHE (Flask-Caching)
+# =============================================================================
+# Set REDIS_URL (needs the redis package) to share memoized callback results
+# and refresh job status across gunicorn workers; otherwise each worker keeps
+# its own in-memory cache
+REDIS_URL = os.environ.get("REDIS_URL", "")
+FLASK_CACHE_CONFIG = (
+    {"CACHE_TYPE": "RedisCache", "CACHE_REDIS_URL": REDIS_URL, "CACHE_DEFAULT_TIMEOUT": 300}
+    if REDIS_URL else
+    {"CACHE_TYPE": "SimpleCache", "CACHE_DEFAULT_TIMEOUT": 300}
+)
+
 # =============================================================================
 # DASHBOARD REGISTRY
 # =============================================================================
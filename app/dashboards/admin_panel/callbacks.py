@@ -3,15 +3,22 @@ Admin Panel Callbacks
 Production-ready with full permission enforcement, search, filter, and role tabs
 """
 
+from collections import Counter
+from datetime import datetime
+from functools import lru_cache
+import numpy as np
+import pandas as pd
 from dash import html, callback, Input, Output, State, ALL, ctx, no_update
 import dash_bootstrap_components as dbc
 from app.auth import (
     get_current_user, get_all_users, get_assignable_roles, logout
 )
+from app.cache import cache
 from app.config import ROLE_DISPLAY, DASHBOARDS
 from app.dashboards.admin_panel.services import (
-    get_users_with_metadata, create_user, edit_user, soft_delete_user,
-    get_recent_audit_log, get_dashboard_name, can_edit_user, can_delete_user
+    get_users_with_metadata, get_users_dataframe, get_users_version,
+    create_user, edit_user, soft_delete_user,
+    get_recent_audit_log, get_audit_version, get_dashboard_names, can_edit_user, can_delete_user
 )
 
 # Avatar gradient colors
@@ -25,29 +32,429 @@ AVATAR_COLORS = [
     "linear-gradient(135deg, #6366f1, #4f46e5)",
 ]
 
-# Activity icon styles
+# Activity icon glyphs; colors come from the matching .activity-<kind> class in assets/admin.css
 ACTIVITY_ICONS = {
-    "CREATE": {"bg": "rgba(52,211,153,0.1)", "color": "#34d399", "icon": "+"},
-    "UPDATE": {"bg": "rgba(96,165,250,0.1)", "color": "#60a5fa", "icon": "✎"},
-    "DELETE": {"bg": "rgba(248,113,113,0.1)", "color": "#f87171", "icon": "×"},
-    "DISABLE": {"bg": "rgba(251,191,36,0.1)", "color": "#fbbf24", "icon": "⊘"},
-    "ENABLE": {"bg": "rgba(52,211,153,0.1)", "color": "#34d399", "icon": "✓"},
-    "LOGIN": {"bg": "rgba(52,211,153,0.1)", "color": "#34d399", "icon": "→"},
+    "CREATE": "+",
+    "UPDATE": "✎",
+    "DELETE": "×",
+    "DISABLE": "⊘",
+    "ENABLE": "✓",
+    "LOGIN": "→",
 }
+DEFAULT_ACTIVITY_KIND = "UPDATE"
+
+# open_modal writes 13 outputs; shared tuple for its no-op paths
+NO_UPDATE_MODAL = (no_update,) * 13
+
+
+# Sidebar nav item styles
+NAV_ACTIVE_STYLE = {
+    "display": "flex",
+    "alignItems": "center",
+    "gap": "10px",
+    "padding": "10px 12px",
+    "borderRadius": "6px",
+    "cursor": "pointer",
+    "backgroundColor": "rgba(108,141,250,0.1)",
+    "color": "#6c8dfa",
+    "fontSize": "13.5px",
+    "fontWeight": "500",
+    "marginBottom": "2px",
+    "textDecoration": "none",
+    "position": "relative"
+}
+
+NAV_INACTIVE_STYLE = {
+    "display": "flex",
+    "alignItems": "center",
+    "gap": "10px",
+    "padding": "10px 12px",
+    "borderRadius": "6px",
+    "cursor": "pointer",
+    "color": "#9aa0ab",
+    "fontSize": "13.5px",
+    "fontWeight": "450",
+    "marginBottom": "2px",
+    "textDecoration": "none"
+}
+
+# Role tab styles
+TAB_ACTIVE_STYLE = {
+    "padding": "12px 16px",
+    "fontSize": "13px",
+    "fontWeight": "500",
+    "color": "#6c8dfa",
+    "borderBottom": "2px solid #6c8dfa",
+    "borderRadius": "0",
+    "background": "none"
+}
+
+TAB_INACTIVE_STYLE = {
+    "padding": "12px 16px",
+    "fontSize": "13px",
+    "fontWeight": "500",
+    "color": "#5f6672",
+    "borderBottom": "2px solid transparent",
+    "borderRadius": "0",
+    "background": "none"
+}
+
+# Users table styles (shared by every row; never mutate)
+HEADER_STYLE = {
+    "backgroundColor": "#181b22",
+    "fontSize": "11px",
+    "color": "#5f6672",
+    "fontWeight": "600",
+    "textTransform": "uppercase",
+    "letterSpacing": "0.8px",
+    "padding": "10px 16px",
+    "borderBottom": "1px solid #1f2229"
+}
+
+HEADER_CHECKBOX_STYLE = {**HEADER_STYLE, "width": "40px"}
+HEADER_USER_STYLE = {**HEADER_STYLE, "width": "25%"}
+HEADER_ROLE_STYLE = {**HEADER_STYLE, "width": "12%", "textAlign": "center"}
+HEADER_STATUS_STYLE = {**HEADER_STYLE, "width": "10%", "textAlign": "center"}
+HEADER_DASHBOARDS_STYLE = {**HEADER_STYLE, "width": "12%"}
+HEADER_LAST_LOGIN_STYLE = {**HEADER_STYLE, "width": "15%"}
+HEADER_ACTIONS_STYLE = {**HEADER_STYLE, "width": "100px", "textAlign": "right"}
+
+CELL_STYLE = {"padding": "14px 16px", "verticalAlign": "middle", "borderBottom": "1px solid #1f2229"}
+CENTER_CELL_STYLE = {**CELL_STYLE, "textAlign": "center"}
+RIGHT_CELL_STYLE = {**CELL_STYLE, "textAlign": "right"}
+MONO_CELL_STYLE = {**CELL_STYLE, "fontSize": "12px", "color": "#9aa0ab", "fontFamily": "'JetBrains Mono', monospace"}
+MONO_MUTED_CELL_STYLE = {**MONO_CELL_STYLE, "color": "#5f6672"}
+
+AVATAR_BASE_STYLE = {
+    "width": "34px",
+    "height": "34px",
+    "borderRadius": "50%",
+    "display": "flex",
+    "alignItems": "center",
+    "justifyContent": "center",
+    "fontSize": "13px",
+    "fontWeight": "600",
+    "color": "white",
+    "flexShrink": "0"
+}
+
+ROLE_BADGE_STYLES = {
+    "super_admin": {"bg": "rgba(239,68,68,0.12)", "color": "#ef4444", "text": "Super Admin"},
+    "admin": {"bg": "rgba(245,158,11,0.12)", "color": "#f59e0b", "text": "Admin"},
+    "readonly": {"bg": "rgba(139,92,246,0.12)", "color": "#8b5cf6", "text": "Read Only"}
+}
+
+# Role and status badges only have five variants, so build them once.
+# Dash serializes the tree per response; these must never be mutated.
+ROLE_BADGES = {
+    role: html.Span(info["text"], style={
+        "display": "inline-flex",
+        "alignItems": "center",
+        "padding": "3px 10px",
+        "borderRadius": "20px",
+        "fontSize": "11.5px",
+        "fontWeight": "600",
+        "background": info["bg"],
+        "color": info["color"],
+        "letterSpacing": "0.2px"
+    })
+    for role, info in ROLE_BADGE_STYLES.items()
+}
+
+STATUS_ACTIVE_BADGE = html.Span([
+    html.Span(style={
+        "width": "7px",
+        "height": "7px",
+        "borderRadius": "50%",
+        "backgroundColor": "#34d399",
+        "boxShadow": "0 0 6px #34d399",
+        "marginRight": "6px",
+        "display": "inline-block"
+    }),
+    "Active"
+], style={"display": "flex", "alignItems": "center", "fontSize": "12.5px", "fontWeight": "500", "color": "#34d399"})
+
+STATUS_INACTIVE_BADGE = html.Span([
+    html.Span(style={
+        "width": "7px",
+        "height": "7px",
+        "borderRadius": "50%",
+        "backgroundColor": "#5f6672",
+        "marginRight": "6px",
+        "display": "inline-block"
+    }),
+    "Inactive"
+], style={"display": "flex", "alignItems": "center", "fontSize": "12.5px", "fontWeight": "500", "color": "#5f6672"})
+
+ACTION_BTN_STYLE = {"width": "30px", "height": "30px", "padding": "0", "color": "#5f6672", "fontSize": "12px"}
+
+ROW_STYLE_ACTIVE = {"transition": "background 0.2s"}
+ROW_STYLE_INACTIVE = {"transition": "background 0.2s", "opacity": "0.4"}
+
+
+# Static row pieces shared by every users table row
+ROW_CHECKBOX = html.Div(
+    html.Div(style={
+        "width": "16px",
+        "height": "16px",
+        "borderRadius": "4px",
+        "border": "1.5px solid #2a2d36",
+        "cursor": "pointer"
+    }),
+    style={"display": "flex", "alignItems": "center", "justifyContent": "center"}
+)
+
+NO_ACTIONS = html.Span("-", style={"color": "#2a2d36"})
+
+
+# Rendered users table is memoized across a burst of search/filter changes
+USERS_TABLE_CACHE_TTL = 10  # seconds
+
+# Recent activity is shared across admin sessions between audit writes
+AUDIT_LOG_CACHE_TTL = 10  # seconds
+
+
+@cache.memoize(timeout=AUDIT_LOG_CACHE_TTL)
+def _recent_audit_log_cached(limit, audit_version):
+    """Recent audit entries - CACHED per audit version"""
+    return get_recent_audit_log(limit=limit)
+
+
+# (active, inactive) style pairs for the pattern-matched nav items and role tabs
+_STYLE_PAIRS = {
+    "nav": (NAV_ACTIVE_STYLE, NAV_INACTIVE_STYLE),
+    "tab": (TAB_ACTIVE_STYLE, TAB_INACTIVE_STYLE),
+}
+
+
+@lru_cache(maxsize=32)
+def _style_vector(kind, active_index, indices):
+    """Style per item with only active_index highlighted - CACHED (tiny, fixed set of combinations)"""
+    active_style, inactive_style = _STYLE_PAIRS[kind]
+    return tuple(active_style if index == active_index else inactive_style for index in indices)
+
+
+@lru_cache(maxsize=8)
+def _role_options_for(current_role):
+    """Role dropdown options the given role may assign - CACHED (roles are static config)"""
+    return tuple({"label": ROLE_DISPLAY.get(r, r), "value": r} for r in get_assignable_roles(current_role))
+
+
+def _plural_count(n, singular, plural):
+    """Format a count with the matching noun form, e.g. '1 dashboard' / '3 dashboards'"""
+    return f"{n} {singular}" if n == 1 else f"{n} {plural}"
+
+
+def _td(children, style):
+    """Serialized html.Td payload - skips component init in the row loop"""
+    return {"type": "Td", "namespace": "dash_html_components", "props": {"children": children, "style": style}}
+
+
+def _tr(children, style, class_name):
+    """Serialized html.Tr payload - skips component init in the row loop"""
+    return {
+        "type": "Tr",
+        "namespace": "dash_html_components",
+        "props": {"children": children, "style": style, "className": class_name}
+    }
+
+
+# Cache for available apps (app list changes rarely; avoid reloading per modal open)
+_available_apps_cache = {
+    "data": None,
+    "loaded_at": None
+}
+AVAILABLE_APPS_CACHE_TTL = 300  # 5 minutes
+
+# Above this many users the filter runs as pandas masks instead of a Python loop
+USERS_VECTORIZE_MIN_ROWS = 500
 
 
 def get_available_apps():
-    """Get all available apps"""
+    """Get all available apps - CACHED with TTL"""
+    loaded_at = _available_apps_cache["loaded_at"]
+    if _available_apps_cache["data"] is not None and loaded_at is not None:
+        if (datetime.now() - loaded_at).total_seconds() < AVAILABLE_APPS_CACHE_TTL:
+            return _available_apps_cache["data"]
+
     try:
         from app.bigquery_client import load_plan_groups
         active_plans = load_plan_groups("Active")
         inactive_plans = load_plan_groups("Inactive")
         all_apps = set(active_plans.get("App_Name", []))
         all_apps.update(inactive_plans.get("App_Name", []))
-        return sorted(all_apps)
+        result = sorted(all_apps)
     except Exception:
+        # Fallback list is not cached so the next call retries the load
         return ["AT", "CL", "CN", "CT-Non-JP", "CT-JP", "CV", "DT", "EN", "FS", "IQ", "JF", "PD", "RL", "RT"]
 
+    _available_apps_cache["data"] = result
+    _available_apps_cache["loaded_at"] = datetime.now()
+    return result
+
+
+@cache.memoize(timeout=USERS_TABLE_CACHE_TTL)
+def _render_users_table_cached(search_text, filter_role, filter_status, active_tab,
+                               current_role, current_username, users_version):
+    """Build users table outputs - CACHED per filter state, viewer and users version"""
+    users = get_users_with_metadata()
+
+    # Count by role
+    role_counts = Counter(u.get("role", "readonly") for u in users)
+
+    # Apply tab filter
+    tab_role_map = {
+        "admins": "super_admin",
+        "editors": "admin",
+        "viewers": "readonly"
+    }
+
+    # Resolve filter predicates once instead of per user
+    tab_target_role = tab_role_map.get(active_tab, "") if active_tab and active_tab != "all" else None
+    # "suspended" users are the inactive ones
+    required_active = {"active": True, "inactive": False, "suspended": False}.get(filter_status)
+    role_target = filter_role if filter_role != "all" else None
+    search_lower = search_text.lower() if search_text else None
+
+    if len(users) > USERS_VECTORIZE_MIN_ROWS:
+        df = get_users_dataframe(users)
+        mask = pd.Series(True, index=df.index)
+        if tab_target_role is not None:
+            mask &= df["role"].eq(tab_target_role)
+        if required_active is not None:
+            mask &= df["is_active"].eq(required_active)
+        if role_target is not None:
+            mask &= df["role"].eq(role_target)
+        if search_lower:
+            mask &= (df["user_id_lower"].str.contains(search_lower, regex=False)
+                     | df["name_lower"].str.contains(search_lower, regex=False))
+        filtered_users = [users[i] for i in np.flatnonzero(mask.to_numpy())]
+    else:
+        filtered_users = [
+            u for u in users
+            if (tab_target_role is None or u.get("role", "readonly") == tab_target_role)
+            and (required_active is None or bool(u.get("is_active", True)) == required_active)
+            and (role_target is None or u.get("role", "readonly") == role_target)
+            and (not search_lower
+                 or search_lower in u["user_id"].lower()
+                 or search_lower in u.get("name", "").lower())
+        ]
+
+    table_header = html.Thead(
+        html.Tr([
+            html.Th("", style=HEADER_CHECKBOX_STYLE),  # Checkbox
+            html.Th("User", style=HEADER_USER_STYLE),
+            html.Th("Role", style=HEADER_ROLE_STYLE),
+            html.Th("Status", style=HEADER_STATUS_STYLE),
+            html.Th("Dashboards", style=HEADER_DASHBOARDS_STYLE),
+            html.Th("Last Login", style=HEADER_LAST_LOGIN_STYLE),
+            html.Th("Actions", style=HEADER_ACTIONS_STYLE)
+        ])
+    )
+
+    # Permission matrix for rows that are not the viewer's own account
+    role_edit_ok = {r: can_edit_user(current_role, current_username, r, None) for r in ROLE_BADGE_STYLES}
+
+    table_rows = []
+    for idx, u in enumerate(filtered_users):
+        user_id = u["user_id"]
+        role = u["role"]
+        is_active = u.get("is_active", True)
+        name = u.get("name", user_id)
+
+        # Avatar
+        avatar_color = AVATAR_COLORS[idx % len(AVATAR_COLORS)]
+        avatar_letter = name[0].upper() if name else "?"
+
+        avatar = html.Div(avatar_letter, style={**AVATAR_BASE_STYLE, "background": avatar_color})
+
+        # User cell with avatar
+        user_cell = _td(
+            html.Div([
+                avatar,
+                html.Div([
+                    html.P(name, style={"margin": "0", "color": "#e8eaed", "fontWeight": "500", "fontSize": "13.5px"}),
+                    html.Span(user_id, style={"fontSize": "12px", "color": "#5f6672"})
+                ])
+            ], style={"display": "flex", "alignItems": "center", "gap": "12px"}),
+            CELL_STYLE
+        )
+
+        # Badges are prebuilt at import and shared across rows
+        role_badge = ROLE_BADGES.get(role, ROLE_BADGES["readonly"])
+        status_badge = STATUS_ACTIVE_BADGE if is_active else STATUS_INACTIVE_BADGE
+
+        # Dashboards
+        dashboards = u.get("dashboards", [])
+        if dashboards == "all" or role in ("admin", "super_admin"):
+            dash_text = "All"
+        elif isinstance(dashboards, list) and dashboards:
+            dash_text = _plural_count(len(dashboards), "dashboard", "dashboards")
+        else:
+            dash_text = "-"
+
+        # Last login
+        last_login = u.get("last_login", "")[:10] if u.get("last_login") else "Never"
+
+        # Action buttons
+        # Edit rights depend only on the target role, except for the viewer's own row
+        if user_id == current_username or role not in role_edit_ok:
+            can_edit = can_edit_user(current_role, current_username, role, user_id)
+        else:
+            can_edit = role_edit_ok[role]
+
+        action_btns = []
+        if can_edit:
+            action_btns = html.Div([
+                dbc.Button("👁", id={"type": "admin-view-btn", "index": user_id}, color="link",
+                           style=ACTION_BTN_STYLE),
+                dbc.Button("✎", id={"type": "admin-page-edit-btn", "index": user_id}, color="link",
+                           style=ACTION_BTN_STYLE),
+                dbc.Button("🗑", id={"type": "admin-quick-delete-btn", "index": user_id}, color="link",
+                           style=ACTION_BTN_STYLE),
+            ], style={"display": "flex", "gap": "4px", "opacity": "0", "transition": "opacity 0.2s"}, className="action-btns")
+        else:
+            action_btns = NO_ACTIONS
+
+        row_style = ROW_STYLE_ACTIVE if is_active else ROW_STYLE_INACTIVE
+
+        table_rows.append(
+            _tr([
+                _td(ROW_CHECKBOX, CELL_STYLE),
+                user_cell,
+                _td(role_badge, CENTER_CELL_STYLE),
+                _td(status_badge, CENTER_CELL_STYLE),
+                _td(dash_text, MONO_CELL_STYLE),
+                _td(last_login, MONO_MUTED_CELL_STYLE if last_login == "Never" else MONO_CELL_STYLE),
+                _td(action_btns, RIGHT_CELL_STYLE)
+            ], row_style, "admin-table-row")
+        )
+
+    if not table_rows:
+        empty_state = html.Div([
+            html.Div([
+                html.Span("👥", style={"fontSize": "32px", "opacity": "0.3", "marginBottom": "12px", "display": "block"}),
+                html.P("No users match your filters", style={"color": "#5f6672", "fontSize": "13px", "margin": "0"})
+            ], style={
+                "textAlign": "center",
+                "padding": "48px 24px"
+            })
+        ])
+        return empty_state, "0 users found", str(len(users)), f"{role_counts['super_admin']} users", f"{role_counts['admin']} users", f"{role_counts['readonly']} users"
+
+    table = dbc.Table(
+        [table_header, html.Tbody(table_rows)],
+        bordered=False, hover=True, size="sm",
+        style={
+            "fontSize": "12px",
+            "backgroundColor": "#0a0c10",
+            "marginBottom": "0"
+        },
+        className="admin-users-table"
+    )
+
+    return table, f"{_plural_count(len(filtered_users), 'user', 'users')} found", str(len(users)), f"{role_counts['super_admin']} users", f"{role_counts['admin']} users", f"{role_counts['readonly']} users"
+
 
 def register_callbacks(app):
     """Register admin panel callbacks"""
@@ -59,89 +466,38 @@ def register_callbacks(app):
     # Clientside callback for smooth scrolling to sections
     app.clientside_callback(
         """
-        function(users_clicks, roles_clicks, activity_clicks) {
+        function(nav_clicks) {
             const triggered = dash_clientside.callback_context.triggered;
-            if (!triggered || triggered.length === 0) return window.dash_clientside.no_update;
-
-            const triggeredId = triggered[0].prop_id.split('.')[0];
-            let targetId = null;
+            if (!triggered || triggered.length === 0 || !triggered[0].value) return window.dash_clientside.no_update;
 
-            if (triggeredId === 'nav-users') {
-                targetId = 'section-users';
-            } else if (triggeredId === 'nav-roles') {
-                targetId = 'section-roles';
-            } else if (triggeredId === 'nav-activity') {
-                targetId = 'section-activity';
-            }
-
-            if (targetId) {
-                const element = document.getElementById(targetId);
-                if (element) {
-                    element.scrollIntoView({ behavior: 'smooth', block: 'start' });
-                }
+            const propId = triggered[0].prop_id;
+            const navId = JSON.parse(propId.slice(0, propId.lastIndexOf('.')));
+            const element = document.getElementById('section-' + navId.index);
+            if (element) {
+                element.scrollIntoView({ behavior: 'smooth', block: 'start' });
             }
 
             return window.dash_clientside.no_update;
         }
         """,
         Output('admin-page-refresh-store', 'data', allow_duplicate=True),
-        Input('nav-users', 'n_clicks'),
-        Input('nav-roles', 'n_clicks'),
-        Input('nav-activity', 'n_clicks'),
+        Input({"type": "admin-nav", "index": ALL}, 'n_clicks'),
         prevent_initial_call=True
     )
 
     # Update active nav item style
     @app.callback(
-        Output('nav-users', 'style'),
-        Output('nav-roles', 'style'),
-        Output('nav-activity', 'style'),
-        Input('nav-users', 'n_clicks'),
-        Input('nav-roles', 'n_clicks'),
-        Input('nav-activity', 'n_clicks'),
+        Output({"type": "admin-nav", "index": ALL}, 'style'),
+        Input({"type": "admin-nav", "index": ALL}, 'n_clicks'),
         prevent_initial_call=True
     )
-    def update_nav_styles(users_clicks, roles_clicks, activity_clicks):
+    def update_nav_styles(nav_clicks):
         triggered = ctx.triggered_id
+        if not triggered or not any(nav_clicks):
+            return no_update
 
-        active_style = {
-            "display": "flex",
-            "alignItems": "center",
-            "gap": "10px",
-            "padding": "10px 12px",
-            "borderRadius": "6px",
-            "cursor": "pointer",
-            "backgroundColor": "rgba(108,141,250,0.1)",
-            "color": "#6c8dfa",
-            "fontSize": "13.5px",
-            "fontWeight": "500",
-            "marginBottom": "2px",
-            "textDecoration": "none",
-            "position": "relative"
-        }
-
-        inactive_style = {
-            "display": "flex",
-            "alignItems": "center",
-            "gap": "10px",
-            "padding": "10px 12px",
-            "borderRadius": "6px",
-            "cursor": "pointer",
-            "color": "#9aa0ab",
-            "fontSize": "13.5px",
-            "fontWeight": "450",
-            "marginBottom": "2px",
-            "textDecoration": "none"
-        }
-
-        if triggered == 'nav-users':
-            return active_style, inactive_style, inactive_style
-        elif triggered == 'nav-roles':
-            return inactive_style, active_style, inactive_style
-        elif triggered == 'nav-activity':
-            return inactive_style, inactive_style, active_style
-
-        return no_update, no_update, no_update
+        indices = tuple(output["id"]["index"] for output in ctx.outputs_list)
+        return list(_style_vector("nav", triggered["index"], indices))
 
     # =========================================================================
     # BACK NAVIGATION
@@ -177,54 +533,67 @@ def register_callbacks(app):
 
     @app.callback(
         Output('admin-active-tab-store', 'data'),
-        Output('admin-tab-all', 'style'),
-        Output('admin-tab-admins', 'style'),
-        Output('admin-tab-editors', 'style'),
-        Output('admin-tab-viewers', 'style'),
-        Input('admin-tab-all', 'n_clicks'),
-        Input('admin-tab-admins', 'n_clicks'),
-        Input('admin-tab-editors', 'n_clicks'),
-        Input('admin-tab-viewers', 'n_clicks'),
+        Output({"type": "admin-tab", "index": ALL}, 'style'),
+        Input({"type": "admin-tab", "index": ALL}, 'n_clicks'),
         prevent_initial_call=True
     )
-    def handle_tab_change(all_clicks, admins_clicks, editors_clicks, viewers_clicks):
+    def handle_tab_change(tab_clicks):
         triggered = ctx.triggered_id
+        if not triggered or not any(tab_clicks):
+            return no_update, no_update
 
-        active_style = {
-            "padding": "12px 16px",
-            "fontSize": "13px",
-            "fontWeight": "500",
-            "color": "#6c8dfa",
-            "borderBottom": "2px solid #6c8dfa",
-            "borderRadius": "0",
-            "background": "none"
-        }
-
-        inactive_style = {
-            "padding": "12px 16px",
-            "fontSize": "13px",
-            "fontWeight": "500",
-            "color": "#5f6672",
-            "borderBottom": "2px solid transparent",
-            "borderRadius": "0",
-            "background": "none"
-        }
-
-        if triggered == "admin-tab-all":
-            return "all", active_style, inactive_style, inactive_style, inactive_style
-        elif triggered == "admin-tab-admins":
-            return "admins", inactive_style, active_style, inactive_style, inactive_style
-        elif triggered == "admin-tab-editors":
-            return "editors", inactive_style, inactive_style, active_style, inactive_style
-        elif triggered == "admin-tab-viewers":
-            return "viewers", inactive_style, inactive_style, inactive_style, active_style
-
-        return no_update, no_update, no_update, no_update, no_update
+        active_tab = triggered["index"]
+        indices = tuple(output["id"]["index"] for output in ctx.outputs_list[1])
+        return active_tab, list(_style_vector("tab", active_tab, indices))
 
     # =========================================================================
     # USERS TABLE WITH SEARCH, FILTER & TABS
     # =========================================================================
 
+    # Debounce search typing clientside: only the value that survives 200ms
+    # without another keystroke reaches the store (and the server callback)
+    app.clientside_callback(
+        """
+        function(value) {
+            var pending = window._adminSearchTimer;
+            if (pending) {
+                clearTimeout(pending.id);
+                pending.resolve(window.dash_clientside.no_update);
+            }
+            return new Promise(function(resolve) {
+                var timer = {resolve: resolve};
+                timer.id = setTimeout(function() {
+                    window._adminSearchTimer = null;
+                    resolve(value || "");
+                }, 200);
+                window._adminSearchTimer = timer;
+            });
+        }
+        """,
+        Output('admin-search-store', 'data'),
+        Input('admin-search-input', 'value'),
+        prevent_initial_call=True
+    )
+
+    # Fold refresh/search/filter/tab state into one store on the client, and
+    # only while the admin page is showing, so other page changes never wake
+    # the server-side table render
+    app.clientside_callback(
+        """
+        function(refresh, page, search, role, status, tab) {
+            if (page !== "admin") return window.dash_clientside.no_update;
+            return {refresh: refresh, search: search, role: role, status: status, tab: tab};
+        }
+        """,
+        Output('admin-filters-store', 'data'),
+        Input('admin-page-refresh-store', 'data'),
+        Input('page-store', 'data'),
+        Input('admin-search-store', 'data'),
+        Input('admin-filter-role', 'value'),
+        Input('admin-filter-status', 'value'),
+        Input('admin-active-tab-store', 'data')
+    )
+
     @app.callback(
         Output('admin-users-table-page', 'children'),
         Output('admin-users-count-subtitle', 'children'),
@@ -232,280 +601,58 @@ def register_callbacks(app):
         Output('admin-role-count-super-admin', 'children'),
         Output('admin-role-count-admin', 'children'),
         Output('admin-role-count-read-only', 'children'),
-        Input('admin-page-refresh-store', 'data'),
-        Input('page-store', 'data'),
-        Input('admin-search-input', 'value'),
-        Input('admin-filter-role', 'value'),
-        Input('admin-filter-status', 'value'),
-        Input('admin-active-tab-store', 'data'),
+        Input('admin-filters-store', 'data'),
         State('session-store', 'data'),
-        prevent_initial_call=False
+        prevent_initial_call=True
     )
-    def render_users_table(refresh_trigger, current_page, search_text, filter_role, filter_status, active_tab, session_data):
-        if current_page != "admin":
+    def render_users_table(filters, session_data):
+        if not filters:
             return no_update, no_update, no_update, no_update, no_update, no_update
 
+        search_text = filters.get("search")
+        filter_role = filters.get("role")
+        filter_status = filters.get("status")
+        active_tab = filters.get("tab")
+
         session_id = session_data.get('session_id') if session_data else None
         current_user = get_current_user(session_id) if session_id else None
         current_role = current_user.get("role", "readonly") if current_user else "readonly"
         current_username = current_user.get("username", "") if current_user else ""
 
-        users = get_users_with_metadata()
-
-        # Count by role
-        role_counts = {"super_admin": 0, "admin": 0, "readonly": 0}
-        for u in users:
-            role = u.get("role", "readonly")
-            if role in role_counts:
-                role_counts[role] += 1
-
-        # Apply tab filter
-        tab_role_map = {
-            "admins": "super_admin",
-            "editors": "admin",
-            "viewers": "readonly"
-        }
-
-        # Apply filters
-        filtered_users = []
-        for u in users:
-            is_active = u.get("is_active", True)
-            role = u.get("role", "readonly")
-
-            # Tab filter
-            if active_tab and active_tab != "all":
-                if role != tab_role_map.get(active_tab, ""):
-                    continue
-
-            # Status filter
-            if filter_status == "active" and not is_active:
-                continue
-            if filter_status == "inactive" and is_active:
-                continue
-            if filter_status == "suspended" and is_active:
-                continue
-
-            # Role filter
-            if filter_role != "all" and role != filter_role:
-                continue
-
-            # Search filter
-            if search_text:
-                search_lower = search_text.lower()
-                if search_lower not in u["user_id"].lower() and search_lower not in u.get("name", "").lower():
-                    continue
-
-            filtered_users.append(u)
-
-        # Table header with improved styling
-        header_style = {
-            "backgroundColor": "#181b22",
-            "fontSize": "11px",
-            "color": "#5f6672",
-            "fontWeight": "600",
-            "textTransform": "uppercase",
-            "letterSpacing": "0.8px",
-            "padding": "10px 16px",
-            "borderBottom": "1px solid #1f2229"
-        }
-
-        table_header = html.Thead(
-            html.Tr([
-                html.Th("", style={**header_style, "width": "40px"}),  # Checkbox
-                html.Th("User", style={**header_style, "width": "25%"}),
-                html.Th("Role", style={**header_style, "width": "12%", "textAlign": "center"}),
-                html.Th("Status", style={**header_style, "width": "10%", "textAlign": "center"}),
-                html.Th("Dashboards", style={**header_style, "width": "12%"}),
-                html.Th("Last Login", style={**header_style, "width": "15%"}),
-                html.Th("Actions", style={**header_style, "width": "100px", "textAlign": "right"})
-            ])
-        )
-
-        # Cell style
-        cell_style = {"padding": "14px 16px", "verticalAlign": "middle", "borderBottom": "1px solid #1f2229"}
-        center_cell = {**cell_style, "textAlign": "center"}
-
-        table_rows = []
-        for idx, u in enumerate(filtered_users):
-            user_id = u["user_id"]
-            role = u["role"]
-            is_active = u.get("is_active", True)
-            name = u.get("name", user_id)
-
-            # Avatar
-            avatar_color = AVATAR_COLORS[idx % len(AVATAR_COLORS)]
-            avatar_letter = name[0].upper() if name else "?"
-
-            avatar = html.Div(avatar_letter, style={
-                "width": "34px",
-                "height": "34px",
-                "borderRadius": "50%",
-                "background": avatar_color,
-                "display": "flex",
-                "alignItems": "center",
-                "justifyContent": "center",
-                "fontSize": "13px",
-                "fontWeight": "600",
-                "color": "white",
-                "flexShrink": "0"
-            })
-
-            # User cell with avatar
-            user_cell = html.Td(
-                html.Div([
-                    avatar,
-                    html.Div([
-                        html.P(name, style={"margin": "0", "color": "#e8eaed", "fontWeight": "500", "fontSize": "13.5px"}),
-                        html.Span(user_id, style={"fontSize": "12px", "color": "#5f6672"})
-                    ])
-                ], style={"display": "flex", "alignItems": "center", "gap": "12px"}),
-                style=cell_style
-            )
-
-            # Role badge with consistent styling
-            role_styles = {
-                "super_admin": {"bg": "rgba(239,68,68,0.12)", "color": "#ef4444", "text": "Super Admin"},
-                "admin": {"bg": "rgba(245,158,11,0.12)", "color": "#f59e0b", "text": "Admin"},
-                "readonly": {"bg": "rgba(139,92,246,0.12)", "color": "#8b5cf6", "text": "Read Only"}
-            }
-            role_info = role_styles.get(role, role_styles["readonly"])
-
-            role_badge = html.Span(role_info["text"], style={
-                "display": "inline-flex",
-                "alignItems": "center",
-                "padding": "3px 10px",
-                "borderRadius": "20px",
-                "fontSize": "11.5px",
-                "fontWeight": "600",
-                "background": role_info["bg"],
-                "color": role_info["color"],
-                "letterSpacing": "0.2px"
-            })
-
-            # Status badge
-            if is_active:
-                status_badge = html.Span([
-                    html.Span(style={
-                        "width": "7px",
-                        "height": "7px",
-                        "borderRadius": "50%",
-                        "backgroundColor": "#34d399",
-                        "boxShadow": "0 0 6px #34d399",
-                        "marginRight": "6px",
-                        "display": "inline-block"
-                    }),
-                    "Active"
-                ], style={"display": "flex", "alignItems": "center", "fontSize": "12.5px", "fontWeight": "500", "color": "#34d399"})
-            else:
-                status_badge = html.Span([
-                    html.Span(style={
-                        "width": "7px",
-                        "height": "7px",
-                        "borderRadius": "50%",
-                        "backgroundColor": "#5f6672",
-                        "marginRight": "6px",
-                        "display": "inline-block"
-                    }),
-                    "Inactive"
-                ], style={"display": "flex", "alignItems": "center", "fontSize": "12.5px", "fontWeight": "500", "color": "#5f6672"})
-
-            # Dashboards
-            dashboards = u.get("dashboards", [])
-            if dashboards == "all" or role in ("admin", "super_admin"):
-                dash_text = "All"
-            elif isinstance(dashboards, list) and dashboards:
-                dash_text = f"{len(dashboards)} dashboard{'s' if len(dashboards) > 1 else ''}"
-            else:
-                dash_text = "-"
-
-            # Last login
-            last_login = u.get("last_login", "")[:10] if u.get("last_login") else "Never"
-
-            # Action buttons
-            can_edit = can_edit_user(current_role, current_username, role, user_id)
-
-            action_btns = []
-            if can_edit:
-                action_btns = html.Div([
-                    dbc.Button("👁", id={"type": "admin-view-btn", "index": user_id}, color="link",
-                               style={"width": "30px", "height": "30px", "padding": "0", "color": "#5f6672", "fontSize": "12px"}),
-                    dbc.Button("✎", id={"type": "admin-page-edit-btn", "index": user_id}, color="link",
-                               style={"width": "30px", "height": "30px", "padding": "0", "color": "#5f6672", "fontSize": "12px"}),
-                    dbc.Button("🗑", id={"type": "admin-quick-delete-btn", "index": user_id}, color="link",
-                               style={"width": "30px", "height": "30px", "padding": "0", "color": "#5f6672", "fontSize": "12px"}),
-                ], style={"display": "flex", "gap": "4px", "opacity": "0", "transition": "opacity 0.2s"}, className="action-btns")
-            else:
-                action_btns = html.Span("-", style={"color": "#2a2d36"})
-
-            row_style = {"transition": "background 0.2s"}
-            if not is_active:
-                row_style["opacity"] = "0.4"
-
-            # Checkbox
-            checkbox = html.Div(
-                html.Div(style={
-                    "width": "16px",
-                    "height": "16px",
-                    "borderRadius": "4px",
-                    "border": "1.5px solid #2a2d36",
-                    "cursor": "pointer"
-                }),
-                style={"display": "flex", "alignItems": "center", "justifyContent": "center"}
-            )
-
-            table_rows.append(
-                html.Tr([
-                    html.Td(checkbox, style=cell_style),
-                    user_cell,
-                    html.Td(role_badge, style=center_cell),
-                    html.Td(status_badge, style=center_cell),
-                    html.Td(dash_text, style={**cell_style, "fontSize": "12px", "color": "#9aa0ab", "fontFamily": "'JetBrains Mono', monospace"}),
-                    html.Td(last_login, style={**cell_style, "fontSize": "12px", "color": last_login == "Never" and "#5f6672" or "#9aa0ab", "fontFamily": "'JetBrains Mono', monospace"}),
-                    html.Td(action_btns, style={**cell_style, "textAlign": "right"})
-                ], style=row_style, className="admin-table-row")
-            )
-
-        if not table_rows:
-            empty_state = html.Div([
-                html.Div([
-                    html.Span("👥", style={"fontSize": "32px", "opacity": "0.3", "marginBottom": "12px", "display": "block"}),
-                    html.P("No users match your filters", style={"color": "#5f6672", "fontSize": "13px", "margin": "0"})
-                ], style={
-                    "textAlign": "center",
-                    "padding": "48px 24px"
-                })
-            ])
-            return empty_state, "0 users found", str(len(users)), f"{role_counts['super_admin']} users", f"{role_counts['admin']} users", f"{role_counts['readonly']} users"
-
-        table = dbc.Table(
-            [table_header, html.Tbody(table_rows)],
-            bordered=False, hover=True, size="sm",
-            style={
-                "fontSize": "12px",
-                "backgroundColor": "#0a0c10",
-                "marginBottom": "0"
-            },
-            className="admin-users-table"
+        return _render_users_table_cached(
+            search_text, filter_role, filter_status, active_tab,
+            current_role, current_username, get_users_version()
         )
 
-        return table, f"{len(filtered_users)} user{'s' if len(filtered_users) != 1 else ''} found", str(len(users)), f"{role_counts['super_admin']} users", f"{role_counts['admin']} users", f"{role_counts['readonly']} users"
-
     # =========================================================================
     # ACTIVITY LOG
     # =========================================================================
 
+    # Audit reads run on a timer (and after admin writes) into a store; the
+    # list below only re-renders when the fetched entries actually change
     @app.callback(
-        Output('admin-activity-list', 'children'),
+        Output('admin-activity-store', 'data'),
+        Input('admin-activity-interval', 'n_intervals'),
         Input('admin-page-refresh-store', 'data'),
         Input('page-store', 'data'),
+        State('admin-activity-store', 'data'),
         prevent_initial_call=False
     )
-    def render_activity_list(refresh_trigger, current_page):
+    def load_activity(n_intervals, refresh_trigger, current_page, current_entries):
         if current_page != "admin":
             return no_update
 
-        audit_log = get_recent_audit_log(limit=8)
+        audit_log = _recent_audit_log_cached(8, get_audit_version())
+        if audit_log == current_entries:
+            return no_update
+        return audit_log
 
+    @app.callback(
+        Output('admin-activity-list', 'children'),
+        Input('admin-activity-store', 'data'),
+        prevent_initial_call=True
+    )
+    def render_activity_list(audit_log):
         if not audit_log:
             return html.Div([
                 html.Div([
@@ -527,45 +674,29 @@ def register_callbacks(app):
             # Format timestamp
             time_display = timestamp[:16].replace("T", " ") if timestamp else ""
 
-            # Get icon style
-            icon_info = ACTIVITY_ICONS.get(action.split("_")[0] if "_" in action else action, ACTIVITY_ICONS["UPDATE"])
+            # Get icon kind
+            action_kind = action.partition("_")[0]
+            if action_kind not in ACTIVITY_ICONS:
+                action_kind = DEFAULT_ACTIVITY_KIND
 
             # Build action text
             action_text = action.replace("_", " ").lower()
 
             activity_items.append(
-                html.Div([
-                    html.Div(icon_info["icon"], style={
-                        "width": "32px",
-                        "height": "32px",
-                        "borderRadius": "50%",
-                        "background": icon_info["bg"],
-                        "color": icon_info["color"],
-                        "display": "flex",
-                        "alignItems": "center",
-                        "justifyContent": "center",
-                        "fontSize": "13px",
-                        "flexShrink": "0"
-                    }),
+                html.Li([
+                    html.Span(ACTIVITY_ICONS[action_kind], className=f"activity-icon activity-{action_kind.lower()}"),
                     html.Div([
                         html.P([
-                            html.Strong(actor, style={"fontWeight": "600"}),
+                            html.Strong(actor),
                             f" {action_text}",
                             f" {target}" if target else ""
-                        ], style={"fontSize": "13px", "color": "#e8eaed", "margin": "0", "lineHeight": "1.5"}),
-                        html.Div(time_display, style={"fontSize": "11.5px", "color": "#5f6672", "marginTop": "2px"})
-                    ], style={"flex": "1"})
-                ], style={
-                    "display": "flex",
-                    "alignItems": "flex-start",
-                    "gap": "14px",
-                    "padding": "14px 24px",
-                    "transition": "background 0.2s",
-                    "cursor": "pointer"
-                }, className="activity-item")
+                        ], className="activity-text"),
+                        html.Div(time_display, className="activity-time")
+                    ], className="activity-body")
+                ], className="activity-item")
             )
 
-        return html.Div(activity_items)
+        return html.Ul(activity_items, className="activity-list")
 
     # =========================================================================
     # OPEN ADD/EDIT MODAL
@@ -605,12 +736,12 @@ def register_callbacks(app):
         current_username = current_user.get("username", "") if current_user else ""
 
         assignable = get_assignable_roles(current_role)
-        role_options = [{"label": ROLE_DISPLAY.get(r, r), "value": r} for r in assignable]
+        role_options = list(_role_options_for(current_role))
 
         # ADD NEW USER
         if triggered == "admin-add-user-btn":
             if not add_click:
-                return (no_update,) * 13
+                return NO_UPDATE_MODAL
             default_role = "readonly" if "readonly" in assignable else (assignable[0] if assignable else "readonly")
             return (
                 True, "Add New User", "", False, "", "",
@@ -622,19 +753,19 @@ def register_callbacks(app):
         # EDIT USER
         if isinstance(triggered, dict) and triggered.get("type") == "admin-page-edit-btn":
             user_id = triggered.get("index", "")
-            if not any(c for c in edit_clicks if c):
-                return (no_update,) * 13
+            if not any(edit_clicks):
+                return NO_UPDATE_MODAL
 
             users = get_all_users()
             if user_id not in users:
-                return (no_update,) * 13
+                return NO_UPDATE_MODAL
 
             user_info = users[user_id]
             target_role = user_info.get("role", "readonly")
 
             # Verify permission
             if not can_edit_user(current_role, current_username, target_role, user_id):
-                return (no_update,) * 13
+                return NO_UPDATE_MODAL
 
             # Role dropdown
             if target_role == "super_admin":
@@ -662,7 +793,7 @@ def register_callbacks(app):
                 show_access, show_delete
             )
 
-        return (no_update,) * 13
+        return NO_UPDATE_MODAL
 
     # =========================================================================
     # TOGGLE ACCESS SECTION
@@ -689,9 +820,10 @@ def register_callbacks(app):
         if not access_data:
             return html.P("No dashboards assigned.", style={"color": "#5f6672", "fontSize": "11px", "margin": "10px 0"})
 
+        dash_names = get_dashboard_names(access_data)
         rows = []
         for dash_id, apps in access_data.items():
-            dash_name = get_dashboard_name(dash_id)
+            dash_name = dash_names[dash_id]
             apps_text = ", ".join(sorted(apps)) if apps else "All apps"
             rows.append(
                 dbc.Row([
@@ -712,23 +844,57 @@ def register_callbacks(app):
     # LOAD APPS FOR DASHBOARD
     # =========================================================================
 
+    # App options are fetched the first time the add/edit modal opens and kept
+    # for the rest of the page visit; picking a dashboard in the modal then
+    # fills the apps dropdown clientside
     @app.callback(
+        Output('admin-available-apps-store', 'data'),
+        Input('admin-edit-modal', 'is_open'),
+        State('admin-available-apps-store', 'data'),
+        prevent_initial_call=True
+    )
+    def load_available_apps(is_open, current_options):
+        if not is_open or current_options:
+            return no_update
+        return [{"label": a, "value": a} for a in get_available_apps()]
+
+    app.clientside_callback(
+        """
+        function(dashboard_id, app_options) {
+            if (!dashboard_id) return [[], []];
+            // Options arriving after a dashboard was picked keep the selection
+            var triggered = dash_clientside.callback_context.triggered;
+            var fromStore = triggered && triggered.length > 0 &&
+                triggered[0].prop_id.indexOf('admin-available-apps-store.') === 0;
+            return [app_options || [], fromStore ? window.dash_clientside.no_update : []];
+        }
+        """,
         Output('admin-edit-add-apps', 'options'),
         Output('admin-edit-add-apps', 'value'),
         Input('admin-edit-add-dashboard', 'value'),
+        Input('admin-available-apps-store', 'data'),
         prevent_initial_call=True
     )
-    def load_apps(dashboard_id):
-        if not dashboard_id:
-            return [], []
-        apps = get_available_apps()
-        return [{"label": a, "value": a} for a in apps], []
 
     # =========================================================================
     # ADD ACCESS
     # =========================================================================
 
-    @app.callback(
+    app.clientside_callback(
+        """
+        function(n_clicks, dashboard_id, apps, current) {
+            if (!n_clicks || !dashboard_id) return window.dash_clientside.no_update;
+            apps = apps || [];
+            var existing = current && current[dashboard_id];
+            // Re-adding the same grant would only re-render the access list
+            if (existing && JSON.stringify(existing) === JSON.stringify(apps)) {
+                return window.dash_clientside.no_update;
+            }
+            var updated = Object.assign({}, current);
+            updated[dashboard_id] = apps;
+            return updated;
+        }
+        """,
         Output('admin-edit-access-store', 'data', allow_duplicate=True),
         Input('admin-edit-add-access-btn', 'n_clicks'),
         State('admin-edit-add-dashboard', 'value'),
@@ -736,32 +902,35 @@ def register_callbacks(app):
         State('admin-edit-access-store', 'data'),
         prevent_initial_call=True
     )
-    def add_access(n_clicks, dashboard_id, apps, current):
-        if not n_clicks or not dashboard_id:
-            return no_update
-        updated = dict(current) if current else {}
-        updated[dashboard_id] = apps or []
-        return updated
 
     # =========================================================================
     # REMOVE ACCESS
     # =========================================================================
 
-    @app.callback(
+    app.clientside_callback(
+        """
+        function(clicks, current) {
+            if (!clicks || !clicks.some(Boolean)) return window.dash_clientside.no_update;
+            var triggered = dash_clientside.callback_context.triggered;
+            if (!triggered || triggered.length === 0) return window.dash_clientside.no_update;
+            var propId = triggered[0].prop_id;
+            var btnId;
+            try {
+                btnId = JSON.parse(propId.slice(0, propId.lastIndexOf('.')));
+            } catch (e) {
+                return window.dash_clientside.no_update;
+            }
+            if (!current || !(btnId.index in current)) return window.dash_clientside.no_update;
+            var updated = Object.assign({}, current);
+            delete updated[btnId.index];
+            return updated;
+        }
+        """,
         Output('admin-edit-access-store', 'data', allow_duplicate=True),
         Input({"type": "admin-remove-access-btn", "index": ALL}, "n_clicks"),
         State('admin-edit-access-store', 'data'),
         prevent_initial_call=True
     )
-    def remove_access(clicks, current):
-        if not any(c for c in clicks if c):
-            return no_update
-        triggered = ctx.triggered_id
-        if isinstance(triggered, dict):
-            updated = dict(current) if current else {}
-            updated.pop(triggered.get("index", ""), None)
-            return updated
-        return no_update
 
     # =========================================================================
     # SAVE USER
@@ -822,18 +991,21 @@ def register_callbacks(app):
     # DELETE MODAL
     # =========================================================================
 
-    @app.callback(
+    app.clientside_callback(
+        """
+        function(del_click, cancel, confirm) {
+            var triggered = dash_clientside.callback_context.triggered;
+            if (!triggered || triggered.length === 0) return false;
+            var triggeredId = triggered[0].prop_id.split('.')[0];
+            return triggeredId === 'admin-edit-delete-btn' && !!del_click;
+        }
+        """,
         Output('admin-delete-modal', 'is_open'),
         Input('admin-edit-delete-btn', 'n_clicks'),
         Input('admin-delete-cancel-btn', 'n_clicks'),
         Input('admin-delete-confirm-btn', 'n_clicks'),
         prevent_initial_call=True
     )
-    def toggle_delete_modal(del_click, cancel, confirm):
-        triggered = ctx.triggered_id
-        if triggered == "admin-edit-delete-btn" and del_click:
-            return True
-        return False
 
     # =========================================================================
     # CONFIRM DELETE
@@ -167,13 +167,13 @@ def create_admin_panel_layout(user, theme="dark"):
                     "minWidth": "20px",
                     "textAlign": "center"
                 })
-            ], id="nav-users", n_clicks=0, style=nav_item_active_style),
+            ], id={"type": "admin-nav", "index": "users"}, n_clicks=0, style=nav_item_active_style),
 
             # Roles & Permissions
             html.Div([
                 html.Span("🛡️", style={"fontSize": "16px"}),
                 "Roles & Permissions"
-            ], id="nav-roles", n_clicks=0, style=nav_item_style),
+            ], id={"type": "admin-nav", "index": "roles"}, n_clicks=0, style=nav_item_style),
 
             # Activity Log
             html.Div([
@@ -188,7 +188,7 @@ def create_admin_panel_layout(user, theme="dark"):
                     "padding": "2px 7px",
                     "borderRadius": "10px"
                 })
-            ], id="nav-activity", n_clicks=0, style=nav_item_style),
+            ], id={"type": "admin-nav", "index": "activity"}, n_clicks=0, style=nav_item_style),
 
             # System section
             html.Div("System", style={
@@ -336,7 +336,7 @@ def create_admin_panel_layout(user, theme="dark"):
 
         # Role Tabs
         html.Div([
-            dbc.Button("All Users", id="admin-tab-all", color="link", n_clicks=0, style={
+            dbc.Button("All Users", id={"type": "admin-tab", "index": "all"}, color="link", n_clicks=0, style={
                 "padding": "12px 16px",
                 "fontSize": "13px",
                 "fontWeight": "500",
@@ -345,7 +345,7 @@ def create_admin_panel_layout(user, theme="dark"):
                 "borderRadius": "0",
                 "background": "none"
             }),
-            dbc.Button("Admins", id="admin-tab-admins", color="link", n_clicks=0, style={
+            dbc.Button("Admins", id={"type": "admin-tab", "index": "admins"}, color="link", n_clicks=0, style={
                 "padding": "12px 16px",
                 "fontSize": "13px",
                 "fontWeight": "500",
@@ -354,7 +354,7 @@ def create_admin_panel_layout(user, theme="dark"):
                 "borderRadius": "0",
                 "background": "none"
             }),
-            dbc.Button("Editors", id="admin-tab-editors", color="link", n_clicks=0, style={
+            dbc.Button("Editors", id={"type": "admin-tab", "index": "editors"}, color="link", n_clicks=0, style={
                 "padding": "12px 16px",
                 "fontSize": "13px",
                 "fontWeight": "500",
@@ -363,7 +363,7 @@ def create_admin_panel_layout(user, theme="dark"):
                 "borderRadius": "0",
                 "background": "none"
             }),
-            dbc.Button("Viewers", id="admin-tab-viewers", color="link", n_clicks=0, style={
+            dbc.Button("Viewers", id={"type": "admin-tab", "index": "viewers"}, color="link", n_clicks=0, style={
                 "padding": "12px 16px",
                 "fontSize": "13px",
                 "fontWeight": "500",
@@ -777,6 +777,11 @@ def create_admin_panel_layout(user, theme="dark"):
         dcc.Store(id="admin-edit-access-store", data={}),
         dcc.Store(id="admin-edit-mode-store", data={"mode": "new", "user_id": ""}),
         dcc.Store(id="admin-active-tab-store", data="all"),
+        dcc.Store(id="admin-search-store", data=""),
+        dcc.Store(id="admin-filters-store"),
+        dcc.Store(id="admin-activity-store"),
+        dcc.Store(id="admin-available-apps-store", data=[]),
+        dcc.Interval(id="admin-activity-interval", interval=15000),
         dcc.Store(id="admin-current-page-store", data=1)
 
     ], style={
@@ -5,10 +5,12 @@ Handles user management, audit logging, and permission enforcement
 
 import json
 from datetime import datetime, timezone
+import pandas as pd
 from app.auth import (
-    get_users_db, update_users_db, get_gcs_bucket
+    get_users_db, update_users_db, invalidate_users_cache, get_gcs_bucket
 )
-from app.config import GCS_AUDIT_LOG_FILE, DASHBOARDS
+from app.cache import cache
+from app.config import GCS_AUDIT_LOG_FILE, DASHBOARDS, REDIS_URL
 
 # =============================================================================
 # AUDIT LOG FUNCTIONS
@@ -17,6 +19,15 @@ from app.config import GCS_AUDIT_LOG_FILE, DASHBOARDS
 # Local fallback for audit log
 _local_audit_log = []
 
+# Bumped on every audit write; part of the cached recent-activity key. Shared
+# through the cache backend like USERS_VERSION_KEY
+AUDIT_VERSION_KEY = "admin_panel:audit_version"
+
+
+def get_audit_version():
+    """Current audit log version for cache keys"""
+    return cache.get(AUDIT_VERSION_KEY) or 0
+
 
 def get_audit_log():
     """Load audit log from GCS or local fallback"""
@@ -78,6 +89,7 @@ def log_audit_action(actor_user_id, action, target_user_id, metadata=None):
         log_entries = log_entries[-500:]
 
     save_audit_log(log_entries)
+    _bump_shared_version(AUDIT_VERSION_KEY)
     return entry
 
 
@@ -91,8 +103,55 @@ def get_recent_audit_log(limit=50):
 # ENHANCED USER MANAGEMENT
 # =============================================================================
 
+# Short-lived cache so a burst of admin callbacks (search keystrokes, filters,
+# tabs) shares one users build; "version" is the users version it was built at
+_users_metadata_cache = {
+    "data": None,
+    "loaded_at": None,
+    "version": None
+}
+USERS_METADATA_CACHE_TTL = 3  # seconds
+
+# Bumped on every users write; part of the rendered users table cache key. Kept
+# in the Flask-Caching backend so instances sharing a RedisCache agree on it
+USERS_VERSION_KEY = "admin_panel:users_version"
+
+
+def _bump_shared_version(key):
+    """Increment a version counter in the cache backend - stored without expiry so numbers are never reused"""
+    cache.add(key, 0, timeout=0)
+    version = cache.cache.inc(key)
+    if not REDIS_URL:
+        # SimpleCache's inc is a get + set that re-applies the default timeout
+        cache.set(key, version, timeout=0)
+    return version
+
+
+def get_users_version():
+    """Current users version for cache keys"""
+    return cache.get(USERS_VERSION_KEY) or 0
+
+
+def invalidate_users_metadata_cache():
+    """Drop cached users list so writes are visible immediately"""
+    _users_metadata_cache["data"] = None
+    _users_metadata_cache["loaded_at"] = None
+    _users_metadata_cache["version"] = _bump_shared_version(USERS_VERSION_KEY)
+
+
 def get_users_with_metadata():
-    """Get all users with additional metadata for display"""
+    """Get all users with additional metadata for display - CACHED (treat as read-only)"""
+    version = get_users_version()
+    built_version = _users_metadata_cache["version"]
+    loaded_at = _users_metadata_cache["loaded_at"]
+    if _users_metadata_cache["data"] is not None and loaded_at is not None and built_version == version:
+        if (datetime.now() - loaded_at).total_seconds() < USERS_METADATA_CACHE_TTL:
+            return _users_metadata_cache["data"]
+
+    if built_version is not None and built_version != version:
+        # Another instance wrote users; this process's users db cache predates it
+        invalidate_users_cache()
+
     users = get_users_db()
     result = []
 
@@ -112,9 +171,41 @@ def get_users_with_metadata():
             "last_login": user_info.get("last_login", "")
         })
 
+    _users_metadata_cache["data"] = result
+    _users_metadata_cache["loaded_at"] = datetime.now()
+    _users_metadata_cache["version"] = version
     return result
 
 
+# Columnar view of the users list for vectorized filtering on large tenants;
+# rebuilt only when get_users_with_metadata hands back a new list
+_users_frame_cache = {
+    "source": None,
+    "data": None
+}
+
+
+def get_users_dataframe(users):
+    """Get users list as a DataFrame with lowercased search columns - CACHED per list
+
+    Row i of the frame is users[i], so filtered positions map straight back
+    to the original dicts.
+    """
+    if _users_frame_cache["source"] is users and _users_frame_cache["data"] is not None:
+        return _users_frame_cache["data"]
+
+    df = pd.DataFrame({
+        "role": [u.get("role", "readonly") for u in users],
+        "is_active": [bool(u.get("is_active", True)) for u in users],
+        "user_id_lower": [u["user_id"].lower() for u in users],
+        "name_lower": [(u.get("name") or "").lower() for u in users],
+    })
+
+    _users_frame_cache["source"] = users
+    _users_frame_cache["data"] = df
+    return df
+
+
 def count_active_super_admins():
     """Count active super admin users"""
     users = get_users_db()
@@ -152,6 +243,7 @@ def create_user(actor_user_id, user_id, password, role, name, dashboards, app_ac
     }
 
     update_users_db(users)
+    invalidate_users_metadata_cache()
     log_audit_action(actor_user_id, "CREATE_USER", user_id, {"role": role})
 
     return True, "User created successfully"
@@ -214,6 +306,7 @@ def edit_user(actor_user_id, actor_role, user_id, password=None, role=None, name
     users[user_id]["updated_by"] = actor_user_id
 
     update_users_db(users)
+    invalidate_users_metadata_cache()
 
     if changes:
         log_audit_action(actor_user_id, "UPDATE_USER", user_id, changes)
@@ -247,6 +340,7 @@ def soft_delete_user(actor_user_id, actor_role, user_id):
     users[user_id]["updated_by"] = actor_user_id
 
     update_users_db(users)
+    invalidate_users_metadata_cache()
     log_audit_action(actor_user_id, "DELETE_USER", user_id)
 
     return True, "User deleted successfully"
@@ -277,6 +371,7 @@ def toggle_user_status(actor_user_id, actor_role, user_id):
     users[user_id]["updated_by"] = actor_user_id
 
     update_users_db(users)
+    invalidate_users_metadata_cache()
 
     action = "ENABLE_USER" if new_status else "DISABLE_USER"
     log_audit_action(actor_user_id, action, user_id)
@@ -324,9 +419,15 @@ def can_delete_user(current_role, target_role):
     return False
 
 
+# DASHBOARDS is static config, so the id -> name map is built once
+_DASHBOARD_NAMES = {d["id"]: d["name"] for d in DASHBOARDS}
+
+
 def get_dashboard_name(dashboard_id):
     """Get dashboard display name from ID"""
-    for d in DASHBOARDS:
-        if d["id"] == dashboard_id:
-            return d["name"]
-    return dashboard_id
+    return _DASHBOARD_NAMES.get(dashboard_id, dashboard_id)
+
+
+def get_dashboard_names(dashboard_ids):
+    """Get display names for many dashboard IDs in one pass"""
+    return {dash_id: _DASHBOARD_NAMES.get(dash_id, dash_id) for dash_id in dashboard_ids}
@@ -2,41 +2,362 @@
 Callbacks for All Metrics Merged Dashboard
 
 Handles:
-- Tab switching and filter visibility
+- Tab switching (clientside) and filter visibility
+- Lazy per-tab rendering
 - Plan Name dropdown population
-- Tab 1: All Plans (8 charts)
+- Tab 1: All Plans (Plan Details grid + 7 charts)
 - Tab 2: Individual Plans (4 charts)
 - Tab 3: Merged Plans - Breakup (2 charts)
 - Tab 4: Entity (5 charts)
 """
 
-from dash import html, dcc, callback, Input, Output, State, no_update, ctx, clientside_callback
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from dash import html, dcc, callback, Input, Output, State, Patch, no_update, ctx, clientside_callback
 import dash_bootstrap_components as dbc
 import dash_ag_grid as dag
 
 from app.theme import get_theme_colors
 from app.dashboards.all_metrics_merged.charts import build_merged_color_map
 from app.charts import create_legend_component
-from app.dashboards.all_metrics_merged.layout import chart_card, table_card
+from app.dashboards.all_metrics_merged.layout import chart_card, table_card, MERGED_TAB_IDS
 from app.components import grid_section
 from app.dashboards.all_metrics_merged.charts import (
-    build_plan_line_chart, build_metric_line_chart, build_stacked_area_chart
+    build_plan_line_chart, build_metric_line_chart, build_stacked_area_chart, build_chart_json, METRIC_COLORS
 )
 from app.dashboards.all_metrics_merged.data import (
     get_plan_names_for_app,
     get_vpu_plan_names_for_app,
     get_plan_details,
+    get_plan_details_records,
     get_spend_by_plan,
     get_users_by_plan,
     get_spend_by_plan_single,
-    get_metric_summed_all_bcs,
-    get_metric_by_bc,
+    get_metrics_summed_all_bcs,
+    get_metrics_by_bc,
     get_four_metrics_for_plan,
     get_entity_four_metrics,
-    get_rebill_contribution,
+    get_rebill_contribution_all_bcs,
 )
 
 
+# Shared pool for fanning out a tab's independent data-layer queries; the
+# pandas filters/groupbys release the GIL for much of their work
+_DATA_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="merged-data")
+
+# Charts 6-7 of All Plans are the only ones that read the BC filter; they sit
+# at this position in the tab's chart list
+ALL_PLANS_BC_CHARTS_AT = 5
+
+ALL_PLANS_SUMMED_METRICS = [
+    ("Net_ARPU_Discounted", "Net ARPU ($) by Individual Plan", "dollar"),
+    ("Net_LTV_Discounted", "Net LTV ($) by Individual Plan", "dollar"),
+    ("Recent_CAC", "Recent CAC ($) by Individual Plan", "dollar"),
+]
+
+# Tabs that show (and read) the Plan Name dropdown
+PLAN_FILTER_TABS = {"individual-plans", "merged-breakup"}
+
+# Tabs are usually visited left to right; after rendering one, warm the data
+# caches behind the next so the switch finds its queries already answered
+NEXT_TAB = {
+    "all-plans": "individual-plans",
+    "individual-plans": "merged-breakup",
+    "merged-breakup": "entity",
+}
+
+# Single worker so background prefetch never competes with a live render
+# for more than one thread
+_PREFETCH_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="merged-prefetch")
+_last_prefetch_key = {"value": None}
+_prefetch_lock = threading.Lock()
+
+
+def _prefetch_next_tab(active_tab, app_name, start_date, end_date):
+    """Warm the data caches for the tab after active_tab (results are discarded)"""
+    next_tab = NEXT_TAB.get(active_tab)
+    # Switching tabs resets the plan dropdown to the first plan of that tab's
+    # list, so that is the plan the next tab will ask for
+    if next_tab == "individual-plans":
+        plans = get_plan_names_for_app(app_name)
+        if plans:
+            get_four_metrics_for_plan(app_name, start_date, end_date, plans[0], "main_30")
+            get_four_metrics_for_plan(app_name, start_date, end_date, plans[0], "main_300")
+            get_users_by_plan(app_name, start_date, end_date, plans[0])
+            get_spend_by_plan_single(app_name, start_date, end_date, plans[0])
+    elif next_tab == "merged-breakup":
+        plans = get_vpu_plan_names_for_app(app_name)
+        if plans:
+            get_four_metrics_for_plan(app_name, start_date, end_date, plans[0], "vpu_main")
+            get_four_metrics_for_plan(app_name, start_date, end_date, plans[0], "vpu_main_300")
+    elif next_tab == "entity":
+        get_entity_four_metrics(app_name, start_date, end_date)
+        get_rebill_contribution_all_bcs(app_name, start_date, end_date)
+
+
+def _schedule_prefetch(active_tab, app_name, start_date, end_date):
+    """Fire-and-forget prefetch of the next tab, skipping repeats of the last one"""
+    if active_tab not in NEXT_TAB:
+        return
+    key = (active_tab, app_name, start_date, end_date)
+    with _prefetch_lock:
+        if _last_prefetch_key["value"] == key:
+            return
+        _last_prefetch_key["value"] = key
+    _PREFETCH_POOL.submit(_prefetch_next_tab, active_tab, app_name, start_date, end_date)
+
+
+# =================================================================
+# TAB 1: ALL PLANS
+# =================================================================
+
+def _render_all_plans(app_name, start_date, end_date, bc, theme):
+    colors = get_theme_colors(theme)
+    date_range = (start_date, end_date)
+    query = (app_name, start_date, end_date)
+    children = []
+
+    # Kick off the data-layer queries, then assemble in display order
+    spend_future = _DATA_POOL.submit(get_spend_by_plan, app_name, start_date, end_date)
+    users_future = _DATA_POOL.submit(get_users_by_plan, app_name, start_date, end_date)
+    summed_future = _DATA_POOL.submit(
+        get_metrics_summed_all_bcs, app_name, start_date, end_date,
+        [metric for metric, _, _ in ALL_PLANS_SUMMED_METRICS], "main_30"
+    )
+    by_bc_future = _DATA_POOL.submit(
+        get_metrics_by_bc, app_name, start_date, end_date, ["Retention_rate", "Refund_ratio"], bc, "main_30"
+    )
+
+    # --- Chart 1: Spend ($) by Individual Plan ---
+    spend_df = spend_future.result()
+    fig_spend, plans_spend = build_chart_json(build_plan_line_chart, ("spend_by_plan", *query), spend_df, "Spend ($) by Individual Plan", "dollar", date_range, theme)
+    children.append(_chart_with_legend("Spend ($) by Individual Plan", fig_spend, plans_spend, theme, colors))
+
+    # --- Chart 2: New Users by Individual Plan ---
+    users_df = users_future.result()
+    fig_users, plans_users = build_chart_json(build_plan_line_chart, ("users_by_plan", *query), users_df, "New Users by Individual Plan", "number", date_range, theme)
+    children.append(_chart_with_legend("New Users by Individual Plan", fig_users, plans_users, theme, colors))
+
+    # --- Charts 3-5: Net ARPU, Net LTV, Recent CAC (SUM all BCs) ---
+    summed_dfs = summed_future.result()
+    for metric, title, fmt in ALL_PLANS_SUMMED_METRICS:
+        fig, plans = build_chart_json(build_plan_line_chart, ("metrics_summed_all_bcs", *query, metric), summed_dfs[metric], title, fmt, date_range, theme)
+        children.append(_chart_with_legend(title, fig, plans, theme, colors))
+
+    # --- Charts 6-7: Gross Retention, Refund (filtered by BC) ---
+    children.extend(_all_plans_bc_charts(by_bc_future.result(), query + (bc,), theme, colors))
+
+    return html.Div(children)
+
+
+def _render_plan_details(app_name, theme):
+    """Plan Details grid card for the All Plans tab (depends only on the app)"""
+    colors = get_theme_colors(theme)
+    plan_df = get_plan_details(app_name)
+    if plan_df.empty:
+        return dbc.Alert("No plan details found.", color="secondary")
+    col_defs = [{"field": c, "sortable": True, "filter": True, "resizable": True} for c in plan_df.columns]
+    grid = dag.AgGrid(
+        rowData=get_plan_details_records(app_name),
+        columnDefs=col_defs,
+        defaultColDef={"flex": 1, "minWidth": 100},
+        dashGridOptions={
+            "animateRows": True,
+        },
+        style={"height": "230px", "width": "100%"},
+        className="ag-theme-alpine-dark" if theme == "dark" else "ag-theme-alpine",
+    )
+    return grid_section(
+        "Plan Details",
+        grid,
+        "merged-plan-details",
+        colors
+    )
+
+
+def _all_plans_bc_charts(by_bc_dfs, bc_query, theme, colors):
+    """Charts 6-7 of All Plans from get_metrics_by_bc output for bc_query = (app_name, start_date, end_date, bc)"""
+    date_range = bc_query[1:3]
+    retention_df = by_bc_dfs["Retention_rate"]
+    fig_ret, plans_ret = build_chart_json(build_plan_line_chart, ("metrics_by_bc", *bc_query, "Retention_rate"), retention_df, "Gross Retention by Individual Plan", "percent", date_range, theme)
+    refund_df = by_bc_dfs["Refund_ratio"]
+    fig_ref, plans_ref = build_chart_json(build_plan_line_chart, ("metrics_by_bc", *bc_query, "Refund_ratio"), refund_df, "Refund by Individual Plan", "percent", date_range, theme)
+    return [
+        _chart_with_legend("Gross Retention by Individual Plan", fig_ret, plans_ret, theme, colors),
+        _chart_with_legend("Refund by Individual Plan", fig_ref, plans_ref, theme, colors),
+    ]
+
+
+def _patch_all_plans_bc_charts(app_name, start_date, end_date, bc, theme):
+    """Patch replacing only charts 6-7 of an already rendered All Plans tab"""
+    by_bc_dfs = get_metrics_by_bc(app_name, start_date, end_date, ["Retention_rate", "Refund_ratio"], bc, "main_30")
+    charts = _all_plans_bc_charts(by_bc_dfs, (app_name, start_date, end_date, bc), theme, get_theme_colors(theme))
+    patched = Patch()
+    for offset, chart in enumerate(charts):
+        patched["props"]["children"][ALL_PLANS_BC_CHARTS_AT + offset] = chart
+    return patched
+
+
+# =================================================================
+# TAB 2: INDIVIDUAL PLANS
+# =================================================================
+
+def _render_individual_plans(app_name, start_date, end_date, plan_name, theme):
+    colors = get_theme_colors(theme)
+    date_range = (start_date, end_date)
+    query = (app_name, start_date, end_date, plan_name)
+    children = []
+
+    metrics_30_future = _DATA_POOL.submit(get_four_metrics_for_plan, app_name, start_date, end_date, plan_name, "main_30")
+    metrics_300_future = _DATA_POOL.submit(get_four_metrics_for_plan, app_name, start_date, end_date, plan_name, "main_300")
+    users_future = _DATA_POOL.submit(get_users_by_plan, app_name, start_date, end_date, plan_name)
+    spend_future = _DATA_POOL.submit(get_spend_by_plan_single, app_name, start_date, end_date, plan_name)
+
+    # --- Chart 1: Individual Plan - T30D (4 metrics, SUM all BCs) ---
+    metrics_30 = metrics_30_future.result()
+    fig_30, names_30 = build_chart_json(build_metric_line_chart, ("four_metrics_for_plan", *query, "main_30"), metrics_30, "Individual Plan - T30D", date_range, theme)
+    children.append(_metric_chart_with_legend("Individual Plan - T30D", fig_30, names_30, theme, colors))
+
+    # --- Chart 2: Individual Plan - T300D (4 metrics, SUM all BCs) ---
+    metrics_300 = metrics_300_future.result()
+    fig_300, names_300 = build_chart_json(build_metric_line_chart, ("four_metrics_for_plan", *query, "main_300"), metrics_300, "Individual Plan - T300D", date_range, theme)
+    children.append(_metric_chart_with_legend("Individual Plan - T300D", fig_300, names_300, theme, colors))
+
+    # --- Chart 3: New Users by Plan ---
+    users_df = users_future.result()
+    fig_users, plans_users = build_chart_json(build_plan_line_chart, ("users_by_plan", *query), users_df, "New Users by Plan", "number", date_range, theme)
+    children.append(_chart_with_legend("New Users by Plan", fig_users, plans_users, theme, colors))
+
+    # --- Chart 4: Spend by Individual Plan ---
+    spend_df = spend_future.result()
+    fig_spend, plans_spend = build_chart_json(build_plan_line_chart, ("spend_by_plan_single", *query), spend_df, "Spend by Individual Plan", "dollar", date_range, theme)
+    children.append(_chart_with_legend("Spend by Individual Plan", fig_spend, plans_spend, theme, colors))
+
+    return html.Div(children)
+
+
+# =================================================================
+# TAB 3: MERGED PLANS - BREAKUP
+# =================================================================
+
+def _render_merged_breakup(app_name, start_date, end_date, plan_name, theme):
+    colors = get_theme_colors(theme)
+    date_range = (start_date, end_date)
+    query = (app_name, start_date, end_date, plan_name)
+    children = []
+
+    # --- Chart 1: Individual Plan - T30D (from VPU.15K_Main_Table) ---
+    metrics_30 = get_four_metrics_for_plan(app_name, start_date, end_date, plan_name, "vpu_main")
+    fig_30, names_30 = build_chart_json(build_metric_line_chart, ("four_metrics_for_plan", *query, "vpu_main"), metrics_30, "Individual Plan - T30D", date_range, theme)
+    children.append(_metric_chart_with_legend("Individual Plan - T30D", fig_30, names_30, theme, colors))
+
+    # --- Chart 2: Individual Plan - T300D (from VPU.15K_Main_Table_300) ---
+    metrics_300 = get_four_metrics_for_plan(app_name, start_date, end_date, plan_name, "vpu_main_300")
+    fig_300, names_300 = build_chart_json(build_metric_line_chart, ("four_metrics_for_plan", *query, "vpu_main_300"), metrics_300, "Individual Plan - T300D", date_range, theme)
+    children.append(_metric_chart_with_legend("Individual Plan - T300D", fig_300, names_300, theme, colors))
+
+    return html.Div(children)
+
+
+# =================================================================
+# TAB 4: ENTITY
+# =================================================================
+
+def _render_entity(app_name, start_date, end_date, theme):
+    colors = get_theme_colors(theme)
+    date_range = (start_date, end_date)
+    query = (app_name, start_date, end_date)
+    children = []
+
+    entity_future = _DATA_POOL.submit(get_entity_four_metrics, app_name, start_date, end_date)
+    rebill_future = _DATA_POOL.submit(get_rebill_contribution_all_bcs, app_name, start_date, end_date)
+
+    # --- Chart 1: Entity Level (4 metrics, SUM all BCs) ---
+    entity_metrics = entity_future.result()
+    fig_entity, names_entity = build_chart_json(build_metric_line_chart, ("entity_four_metrics", *query), entity_metrics, "Entity Level", date_range, theme)
+    children.append(_metric_chart_with_legend("Entity Level", fig_entity, names_entity, theme, colors))
+
+    # --- Charts 2-5: Rebill Value Contribution (BC1-BC4) ---
+    for bc_val, rebill_df in rebill_future.result().items():
+        title = f"Rebill Value Contribution (BC{bc_val})"
+        fig, plans = build_chart_json(build_stacked_area_chart, ("rebill_contribution", *query, bc_val), rebill_df, title, date_range, theme)
+        children.append(_chart_with_legend(title, fig, plans, theme, colors))
+
+    return html.Div(children)
+
+
+# =================================================================
+# HELPERS — chart + legend wrappers
+# =================================================================
+
+def _chart_with_legend(title, fig, plans, theme, colors):
+    """Wrap a plan-based chart with its color-coded legend"""
+    legend_content = html.Div()
+    if plans:
+        color_map = build_merged_color_map(plans)
+        legend_content = create_legend_component(plans, color_map, theme)
+
+    return dbc.Card([
+        dbc.CardBody([
+            html.H6(title, style={"color": colors["text_primary"], "marginBottom": "8px", "fontWeight": "600"}),
+            legend_content,
+            dcc.Graph(figure=fig, config={
+                'displayModeBar': True,
+                'displaylogo': False,
+                'modeBarButtonsToRemove': ['lasso2d', 'select2d'],
+                'scrollZoom': False
+            }),
+        ])
+    ], style={"background": colors["card_bg"], "border": f"1px solid {colors['border']}", "marginBottom": "16px"})
+
+
+def _metric_chart_with_legend(title, fig, metric_names, theme, colors):
+    """Wrap a metric-based chart (4-metric) with its color-coded legend"""
+    legend_div = _metric_legend(tuple(metric_names), theme)
+
+    return dbc.Card([
+        dbc.CardBody([
+            html.H6(title, style={"color": colors["text_primary"], "marginBottom": "8px", "fontWeight": "600"}),
+            legend_div,
+            dcc.Graph(figure=fig, config={
+                'displayModeBar': True,
+                'displaylogo': False,
+                'modeBarButtonsToRemove': ['lasso2d', 'select2d'],
+                'scrollZoom': False
+            }),
+        ])
+    ], style={"background": colors["card_bg"], "border": f"1px solid {colors['border']}", "marginBottom": "16px"})
+
+
+@lru_cache(maxsize=32)
+def _metric_legend(metric_names, theme):
+    """Legend strip for a 4-metric chart - CACHED per (metric_names, theme), shared across renders"""
+    if not metric_names:
+        return html.Div()
+    colors = get_theme_colors(theme)
+    legend_items = [
+        html.Span([
+            html.Span(className="metric-legend-dot", style={"backgroundColor": METRIC_COLORS.get(name, "#6B7280")}),
+            name
+        ], className="metric-legend-item")
+        for name in metric_names
+    ]
+    return html.Div(legend_items, style={
+        "background": colors["surface"], "border": f"1px solid {colors['border']}",
+        "borderRadius": "8px", "padding": "10px 16px", "marginBottom": "16px",
+        "maxHeight": "60px", "overflowY": "auto", "color": colors["text_primary"],
+        "display": "flex", "flexWrap": "wrap", "gap": "12px"
+    })
+
+
+def _missing_filters_alert(app_name, start_date, end_date):
+    if not app_name or not start_date or not end_date:
+        return dbc.Alert("Please select App Name and date range.", color="warning")
+    return None
+
+
 def register_callbacks(app):
     """Register all callbacks for the All Metrics Merged dashboard"""
 
@@ -44,24 +365,21 @@ def register_callbacks(app):
     # FILTER VISIBILITY — show/hide BC and Plan Name based on tab
     # =================================================================
 
-    @callback(
+    # Show BC dropdown only on All Plans tab, Plan Name only on Individual/Merged tabs
+    # (entity tab: neither)
+    clientside_callback(
+        """
+        function(active_tab) {
+            var bcStyle = {display: active_tab === "all-plans" ? "block" : "none"};
+            var showPlan = active_tab === "individual-plans" || active_tab === "merged-breakup";
+            return [bcStyle, {display: showPlan ? "block" : "none"}];
+        }
+        """,
         Output("merged-bc-filter-container", "style"),
         Output("merged-plan-filter-container", "style"),
         Input("merged-dashboard-tabs", "active_tab"),
         prevent_initial_call=True
     )
-    def toggle_filter_visibility(active_tab):
-        """Show BC dropdown only on All Plans tab, Plan Name only on Individual/Merged tabs"""
-        bc_style = {"display": "none"}
-        plan_style = {"display": "none"}
-
-        if active_tab == "all-plans":
-            bc_style = {"display": "block"}
-        elif active_tab in ("individual-plans", "merged-breakup"):
-            plan_style = {"display": "block"}
-        # entity tab: neither
-
-        return bc_style, plan_style
 
     # =================================================================
     # PLAN NAME DROPDOWN — populate based on App Name AND active tab
@@ -74,6 +392,11 @@ def register_callbacks(app):
         Input("merged-dashboard-tabs", "active_tab"),
     )
     def update_plan_dropdown(app_name, active_tab):
+        # Switching to a tab that hides the dropdown: leave it alone rather
+        # than resetting its value and re-firing the plan-based tab callbacks.
+        # It is repopulated on the way back into a plan tab.
+        if ctx.triggered_id == "merged-dashboard-tabs" and active_tab not in PLAN_FILTER_TABS:
+            return no_update, no_update
         if not app_name:
             return [], None
         # Tab 3 uses VPU (non-merged) plan names
@@ -86,249 +409,184 @@ def register_callbacks(app):
         return options, default
 
     # =================================================================
-    # MAIN TAB CONTENT RENDERER
+    # TAB CONTENT — one lazily rendered container per tab
     # =================================================================
+    # Switching tabs only flips container visibility on the client. Each tab
+    # renders when it is active and its filters differ from the ones it was
+    # last rendered with, so revisiting a tab and changing filters that
+    # belong to other tabs never re-run Python.
 
-    @callback(
-        Output("merged-tab-content", "children"),
+    clientside_callback(
+        """
+        function(active_tab) {
+            var tabs = ["all-plans", "individual-plans", "merged-breakup", "entity"];
+            return tabs.map(function(tab) {
+                return {display: tab === active_tab ? "block" : "none"};
+            });
+        }
+        """,
+        [Output(f"merged-tab-{tab_id}-content", "style") for tab_id in MERGED_TAB_IDS],
         Input("merged-dashboard-tabs", "active_tab"),
+    )
+
+    # Date pickers can emit several intermediate values per selection; only
+    # the pair that stays put for 250ms reaches the tab renderers
+    clientside_callback(
+        """
+        function(start_date, end_date) {
+            var pending = window._mergedDateTimer;
+            if (pending) {
+                clearTimeout(pending.id);
+                pending.resolve(window.dash_clientside.no_update);
+            }
+            return new Promise(function(resolve) {
+                var timer = {resolve: resolve};
+                timer.id = setTimeout(function() {
+                    window._mergedDateTimer = null;
+                    resolve([start_date, end_date]);
+                }, 250);
+                window._mergedDateTimer = timer;
+            });
+        }
+        """,
+        Output("merged-date-range", "data"),
         Input("merged-start-date", "date"),
         Input("merged-end-date", "date"),
+        prevent_initial_call=True
+    )
+
+    @callback(
+        Output("merged-plan-details-container", "children"),
+        Output("merged-plan-details-key", "data"),
+        Input("merged-dashboard-tabs", "active_tab"),
+        Input("merged-app-name", "value"),
+        State("merged-plan-details-key", "data"),
+        State("theme-store", "data"),
+    )
+    def render_plan_details(active_tab, app_name, rendered_key, theme):
+        if active_tab != "all-plans":
+            return no_update, no_update
+        theme = theme or "dark"
+        key = [app_name, theme]
+        if key == rendered_key:
+            return no_update, no_update
+        if not app_name:
+            return None, key
+        return _render_plan_details(app_name, theme), key
+
+    @callback(
+        Output("merged-all-plans-charts", "children"),
+        Output("merged-tab-all-plans-key", "data"),
+        Input("merged-dashboard-tabs", "active_tab"),
+        Input("merged-date-range", "data"),
         Input("merged-app-name", "value"),
         Input("merged-bc-dropdown", "value"),
-        Input("merged-plan-name", "value"),
+        State("merged-tab-all-plans-key", "data"),
         State("theme-store", "data"),
     )
-    def render_tab_content(active_tab, start_date, end_date, app_name, bc, plan_name, theme):
+    def render_all_plans_tab(active_tab, date_range, app_name, bc, rendered_key, theme):
+        if active_tab != "all-plans":
+            return no_update, no_update
         theme = theme or "dark"
+        start_date, end_date = date_range or (None, None)
+        key = [start_date, end_date, app_name, bc, theme]
+        if key == rendered_key:
+            return no_update, no_update
 
-        if not app_name or not start_date or not end_date:
-            return dbc.Alert("Please select App Name and date range.", color="warning")
+        alert = _missing_filters_alert(app_name, start_date, end_date)
+        if alert is not None:
+            return alert, key
 
         try:
             bc = int(bc) if bc is not None else 4
         except (ValueError, TypeError):
             bc = 4
+        # Only the BC changed: swap the two BC charts in place instead of
+        # re-sending (and re-drawing) the other six
+        if rendered_key and rendered_key[:3] == key[:3] and rendered_key[4] == theme:
+            return _patch_all_plans_bc_charts(app_name, start_date, end_date, bc, theme), key
+        children = _render_all_plans(app_name, start_date, end_date, bc, theme)
+        _schedule_prefetch(active_tab, app_name, start_date, end_date)
+        return children, key
 
-        if active_tab == "all-plans":
-            return _render_all_plans(app_name, start_date, end_date, bc, theme)
-        elif active_tab == "individual-plans":
-            if not plan_name:
-                return dbc.Alert("Please select a Plan Name.", color="warning")
-            return _render_individual_plans(app_name, start_date, end_date, plan_name, theme)
-        elif active_tab == "merged-breakup":
-            if not plan_name:
-                return dbc.Alert("Please select a Plan Name.", color="warning")
-            return _render_merged_breakup(app_name, start_date, end_date, plan_name, theme)
-        elif active_tab == "entity":
-            return _render_entity(app_name, start_date, end_date, theme)
-        else:
-            return html.Div()
-
-    # =================================================================
-    # TAB 1: ALL PLANS
-    # =================================================================
-
-    def _render_all_plans(app_name, start_date, end_date, bc, theme):
-        colors = get_theme_colors(theme)
-        date_range = (start_date, end_date)
-        children = []
-
-        # --- Chart 1: Plan Details Table ---
-        plan_df = get_plan_details(app_name)
-        if not plan_df.empty:
-            col_defs = [{"field": c, "sortable": True, "filter": True, "resizable": True} for c in plan_df.columns]
-            grid = dag.AgGrid(
-                rowData=plan_df.to_dict("records"),
-                columnDefs=col_defs,
-                defaultColDef={"flex": 1, "minWidth": 100},
-                dashGridOptions={
-                    "animateRows": True,
-                },
-                style={"height": "230px", "width": "100%"},
-                className="ag-theme-alpine-dark" if theme == "dark" else "ag-theme-alpine",
-            )
-            children.append(grid_section(
-                "Plan Details",
-                grid,
-                "merged-plan-details",
-                colors
-            ))
-        else:
-            children.append(dbc.Alert("No plan details found.", color="secondary"))
-
-        # --- Chart 2: Spend ($) by Individual Plan ---
-        spend_df = get_spend_by_plan(app_name, start_date, end_date)
-        fig_spend, plans_spend = build_plan_line_chart(spend_df, "Spend ($) by Individual Plan", "dollar", date_range, theme)
-        children.append(_chart_with_legend("Spend ($) by Individual Plan", fig_spend, plans_spend, theme))
-
-        # --- Chart 3: New Users by Individual Plan ---
-        users_df = get_users_by_plan(app_name, start_date, end_date)
-        fig_users, plans_users = build_plan_line_chart(users_df, "New Users by Individual Plan", "number", date_range, theme)
-        children.append(_chart_with_legend("New Users by Individual Plan", fig_users, plans_users, theme))
-
-        # --- Charts 4-6: Net ARPU, Net LTV, Recent CAC (SUM all BCs) ---
-        for metric, title, fmt in [
-            ("Net_ARPU_Discounted", "Net ARPU ($) by Individual Plan", "dollar"),
-            ("Net_LTV_Discounted", "Net LTV ($) by Individual Plan", "dollar"),
-            ("Recent_CAC", "Recent CAC ($) by Individual Plan", "dollar"),
-        ]:
-            df = get_metric_summed_all_bcs(app_name, start_date, end_date, metric, "main_30")
-            fig, plans = build_plan_line_chart(df, title, fmt, date_range, theme)
-            children.append(_chart_with_legend(title, fig, plans, theme))
-
-        # --- Chart 7: Gross Retention by Individual Plan (filtered by BC) ---
-        retention_df = get_metric_by_bc(app_name, start_date, end_date, "Retention_rate", bc, "main_30")
-        fig_ret, plans_ret = build_plan_line_chart(retention_df, "Gross Retention by Individual Plan", "percent", date_range, theme)
-        children.append(_chart_with_legend("Gross Retention by Individual Plan", fig_ret, plans_ret, theme))
-
-        # --- Chart 8: Refund by Individual Plan (filtered by BC) ---
-        refund_df = get_metric_by_bc(app_name, start_date, end_date, "Refund_ratio", bc, "main_30")
-        fig_ref, plans_ref = build_plan_line_chart(refund_df, "Refund by Individual Plan", "percent", date_range, theme)
-        children.append(_chart_with_legend("Refund by Individual Plan", fig_ref, plans_ref, theme))
-
-        return html.Div(children)
-
-    # =================================================================
-    # TAB 2: INDIVIDUAL PLANS
-    # =================================================================
-
-    def _render_individual_plans(app_name, start_date, end_date, plan_name, theme):
-        colors = get_theme_colors(theme)
-        date_range = (start_date, end_date)
-        children = []
-
-        # --- Chart 1: Individual Plan - T30D (4 metrics, SUM all BCs) ---
-        metrics_30 = get_four_metrics_for_plan(app_name, start_date, end_date, plan_name, "main_30")
-        fig_30, names_30 = build_metric_line_chart(metrics_30, "Individual Plan - T30D", date_range, theme)
-        children.append(_metric_chart_with_legend("Individual Plan - T30D", fig_30, names_30, theme))
-
-        # --- Chart 2: Individual Plan - T300D (4 metrics, SUM all BCs) ---
-        metrics_300 = get_four_metrics_for_plan(app_name, start_date, end_date, plan_name, "main_300")
-        fig_300, names_300 = build_metric_line_chart(metrics_300, "Individual Plan - T300D", date_range, theme)
-        children.append(_metric_chart_with_legend("Individual Plan - T300D", fig_300, names_300, theme))
-
-        # --- Chart 3: New Users by Plan ---
-        users_df = get_users_by_plan(app_name, start_date, end_date, plan_name)
-        fig_users, plans_users = build_plan_line_chart(users_df, "New Users by Plan", "number", date_range, theme)
-        children.append(_chart_with_legend("New Users by Plan", fig_users, plans_users, theme))
-
-        # --- Chart 4: Spend by Individual Plan ---
-        spend_df = get_spend_by_plan_single(app_name, start_date, end_date, plan_name)
-        fig_spend, plans_spend = build_plan_line_chart(spend_df, "Spend by Individual Plan", "dollar", date_range, theme)
-        children.append(_chart_with_legend("Spend by Individual Plan", fig_spend, plans_spend, theme))
-
-        return html.Div(children)
-
-    # =================================================================
-    # TAB 3: MERGED PLANS - BREAKUP
-    # =================================================================
-
-    def _render_merged_breakup(app_name, start_date, end_date, plan_name, theme):
-        colors = get_theme_colors(theme)
-        date_range = (start_date, end_date)
-        children = []
-
-        # --- Chart 1: Individual Plan - T30D (from VPU.15K_Main_Table) ---
-        metrics_30 = get_four_metrics_for_plan(app_name, start_date, end_date, plan_name, "vpu_main")
-        fig_30, names_30 = build_metric_line_chart(metrics_30, "Individual Plan - T30D", date_range, theme)
-        children.append(_metric_chart_with_legend("Individual Plan - T30D", fig_30, names_30, theme))
-
-        # --- Chart 2: Individual Plan - T300D (from VPU.15K_Main_Table_300) ---
-        metrics_300 = get_four_metrics_for_plan(app_name, start_date, end_date, plan_name, "vpu_main_300")
-        fig_300, names_300 = build_metric_line_chart(metrics_300, "Individual Plan - T300D", date_range, theme)
-        children.append(_metric_chart_with_legend("Individual Plan - T300D", fig_300, names_300, theme))
-
-        return html.Div(children)
-
-    # =================================================================
-    # TAB 4: ENTITY
-    # =================================================================
-
-    def _render_entity(app_name, start_date, end_date, theme):
-        colors = get_theme_colors(theme)
-        date_range = (start_date, end_date)
-        children = []
-
-        # --- Chart 1: Entity Level (4 metrics, SUM all BCs) ---
-        entity_metrics = get_entity_four_metrics(app_name, start_date, end_date)
-        fig_entity, names_entity = build_metric_line_chart(entity_metrics, "Entity Level", date_range, theme)
-        children.append(_metric_chart_with_legend("Entity Level", fig_entity, names_entity, theme))
-
-        # --- Charts 2-5: Rebill Value Contribution (BC1-BC4) ---
-        for bc_val in [1, 2, 3, 4]:
-            rebill_df = get_rebill_contribution(app_name, start_date, end_date, bc_val)
-            title = f"Rebill Value Contribution (BC{bc_val})"
-            fig, plans = build_stacked_area_chart(rebill_df, title, date_range, theme)
-            children.append(_chart_with_legend(title, fig, plans, theme))
-
-        return html.Div(children)
+    @callback(
+        Output("merged-tab-individual-plans-content", "children"),
+        Output("merged-tab-individual-plans-key", "data"),
+        Input("merged-dashboard-tabs", "active_tab"),
+        Input("merged-date-range", "data"),
+        Input("merged-app-name", "value"),
+        Input("merged-plan-name", "value"),
+        State("merged-tab-individual-plans-key", "data"),
+        State("theme-store", "data"),
+    )
+    def render_individual_plans_tab(active_tab, date_range, app_name, plan_name, rendered_key, theme):
+        if active_tab != "individual-plans":
+            return no_update, no_update
+        theme = theme or "dark"
+        start_date, end_date = date_range or (None, None)
+        key = [start_date, end_date, app_name, plan_name, theme]
+        if key == rendered_key:
+            return no_update, no_update
+
+        alert = _missing_filters_alert(app_name, start_date, end_date)
+        if alert is not None:
+            return alert, key
+        if not plan_name:
+            return dbc.Alert("Please select a Plan Name.", color="warning"), key
+        children = _render_individual_plans(app_name, start_date, end_date, plan_name, theme)
+        _schedule_prefetch(active_tab, app_name, start_date, end_date)
+        return children, key
 
-    # =================================================================
-    # HELPERS — chart + legend wrappers
-    # =================================================================
+    @callback(
+        Output("merged-tab-merged-breakup-content", "children"),
+        Output("merged-tab-merged-breakup-key", "data"),
+        Input("merged-dashboard-tabs", "active_tab"),
+        Input("merged-date-range", "data"),
+        Input("merged-app-name", "value"),
+        Input("merged-plan-name", "value"),
+        State("merged-tab-merged-breakup-key", "data"),
+        State("theme-store", "data"),
+    )
+    def render_merged_breakup_tab(active_tab, date_range, app_name, plan_name, rendered_key, theme):
+        if active_tab != "merged-breakup":
+            return no_update, no_update
+        theme = theme or "dark"
+        start_date, end_date = date_range or (None, None)
+        key = [start_date, end_date, app_name, plan_name, theme]
+        if key == rendered_key:
+            return no_update, no_update
+
+        alert = _missing_filters_alert(app_name, start_date, end_date)
+        if alert is not None:
+            return alert, key
+        if not plan_name:
+            return dbc.Alert("Please select a Plan Name.", color="warning"), key
+        children = _render_merged_breakup(app_name, start_date, end_date, plan_name, theme)
+        _schedule_prefetch(active_tab, app_name, start_date, end_date)
+        return children, key
 
-    def _chart_with_legend(title, fig, plans, theme):
-        """Wrap a plan-based chart with its color-coded legend"""
-        colors = get_theme_colors(theme)
-        legend_content = html.Div()
-        if plans:
-            color_map = build_merged_color_map(plans)
-            legend_content = create_legend_component(plans, color_map, theme)
-
-        return dbc.Card([
-            dbc.CardBody([
-                html.H6(title, style={"color": colors["text_primary"], "marginBottom": "8px", "fontWeight": "600"}),
-                legend_content,
-                dcc.Graph(figure=fig, config={
-                    'displayModeBar': True,
-                    'displaylogo': False,
-                    'modeBarButtonsToRemove': ['lasso2d', 'select2d'],
-                    'scrollZoom': False
-                }),
-            ])
-        ], style={"background": colors["card_bg"], "border": f"1px solid {colors['border']}", "marginBottom": "16px"})
-
-    def _metric_chart_with_legend(title, fig, metric_names, theme):
-        """Wrap a metric-based chart (4-metric) with its color-coded legend"""
-        from app.dashboards.all_metrics_merged.charts import METRIC_COLORS
-        colors = get_theme_colors(theme)
-
-        legend_items = []
-        for name in metric_names:
-            color = METRIC_COLORS.get(name, "#6B7280")
-            legend_items.append(
-                html.Span([
-                    html.Span(style={
-                        "width": "10px", "height": "10px", "borderRadius": "50%",
-                        "backgroundColor": color, "display": "inline-block", "marginRight": "6px"
-                    }),
-                    name
-                ], style={
-                    "display": "inline-flex", "alignItems": "center", "gap": "6px",
-                    "fontSize": "12px", "color": colors["text_primary"], "marginRight": "12px"
-                })
-            )
-
-        legend_div = html.Div(legend_items, style={
-            "background": colors["surface"], "border": f"1px solid {colors['border']}",
-            "borderRadius": "8px", "padding": "10px 16px", "marginBottom": "16px",
-            "maxHeight": "60px", "overflowY": "auto",
-            "display": "flex", "flexWrap": "wrap", "gap": "12px"
-        }) if legend_items else html.Div()
-
-        return dbc.Card([
-            dbc.CardBody([
-                html.H6(title, style={"color": colors["text_primary"], "marginBottom": "8px", "fontWeight": "600"}),
-                legend_div,
-                dcc.Graph(figure=fig, config={
-                    'displayModeBar': True,
-                    'displaylogo': False,
-                    'modeBarButtonsToRemove': ['lasso2d', 'select2d'],
-                    'scrollZoom': False
-                }),
-            ])
-        ], style={"background": colors["card_bg"], "border": f"1px solid {colors['border']}", "marginBottom": "16px"})
+    @callback(
+        Output("merged-tab-entity-content", "children"),
+        Output("merged-tab-entity-key", "data"),
+        Input("merged-dashboard-tabs", "active_tab"),
+        Input("merged-date-range", "data"),
+        Input("merged-app-name", "value"),
+        State("merged-tab-entity-key", "data"),
+        State("theme-store", "data"),
+    )
+    def render_entity_tab(active_tab, date_range, app_name, rendered_key, theme):
+        if active_tab != "entity":
+            return no_update, no_update
+        theme = theme or "dark"
+        start_date, end_date = date_range or (None, None)
+        key = [start_date, end_date, app_name, theme]
+        if key == rendered_key:
+            return no_update, no_update
+
+        alert = _missing_filters_alert(app_name, start_date, end_date)
+        if alert is not None:
+            return alert, key
+        return _render_entity(app_name, start_date, end_date, theme), key
 
     # =================================================================
     # DATEPICKER DARK THEME OVERRIDE (CSS injection approach)
@@ -12,8 +12,13 @@ Standards:
 - Tooltip = "{name}  {value}" (x-axis label shown by unified mode)
 """
 
+import json
+import threading
+from functools import lru_cache
+
 import plotly.graph_objects as go
 from app.theme import get_theme_colors
+from app.dashboards.all_metrics_merged.data import get_cache_version, on_cache_version_bump
 # Distinct palette for merged dashboard (visible on dark background)
 _MERGED_PALETTE = [
     # 15 fully distinct colors
@@ -48,13 +53,20 @@ _MERGED_PALETTE = [
 ]
 
 def build_merged_color_map(plan_names):
-    """Assign visually distinct colors to plans, deterministic by plan name only"""
+    """Assign visually distinct colors to plans, deterministic by plan name only - CACHED"""
+    # Copy so callers can't mutate the cached map
+    return dict(_merged_color_map_cached(tuple(plan_names)))
+
+
+@lru_cache(maxsize=1024)
+def _merged_color_map_cached(plan_names):
     color_map = {}
     for plan in plan_names:
         idx = hash(plan) % len(_MERGED_PALETTE)
         color_map[plan] = _MERGED_PALETTE[idx]
     return color_map
 
+
 LINE_WIDTH = 1.6
 LINE_OPACITY = 0.7
 
@@ -132,6 +144,14 @@ def _hover_text(name, format_type):
         return f'{name}  %{{y:,.0f}}<extra></extra>'
 
 
+def _rows_by_active_plan(data_df):
+    """{plan: its rows} from one groupby pass, for plans whose values don't sum to 0"""
+    return {
+        plan: pdf for plan, pdf in data_df.groupby("Plan_Name", observed=True)
+        if abs(pdf["value"].sum()) > 0
+    }
+
+
 # =============================================================================
 # 1. PLAN LINE CHART — one line per plan
 # =============================================================================
@@ -155,19 +175,17 @@ def build_plan_line_chart(data_df, display_name, format_type="dollar", date_rang
     if data_df is None or data_df.empty:
         return _empty_figure(colors), []
 
-    # Filter out plans with no meaningful data (all zeros/NaN) in date range
-    plan_sums = data_df.groupby("Plan_Name")["value"].sum()
-    active_plans = plan_sums[plan_sums.abs() > 0].index.tolist()
-    if not active_plans:
+    # Split rows per plan once, leaving out plans with no meaningful data (all zeros/NaN) in date range
+    by_plan = _rows_by_active_plan(data_df)
+    if not by_plan:
         return _empty_figure(colors), []
-    data_df = data_df[data_df["Plan_Name"].isin(active_plans)]
 
-    unique_plans = sorted(data_df["Plan_Name"].unique())
+    unique_plans = sorted(by_plan)
     color_map = build_merged_color_map(unique_plans)
 
     fig = go.Figure()
     for plan in unique_plans:
-        pdf = data_df[data_df["Plan_Name"] == plan].sort_values("Report_date")
+        pdf = by_plan[plan].sort_values("Report_date")
         fig.add_trace(go.Scatter(
             x=pdf["Report_date"], y=pdf["value"],
             mode="lines", name=plan,
@@ -261,19 +279,17 @@ def build_stacked_area_chart(data_df, display_name, date_range=None, theme="dark
     if data_df is None or data_df.empty:
         return _empty_figure(colors), []
 
-    # Filter out plans with no meaningful data (all zeros/NaN)
-    plan_sums = data_df.groupby("Plan_Name")["value"].sum()
-    active_plans = plan_sums[plan_sums.abs() > 0].index.tolist()
-    if not active_plans:
+    # Split rows per plan once, leaving out plans with no meaningful data (all zeros/NaN)
+    by_plan = _rows_by_active_plan(data_df)
+    if not by_plan:
         return _empty_figure(colors), []
-    data_df = data_df[data_df["Plan_Name"].isin(active_plans)]
 
-    unique_plans = sorted(data_df["Plan_Name"].unique())
+    unique_plans = sorted(by_plan)
     color_map = build_merged_color_map(unique_plans)
 
     fig = go.Figure()
     for plan in unique_plans:
-        pdf = data_df[data_df["Plan_Name"] == plan].sort_values("Report_date")
+        pdf = by_plan[plan].sort_values("Report_date")
         color = color_map.get(plan, "#6B7280")
 
         fig.add_trace(go.Scatter(
@@ -295,3 +311,43 @@ def build_stacked_area_chart(data_df, display_name, date_range=None, theme="dark
     layout["yaxis"]["range"] = [0, 100]
     fig.update_layout(**layout)
     return fig, unique_plans
+
+
+# =============================================================================
+# SERIALIZED FIGURE CACHE
+# =============================================================================
+# A chart is keyed by its builder, a data key naming the query that produced
+# its data, the remaining builder arguments and the merged tables version; the
+# cache is emptied whenever the tables reload. The cached figure is already
+# JSON-decoded into plain lists and strings, so the date encoding is paid once
+# instead of on every response. Every caller gets the same figure dict and
+# names list: treat them as read-only.
+
+_figure_cache = {}  # (builder name, data key, args, tables version) -> (figure dict, names)
+_figure_cache_lock = threading.Lock()  # renders build charts from the _DATA_POOL threads
+FIGURE_CACHE_MAX = 512
+
+
+@on_cache_version_bump
+def _clear_figure_cache():
+    with _figure_cache_lock:
+        _figure_cache.clear()
+
+
+def build_chart_json(builder, data_key, data, *args):
+    """Run a build_* chart function and return (figure as plain dict, names) - CACHED per data key.
+    data_key is a hashable description of the query behind data, e.g. ("spend_by_plan", app_name, start_date, end_date)
+    """
+    key = (builder.__name__, data_key, args, get_cache_version())
+    with _figure_cache_lock:
+        hit = _figure_cache.get(key)
+    if hit is not None:
+        return hit
+
+    fig, names = builder(data, *args)
+    result = (json.loads(fig.to_json()), names)
+    with _figure_cache_lock:
+        if len(_figure_cache) >= FIGURE_CACHE_MAX:
+            _figure_cache.pop(next(iter(_figure_cache)), None)
+        _figure_cache[key] = result
+    return result
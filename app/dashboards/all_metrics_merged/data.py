@@ -18,12 +18,15 @@ Tables:
 8. VPU.15K_Main_Table_300 - VPU 300D (non-merged)
 """
 
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 import logging
 
 from app.bigquery_client import (
-    get_gcs_bucket, load_parquet_from_gcs, save_parquet_to_gcs,
+    get_gcs_bucket, load_parquet_from_gcs, save_parquet_to_gcs, copy_gcs_blob,
     get_metadata_timestamp, set_metadata_timestamp, log_debug
 )
 
@@ -33,32 +36,45 @@ logger = logging.getLogger(__name__)
 # TABLE CONFIGURATION
 # =============================================================================
 
+# Metric columns read by the 4-metric charts
+FOUR_METRICS = ["ARPU_Discounted", "Net_ARPU_Discounted", "Recent_CAC", "Net_LTV_Discounted"]
+
+# "columns" lists what the charts read from a table; only those are loaded
+# into memory (GCS copies keep every column). Tables without it load whole.
 MERGED_TABLES = {
     "plan_list": {
         "bq": "variant-finance-data-project.VPU_Merged.Plan_List",
         "active": "merged_cache/plan_list_active.parquet",
         "staging": "merged_cache/plan_list_staging.parquet",
+        "columns": ["App_Name", "Product_Name_Final", "Trial_Type", "Trial_Period", "Trial_Price", "Regular_Price"],
     },
 
     "user_count": {
         "bq": "variant-finance-data-project.VPU_Merged.User_Count_by_Day",
         "active": "merged_cache/user_count_active.parquet",
         "staging": "merged_cache/user_count_staging.parquet",
+        "columns": ["App_Name", "Date_of_Sale", "Product_Name_Final", "Daily_Users"],
     },
     "main_30": {
         "bq": "variant-finance-data-project.VPU_Merged.15K_Main_Table_30",
         "active": "merged_cache/main_30_active.parquet",
         "staging": "merged_cache/main_30_staging.parquet",
+        "columns": [
+            "App_Name", "Report_date", "Product_Name_Final", "Billing_Cycle", "Allocated_Spend_Total",
+            "Retention_rate", "Refund_ratio", "Rebill_value",
+        ] + FOUR_METRICS,
     },
     "main_300": {
         "bq": "variant-finance-data-project.VPU_Merged.15K_Main_Table_300",
         "active": "merged_cache/main_300_active.parquet",
         "staging": "merged_cache/main_300_staging.parquet",
+        "columns": ["App_Name", "Report_date", "Product_Name_Final"] + FOUR_METRICS,
     },
     "entity": {
         "bq": "variant-finance-data-project.VPU_Merged.Entity_Level_Main_MP",
         "active": "merged_cache/entity_active.parquet",
         "staging": "merged_cache/entity_staging.parquet",
+        "columns": ["App_Name", "Report_date"] + FOUR_METRICS,
     },
     "main_mp": {
         "bq": "variant-finance-data-project.VPU.15K_Main_Table_MP",
@@ -69,11 +85,13 @@ MERGED_TABLES = {
         "bq": "variant-finance-data-project.VPU.15K_Main_Table",
         "active": "merged_cache/vpu_main_active.parquet",
         "staging": "merged_cache/vpu_main_staging.parquet",
+        "columns": ["App_Name", "Report_date", "Product_Name_Final"] + FOUR_METRICS,
     },
     "vpu_main_300": {
         "bq": "variant-finance-data-project.VPU.15K_Main_Table_300",
         "active": "merged_cache/vpu_main_300_active.parquet",
         "staging": "merged_cache/vpu_main_300_staging.parquet",
+        "columns": ["App_Name", "Report_date", "Product_Name_Final"] + FOUR_METRICS,
     },
 }
 
@@ -85,68 +103,313 @@ GCS_MERGED_GCS_REFRESH = "merged_cache/gcs_last_refresh.txt"
 # =============================================================================
 
 _merged_cache = {}  # key -> pandas DataFrame
+_merged_by_app = {}  # key -> {App_Name: DataFrame of that app's rows}
+_merged_rollup_by_app = {}  # key -> {App_Name: that app's rows summed per plan per day}
+
+# Bumped whenever _merged_cache is (re)filled. The memoized getters below key
+# on it and are cleared on every bump, so frames built from an old table
+# version are dropped instead of lingering until evicted. Their results are
+# shared between callers: treat returned frames and dicts as read-only.
+_cache_version = 0
+_version_listeners = []  # callables run on every bump (lru_cache.cache_clear etc.)
+
+
+def _bump_cache_version():
+    global _cache_version
+    _cache_version += 1
+    for clear in _version_listeners:
+        clear()
+
+
+def get_cache_version():
+    """Current merged tables version, for caches outside this module"""
+    return _cache_version
+
+
+def on_cache_version_bump(clear):
+    """Register a callable to run whenever the merged tables are reloaded"""
+    _version_listeners.append(clear)
+    return clear
+
+
+def _versioned_lru_cache(maxsize):
+    """lru_cache for getters keyed on _cache_version, cleared on every bump"""
+    def decorator(fn):
+        cached = lru_cache(maxsize=maxsize)(fn)
+        on_cache_version_bump(cached.cache_clear)
+        return cached
+    return decorator
+
+
+# Date column per table (tables not listed use Report_date when present)
+_DATE_COLUMNS = {"user_count": "Date_of_Sale"}
+
+# Narrower dtypes where that is lossless (integer counts/codes) or where the
+# values are only plotted, never summed (ratios). Summed money columns stay
+# float64: float32 keeps ~7 significant digits, which drops cents on totals.
+_INTEGER_COLUMNS = ["Daily_Users", "Billing_Cycle"]
+_FLOAT32_COLUMNS = ["Retention_rate", "Refund_ratio"]
+
+# Metrics the plan/date charts read summed across Billing_Cycle. At load each
+# table gets a daily rollup with these pre-summed per (App_Name,
+# Product_Name_Final, date), so those getters slice it instead of grouping
+# raw rows. BC-specific charts still read the raw table.
+_ROLLUP_METRICS = {
+    "main_30": ["Allocated_Spend_Total"] + FOUR_METRICS,
+    "main_300": FOUR_METRICS,
+    "user_count": ["Daily_Users"],
+    "entity": FOUR_METRICS,
+    "vpu_main": FOUR_METRICS,
+    "vpu_main_300": FOUR_METRICS,
+}
+
+
+def _arrow_to_pandas(arrow_table):
+    """Convert a freshly loaded Arrow table for caching (the table is unusable afterwards).
+
+    Columns are converted block by block with each Arrow buffer released as
+    it goes, roughly halving peak load memory, and App_Name is decoded
+    straight into a pandas categorical on the Arrow side. DATE columns come
+    out as datetime64 rather than Python date objects, so they need no
+    parsing afterwards.
+    """
+    categories = [col for col in ("App_Name",) if col in arrow_table.column_names]
+    return arrow_table.to_pandas(
+        categories=categories, date_as_object=False, split_blocks=True, self_destruct=True
+    )
+
+
+def _prepare_table(key, df):
+    """Normalize a freshly loaded table once so per-callback filters stay cheap.
+
+    Parses the date column to datetime64 (if it did not already load as one),
+    stores App_Name and Product_Name_Final as categoricals (integer-code
+    equality in filters, code-hashed groupbys), narrows count and ratio
+    columns, and sorts rows by app and date.
+    Product_Name_Final gets lexically sorted categories from pandas so that
+    sorting results by plan keeps its alphabetical order.
+    """
+    if df.empty:
+        return df
+    date_col = _DATE_COLUMNS.get(key, "Report_date")
+    if date_col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[date_col]):
+        df[date_col] = pd.to_datetime(df[date_col], errors="coerce")
+    if "Product_Name_Final" in df.columns:
+        df["Product_Name_Final"] = df["Product_Name_Final"].astype("category")
+    for col in _INTEGER_COLUMNS:
+        if col in df.columns:
+            # Only narrows if every value fits; columns with NaN stay float
+            df[col] = pd.to_numeric(df[col], downcast="integer")
+    for col in _FLOAT32_COLUMNS:
+        if col in df.columns and pd.api.types.is_float_dtype(df[col]):
+            df[col] = df[col].astype("float32")
+    if "App_Name" in df.columns:
+        df["App_Name"] = df["App_Name"].astype("category")
+        sort_cols = ["App_Name"] + ([date_col] if date_col in df.columns else [])
+        df = df.sort_values(sort_cols, kind="stable", ignore_index=True)
+    return df
+
+
+def _build_rollup(key, df):
+    """Sum a prepared table's _ROLLUP_METRICS per app, day and plan, split per app.
+
+    Rows come out sorted by date within each app (plan within date), the same
+    order _get_app_rows_in_range relies on for its binary search.
+    """
+    date_col = _DATE_COLUMNS.get(key, "Report_date")
+    metrics = [m for m in _ROLLUP_METRICS.get(key, []) if m in df.columns]
+    if df.empty or not metrics or "App_Name" not in df.columns or date_col not in df.columns:
+        return {}
+    keys = ["App_Name", date_col] + (["Product_Name_Final"] if "Product_Name_Final" in df.columns else [])
+    rollup = df.groupby(keys, as_index=False, observed=True)[metrics].sum()
+    return {
+        app: sub_df for app, sub_df in rollup.groupby("App_Name", sort=False, observed=True)
+    }
 
 
-def _get_df(key):
-    """Get cached DataFrame for a table key"""
-    df = _merged_cache.get(key)
+def _store_table(key, df):
+    """Cache a prepared table plus its per-app partitions and daily rollups (built once per load)"""
+    _merged_cache[key] = df
+    if df.empty or "App_Name" not in df.columns:
+        _merged_by_app[key] = {}
+    else:
+        _merged_by_app[key] = {
+            app: sub_df for app, sub_df in df.groupby("App_Name", sort=False, observed=True)
+        }
+    _merged_rollup_by_app[key] = _build_rollup(key, df)
+
+
+def _get_df(key, app_name=None):
+    """Get cached DataFrame for a table key, or just one app's rows"""
+    if app_name is not None:
+        df = _merged_by_app.get(key, {}).get(app_name)
+    else:
+        df = _merged_cache.get(key)
     if df is None:
         return pd.DataFrame()
     return df
 
 
+def _get_app_rows_in_range(key, app_name, start_date, end_date, date_col="Report_date"):
+    """One app's rows of a table within [start_date, end_date] (dates pre-parsed at load).
+
+    App partitions are sorted by the table's date column (NaT last), so the
+    range is a binary-searched positional slice rather than a boolean mask.
+    """
+    df = _get_df(key, app_name)
+    if df.empty:
+        return df
+    return _slice_date_range(key, df, start_date, end_date, date_col)
+
+
+def _get_rollup_rows_in_range(key, app_name, start_date, end_date):
+    """One app's daily rollup rows of a table within [start_date, end_date] (empty if none)"""
+    df = _merged_rollup_by_app.get(key, {}).get(app_name)
+    if df is None or df.empty:
+        return pd.DataFrame()
+    return _slice_date_range(key, df, start_date, end_date, _DATE_COLUMNS.get(key, "Report_date"))
+
+
+def _slice_date_range(key, df, start_date, end_date, date_col):
+    dates = df[date_col]
+    start, end = pd.Timestamp(start_date), pd.Timestamp(end_date)
+    if date_col != _DATE_COLUMNS.get(key, "Report_date"):
+        return df.loc[(dates >= start) & (dates <= end)]
+    lo = dates.searchsorted(start, side="left")
+    hi = dates.searchsorted(end, side="right")
+    return df.iloc[lo:hi]
+
+
 # =============================================================================
 # PRELOAD / REFRESH
 # =============================================================================
 
+def _warm_lookups():
+    """Build the layout/dropdown metadata and Plan Details grid records once per load"""
+    get_app_names()
+    get_date_range()
+    for app_name in _merged_by_app.get("main_30", {}):
+        get_plan_names_for_app(app_name)
+    for app_name in _merged_by_app.get("vpu_main", {}):
+        get_vpu_plan_names_for_app(app_name)
+    for app_name in _merged_by_app.get("plan_list", {}):
+        get_plan_details_records(app_name)
+
+
+# Tables are independent, so loads and refreshes run a few at a time. Each
+# in-flight table holds its parquet bytes, Arrow table and DataFrame at once,
+# which is what caps this below one worker per table.
+MERGED_IO_WORKERS = 4
+
+
+def _load_active_table(bucket, key, config):
+    """Load one table's active GCS cache as a prepared DataFrame (None if missing)"""
+    arrow_table = load_parquet_from_gcs(bucket, config["active"], columns=config.get("columns"))
+    if arrow_table is None:
+        return None
+    return _prepare_table(key, _arrow_to_pandas(arrow_table))
+
+
 def preload_merged_tables():
     """Load all 8 tables from GCS into memory at startup"""
     global _merged_cache
     bucket = get_gcs_bucket()
 
-    for key, config in MERGED_TABLES.items():
+    with ThreadPoolExecutor(max_workers=MERGED_IO_WORKERS) as pool:
+        futures = {
+            key: pool.submit(_load_active_table, bucket, key, config)
+            for key, config in MERGED_TABLES.items()
+        }
+        for key, future in futures.items():
+            try:
+                df = future.result()
+                if df is not None:
+                    _store_table(key, df)
+                    logger.info(f"  Merged [{key}]: {len(_merged_cache[key])} rows")
+                else:
+                    _store_table(key, pd.DataFrame())
+                    logger.warning(f"  Merged [{key}]: no GCS cache found")
+            except Exception as e:
+                _store_table(key, pd.DataFrame())
+                logger.warning(f"  Merged [{key}] load error: {e}")
+
+    _bump_cache_version()
+    _warm_lookups()
+
+
+# One BigQuery Storage Read client shared by every table refresh (gRPC
+# clients are thread-safe); None until first use or if unavailable
+_bqstorage = {"client": None}
+
+
+def _get_bqstorage_client():
+    """Shared BQ Storage Read API client, or None to fall back to the REST download"""
+    if _bqstorage["client"] is None:
         try:
-            arrow_table = load_parquet_from_gcs(bucket, config["active"])
-            if arrow_table is not None:
-                _merged_cache[key] = arrow_table.to_pandas()
-                logger.info(f"  Merged [{key}]: {len(_merged_cache[key])} rows")
-            else:
-                _merged_cache[key] = pd.DataFrame()
-                logger.warning(f"  Merged [{key}]: no GCS cache found")
+            from google.cloud import bigquery_storage
+            _bqstorage["client"] = bigquery_storage.BigQueryReadClient()
         except Exception as e:
-            _merged_cache[key] = pd.DataFrame()
-            logger.warning(f"  Merged [{key}] load error: {e}")
+            log_debug(f"BQ Storage API unavailable, using REST download: {e}")
+            return None
+    return _bqstorage["client"]
+
+
+def _refresh_table_to_staging(bucket, key, config):
+    """Query one table from BQ and save it to its GCS staging file"""
+    from google.cloud import bigquery
+    client = bigquery.Client()
+    log_debug(f"Refreshing merged [{key}] from BQ...")
+    query = f"SELECT * FROM `{config['bq']}`"
+    # Results stream as parallel Arrow record batches over the Storage Read API
+    bqstorage_client = _get_bqstorage_client()
+    arrow_table = client.query(query).to_arrow(
+        bqstorage_client=bqstorage_client, create_bqstorage_client=False
+    )
+    # Stored in the order _prepare_table sorts to, so loads find rows already in order
+    sort_by = ["App_Name", _DATE_COLUMNS.get(key, "Report_date")]
+    save_parquet_to_gcs(bucket, config["staging"], arrow_table, sort_by=sort_by)
+    log_debug(f"  {key}: {arrow_table.num_rows} rows saved to staging")
+    return key
 
 
 def refresh_merged_bq_to_staging(skip_keys=None):
     """Load tables from BQ and save to GCS staging. Optionally skip certain keys."""
     try:
-        from google.cloud import bigquery
-        client = bigquery.Client()
         bucket = get_gcs_bucket()
 
         if not bucket:
             return False, "GCS bucket not configured"
 
         skip_keys = skip_keys or []
-        loaded = []
+        tables = []
         for key, config in MERGED_TABLES.items():
             if key in skip_keys:
                 log_debug(f"Skipping merged [{key}]")
                 continue
-            log_debug(f"Refreshing merged [{key}] from BQ...")
-            query = f"SELECT * FROM `{config['bq']}`"
-            arrow_table = client.query(query).to_arrow()
-            save_parquet_to_gcs(bucket, config["staging"], arrow_table)
-            log_debug(f"  {key}: {arrow_table.num_rows} rows saved to staging")
-            loaded.append(key)
+            tables.append((key, config))
+        with ThreadPoolExecutor(max_workers=MERGED_IO_WORKERS) as pool:
+            loaded = list(pool.map(lambda item: _refresh_table_to_staging(bucket, *item), tables))
 
         set_metadata_timestamp(bucket, GCS_MERGED_BQ_REFRESH)
+        _invalidate_cache_info()
         return True, f"Merged BQ refresh complete ({len(loaded)} tables). Data saved to staging."
     except Exception as e:
         return False, f"Merged BQ refresh failed: {str(e)}"
 
 
+def _activate_staging_table(bucket, key, config):
+    """Copy one table's staging file to active and return it prepared (None if no staging file).
+
+    The staging download is what fills memory; active is a server-side copy
+    of the same file, so it is never re-uploaded.
+    """
+    arrow_table = load_parquet_from_gcs(bucket, config["staging"], columns=config.get("columns"))
+    if arrow_table is None:
+        return None
+    copy_gcs_blob(bucket, config["staging"], config["active"])
+    return _prepare_table(key, _arrow_to_pandas(arrow_table))
+
+
 def refresh_merged_gcs_from_staging(skip_keys=None):
     """Copy tables from staging to active GCS cache, reload into memory"""
     global _merged_cache
@@ -157,32 +420,56 @@ def refresh_merged_gcs_from_staging(skip_keys=None):
 
         skip_keys = skip_keys or []
         activated = []
-        for key, config in MERGED_TABLES.items():
-            if key in skip_keys:
-                continue
-            arrow_table = load_parquet_from_gcs(bucket, config["staging"])
-            if arrow_table is None:
-                continue
-            save_parquet_to_gcs(bucket, config["active"], arrow_table)
-            _merged_cache[key] = arrow_table.to_pandas()
-            log_debug(f"  Merged [{key}]: {arrow_table.num_rows} rows activated")
-            activated.append(key)
-
+        tables = [(key, config) for key, config in MERGED_TABLES.items() if key not in skip_keys]
+        with ThreadPoolExecutor(max_workers=MERGED_IO_WORKERS) as pool:
+            results = pool.map(lambda item: _activate_staging_table(bucket, *item), tables)
+            for (key, _), df in zip(tables, results):
+                if df is None:
+                    continue
+                _store_table(key, df)
+                log_debug(f"  Merged [{key}]: {len(_merged_cache[key])} rows activated")
+                activated.append(key)
+
+        _bump_cache_version()
+        _warm_lookups()
         set_metadata_timestamp(bucket, GCS_MERGED_GCS_REFRESH)
+        _invalidate_cache_info()
         return True, f"Merged GCS refresh complete ({len(activated)} tables activated)."
     except Exception as e:
         return False, f"Merged GCS refresh failed: {str(e)}"
 
 
+# Refresh timestamps shown on every render; the refreshes below drop the
+# cached copy, so the TTL only bounds staleness from other instances
+_cache_info = {"data": None, "loaded_at": None}
+MERGED_CACHE_INFO_TTL = 30  # seconds
+
+
+def _invalidate_cache_info():
+    _cache_info["data"] = None
+    _cache_info["loaded_at"] = None
+
+
 def get_merged_cache_info():
-    """Get refresh timestamps for the merged dashboard"""
+    """Get refresh timestamps for the merged dashboard - CACHED for MERGED_CACHE_INFO_TTL"""
+    loaded_at = _cache_info["loaded_at"]
+    if _cache_info["data"] is not None and loaded_at is not None:
+        if (datetime.now() - loaded_at).total_seconds() < MERGED_CACHE_INFO_TTL:
+            return _cache_info["data"]
+
     bucket = get_gcs_bucket()
-    bq_time = get_metadata_timestamp(bucket, GCS_MERGED_BQ_REFRESH)
-    gcs_time = get_metadata_timestamp(bucket, GCS_MERGED_GCS_REFRESH)
-    return {
+    # The two metadata reads are independent GCS round trips
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        bq_future = pool.submit(get_metadata_timestamp, bucket, GCS_MERGED_BQ_REFRESH)
+        gcs_future = pool.submit(get_metadata_timestamp, bucket, GCS_MERGED_GCS_REFRESH)
+        bq_time, gcs_time = bq_future.result(), gcs_future.result()
+    info = {
         "last_bq_refresh": bq_time.strftime("%d %b, %H:%M") if bq_time else "--",
         "last_gcs_refresh": gcs_time.strftime("%d %b, %H:%M") if gcs_time else "--",
     }
+    _cache_info["data"] = info
+    _cache_info["loaded_at"] = datetime.now()
+    return info
 
 
 # =============================================================================
@@ -190,25 +477,30 @@ def get_merged_cache_info():
 # =============================================================================
 
 def get_app_names():
-    """Get unique App_Name values across main tables"""
+    """Get unique App_Name values across main tables (the keys of their app partitions)"""
+    return list(_app_names_cached(_cache_version))
+
+
+@_versioned_lru_cache(maxsize=4)
+def _app_names_cached(cache_version):
     apps = set()
     for key in ["main_30", "plan_list", "user_count"]:
-        df = _get_df(key)
-        if not df.empty and "App_Name" in df.columns:
-            apps.update(df["App_Name"].dropna().unique())
-    return sorted(apps)
+        apps.update(_merged_by_app.get(key, {}))
+    return tuple(sorted(apps))
 
 
 def get_plan_names_for_app(app_name, table_key="main_30"):
     """Get unique Product_Name_Final values for a given app"""
-    df = _get_df(table_key)
-    if df.empty:
-        return []
+    return list(_plan_names_cached(app_name, table_key, _cache_version))
+
+
+@_versioned_lru_cache(maxsize=256)
+def _plan_names_cached(app_name, table_key, cache_version):
+    df = _get_df(table_key, app_name)
     col = "Product_Name_Final"
-    if col not in df.columns:
-        return []
-    filtered = df[df["App_Name"] == app_name]
-    return sorted(filtered[col].dropna().unique().tolist())
+    if df.empty or col not in df.columns:
+        return ()
+    return tuple(sorted(df[col].dropna().unique().tolist()))
 
 
 def get_vpu_plan_names_for_app(app_name):
@@ -217,7 +509,12 @@ def get_vpu_plan_names_for_app(app_name):
 
 
 def get_date_range():
-    """Get min/max dates across all date-bearing tables"""
+    """Get min/max dates across all date-bearing tables (date columns are parsed at load)"""
+    return _date_range_cached(_cache_version)
+
+
+@_versioned_lru_cache(maxsize=4)
+def _date_range_cached(cache_version):
     all_dates = []
     date_col_map = {
         "main_30": "Report_date",
@@ -226,8 +523,8 @@ def get_date_range():
     for key, col in date_col_map.items():
         df = _get_df(key)
         if not df.empty and col in df.columns:
-            dates = pd.to_datetime(df[col], errors="coerce").dropna()
-            if not dates.empty:
+            dates = df[col]
+            if dates.notna().any():
                 all_dates.append(dates.min())
                 all_dates.append(dates.max())
     if not all_dates:
@@ -241,130 +538,164 @@ def get_date_range():
 
 def get_plan_details(app_name):
     """Tab 1 Chart 1: Plan details table filtered by App_Name"""
-    df = _get_df("plan_list")
-    if df.empty:
+    return _plan_details_cached(app_name, _cache_version)
+
+
+@_versioned_lru_cache(maxsize=256)
+def _plan_details_cached(app_name, cache_version):
+    filtered = _get_df("plan_list", app_name)
+    if filtered.empty:
         return pd.DataFrame()
-    filtered = df[df["App_Name"] == app_name].copy()
     cols = ["Product_Name_Final", "Trial_Type", "Trial_Period", "Trial_Price", "Regular_Price"]
     return filtered[[c for c in cols if c in filtered.columns]].drop_duplicates().sort_values("Product_Name_Final")
 
 
+def get_plan_details_records(app_name):
+    """Plan details as AG Grid rowData records"""
+    return _plan_details_records_cached(app_name, _cache_version)
+
+
+@_versioned_lru_cache(maxsize=256)
+def _plan_details_records_cached(app_name, cache_version):
+    return _plan_details_cached(app_name, cache_version).to_dict("records")
+
+
 def get_spend_by_plan(app_name, start_date, end_date):
     """Tab 1 Chart 2: SUM(Allocated_Spend_Total) per Product_Name_Final per Report_date"""
-    df = _get_df("main_30")
-    if df.empty:
-        return pd.DataFrame()
-    df = df.copy()
-    df["Report_date"] = pd.to_datetime(df["Report_date"], errors="coerce")
-    mask = (
-        (df["App_Name"] == app_name) &
-        (df["Report_date"] >= pd.Timestamp(start_date)) &
-        (df["Report_date"] <= pd.Timestamp(end_date))
-    )
-    filtered = df.loc[mask]
-    if filtered.empty:
-        return pd.DataFrame()
-    grouped = filtered.groupby(["Product_Name_Final", "Report_date"], as_index=False)["Allocated_Spend_Total"].sum()
-    grouped.rename(columns={"Product_Name_Final": "Plan_Name", "Allocated_Spend_Total": "value"}, inplace=True)
-    return grouped.sort_values(["Plan_Name", "Report_date"])
+    return _spend_by_plan_cached(app_name, start_date, end_date, _cache_version)
+
+
+@_versioned_lru_cache(maxsize=256)
+def _spend_by_plan_cached(app_name, start_date, end_date, cache_version):
+    return _get_main_table_summed("main_30", app_name, start_date, end_date, "Allocated_Spend_Total")
 
 
 def get_users_by_plan(app_name, start_date, end_date, plan_name=None):
     """Tab 1 Chart 3 / Tab 2 Chart 3: SUM(Daily_Users) per Product_Name_Final per Date"""
-    df = _get_df("user_count")
-    if df.empty:
-        return pd.DataFrame()
-    df = df.copy()
-    df["Date_of_Sale"] = pd.to_datetime(df["Date_of_Sale"], errors="coerce")
-    mask = (
-        (df["App_Name"] == app_name) &
-        (df["Date_of_Sale"] >= pd.Timestamp(start_date)) &
-        (df["Date_of_Sale"] <= pd.Timestamp(end_date))
-    )
-    if plan_name:
-        mask = mask & (df["Product_Name_Final"] == plan_name)
-    filtered = df.loc[mask]
-    if filtered.empty:
-        return pd.DataFrame()
-    grouped = filtered.groupby(["Product_Name_Final", "Date_of_Sale"], as_index=False)["Daily_Users"].sum()
-    grouped.rename(columns={"Product_Name_Final": "Plan_Name", "Date_of_Sale": "Report_date", "Daily_Users": "value"}, inplace=True)
-    return grouped.sort_values(["Plan_Name", "Report_date"])
+    return _users_by_plan_cached(app_name, start_date, end_date, plan_name, _cache_version)
+
+
+@_versioned_lru_cache(maxsize=256)
+def _users_by_plan_cached(app_name, start_date, end_date, plan_name, cache_version):
+    return _get_main_table_summed("user_count", app_name, start_date, end_date, "Daily_Users", plan_name)
 
 
 def get_spend_by_plan_single(app_name, start_date, end_date, plan_name):
     """Tab 2 Chart 4: Spend for a single plan"""
-    df = _get_df("main_30")
-    if df.empty:
-        return pd.DataFrame()
-    df = df.copy()
-    df["Report_date"] = pd.to_datetime(df["Report_date"], errors="coerce")
-    mask = (
-        (df["App_Name"] == app_name) &
-        (df["Report_date"] >= pd.Timestamp(start_date)) &
-        (df["Report_date"] <= pd.Timestamp(end_date)) &
-        (df["Product_Name_Final"] == plan_name)
-    )
-    filtered = df.loc[mask]
-    if filtered.empty:
+    return _spend_by_plan_single_cached(app_name, start_date, end_date, plan_name, _cache_version)
+
+
+@_versioned_lru_cache(maxsize=256)
+def _spend_by_plan_single_cached(app_name, start_date, end_date, plan_name, cache_version):
+    return _get_main_table_summed("main_30", app_name, start_date, end_date, "Allocated_Spend_Total", plan_name)
+
+
+def _get_plan_date_sums(table_key, app_name, start_date, end_date, metrics, plan_name=None):
+    """SUM(metrics) across all BCs per Plan+Date, read from the table's daily rollup.
+    Metrics outside _ROLLUP_METRICS are grouped from the raw rows instead.
+    Returns DataFrame(Plan_Name, Report_date, *metrics) sorted by plan and date.
+    """
+    date_col = _DATE_COLUMNS.get(table_key, "Report_date")
+    summed = _get_rollup_rows_in_range(table_key, app_name, start_date, end_date)
+    if not set(metrics).issubset(summed.columns):
+        summed = _get_app_rows_in_range(table_key, app_name, start_date, end_date, date_col)
+        if not summed.empty:
+            summed = summed.groupby(["Product_Name_Final", date_col], as_index=False, observed=True)[list(metrics)].sum()
+    if plan_name and not summed.empty:
+        summed = summed.loc[summed["Product_Name_Final"] == plan_name]
+    if summed.empty:
         return pd.DataFrame()
-    grouped = filtered.groupby(["Product_Name_Final", "Report_date"], as_index=False)["Allocated_Spend_Total"].sum()
-    grouped.rename(columns={"Product_Name_Final": "Plan_Name", "Allocated_Spend_Total": "value"}, inplace=True)
-    return grouped.sort_values(["Plan_Name", "Report_date"])
+    result = summed[["Product_Name_Final", date_col, *metrics]]
+    result.columns = ["Plan_Name", "Report_date", *metrics]
+    return result.sort_values(["Plan_Name", "Report_date"])
 
 
 def _get_main_table_summed(table_key, app_name, start_date, end_date, metric, plan_name=None):
     """Generic: SUM(metric) across all BCs, grouped by Plan+Date. For charts 4-6 in Tab 1, etc."""
-    df = _get_df(table_key)
-    if df.empty:
-        return pd.DataFrame()
-    df = df.copy()
-    df["Report_date"] = pd.to_datetime(df["Report_date"], errors="coerce")
-    mask = (
-        (df["App_Name"] == app_name) &
-        (df["Report_date"] >= pd.Timestamp(start_date)) &
-        (df["Report_date"] <= pd.Timestamp(end_date))
-    )
-    if plan_name:
-        mask = mask & (df["Product_Name_Final"] == plan_name)
-    filtered = df.loc[mask]
-    if filtered.empty:
-        return pd.DataFrame()
-    grouped = filtered.groupby(["Product_Name_Final", "Report_date"], as_index=False)[metric].sum()
-    grouped.rename(columns={"Product_Name_Final": "Plan_Name", metric: "value"}, inplace=True)
-    return grouped.sort_values(["Plan_Name", "Report_date"])
+    summed = _get_plan_date_sums(table_key, app_name, start_date, end_date, [metric], plan_name)
+    if summed.empty:
+        return summed
+    summed.columns = ["Plan_Name", "Report_date", "value"]
+    return summed
 
 
 def get_metric_summed_all_bcs(app_name, start_date, end_date, metric, table_key="main_30"):
     """Tab 1 Charts 4-6: SUM(metric) across BCs per plan per date"""
+    return _metric_summed_all_bcs_cached(app_name, start_date, end_date, metric, table_key, _cache_version)
+
+
+@_versioned_lru_cache(maxsize=256)
+def _metric_summed_all_bcs_cached(app_name, start_date, end_date, metric, table_key, cache_version):
     return _get_main_table_summed(table_key, app_name, start_date, end_date, metric)
 
 
+def get_metrics_summed_all_bcs(app_name, start_date, end_date, metrics, table_key="main_30"):
+    """Tab 1 Charts 4-6 in one pass: SUM(metric) across BCs per plan per date for each metric.
+    Returns dict: {metric: DataFrame(Plan_Name, Report_date, value)}
+    """
+    return _metrics_summed_all_bcs_cached(app_name, start_date, end_date, tuple(metrics), table_key, _cache_version)
+
+
+@_versioned_lru_cache(maxsize=256)
+def _metrics_summed_all_bcs_cached(app_name, start_date, end_date, metrics, table_key, cache_version):
+    grouped = _get_plan_date_sums(table_key, app_name, start_date, end_date, metrics)
+    if grouped.empty:
+        return {metric: pd.DataFrame() for metric in metrics}
+    return {
+        metric: grouped[["Plan_Name", "Report_date", metric]].rename(columns={metric: "value"})
+        for metric in metrics
+    }
+
+
 def get_metric_by_bc(app_name, start_date, end_date, metric, bc, table_key="main_30"):
     """Tab 1 Charts 7-8: metric per plan per date, filtered to specific BC"""
-    df = _get_df(table_key)
-    if df.empty:
-        return pd.DataFrame()
-    df = df.copy()
-    df["Report_date"] = pd.to_datetime(df["Report_date"], errors="coerce")
-    mask = (
-        (df["App_Name"] == app_name) &
-        (df["Report_date"] >= pd.Timestamp(start_date)) &
-        (df["Report_date"] <= pd.Timestamp(end_date)) &
-        (df["Billing_Cycle"] == bc)
-    )
-    filtered = df.loc[mask]
+    return _metric_by_bc_cached(app_name, start_date, end_date, metric, bc, table_key, _cache_version)
+
+
+@_versioned_lru_cache(maxsize=256)
+def _metric_by_bc_cached(app_name, start_date, end_date, metric, bc, table_key, cache_version):
+    filtered = _get_app_rows_in_range(table_key, app_name, start_date, end_date)
     if filtered.empty:
         return pd.DataFrame()
-    result = filtered[["Product_Name_Final", "Report_date", metric]].copy()
-    result.rename(columns={"Product_Name_Final": "Plan_Name", metric: "value"}, inplace=True)
+    # Take the BC rows and the three output columns in one step, so the
+    # table's other columns are never copied
+    result = filtered.loc[filtered["Billing_Cycle"] == bc, ["Product_Name_Final", "Report_date", metric]]
+    if result.empty:
+        return pd.DataFrame()
+    result.columns = ["Plan_Name", "Report_date", "value"]
     return result.sort_values(["Plan_Name", "Report_date"])
 
 
+def get_metrics_by_bc(app_name, start_date, end_date, metrics, bc, table_key="main_30"):
+    """Tab 1 Charts 7-8 in one pass: each metric per plan per date, filtered to specific BC.
+    Returns dict: {metric: DataFrame(Plan_Name, Report_date, value)}
+    """
+    return _metrics_by_bc_cached(app_name, start_date, end_date, tuple(metrics), bc, table_key, _cache_version)
+
+
+@_versioned_lru_cache(maxsize=256)
+def _metrics_by_bc_cached(app_name, start_date, end_date, metrics, bc, table_key, cache_version):
+    filtered = _get_app_rows_in_range(table_key, app_name, start_date, end_date)
+    if filtered.empty:
+        return {metric: pd.DataFrame() for metric in metrics}
+    # Same single take as get_metric_by_bc, with every requested metric
+    result = filtered.loc[filtered["Billing_Cycle"] == bc, ["Product_Name_Final", "Report_date", *metrics]]
+    if result.empty:
+        return {metric: pd.DataFrame() for metric in metrics}
+    result.columns = ["Plan_Name", "Report_date", *metrics]
+    result = result.sort_values(["Plan_Name", "Report_date"])
+    by_metric = {}
+    for metric in metrics:
+        metric_df = result[["Plan_Name", "Report_date", metric]]
+        metric_df.columns = ["Plan_Name", "Report_date", "value"]
+        by_metric[metric] = metric_df
+    return by_metric
+
+
 # =============================================================================
 # TAB 2 & 3: INDIVIDUAL / MERGED PLANS — 4-METRIC CHARTS
 # =============================================================================
 
-FOUR_METRICS = ["ARPU_Discounted", "Net_ARPU_Discounted", "Recent_CAC", "Net_LTV_Discounted"]
 FOUR_METRICS_DISPLAY = {
     "ARPU_Discounted": "Gross ARPU",
     "Net_ARPU_Discounted": "Net ARPU",
@@ -373,34 +704,37 @@ FOUR_METRICS_DISPLAY = {
 }
 
 
+def _four_metrics_by_date(daily):
+    """Split daily rollup rows (one per Report_date, date-sorted) into one frame per FOUR_METRICS.
+    Returns dict: {metric_display_name: DataFrame(Report_date, value)}
+    """
+    metrics = [metric for metric in FOUR_METRICS if metric in daily.columns]
+    if not metrics:
+        return {}
+    grouped = daily.reset_index(drop=True)
+    result = {}
+    for metric in metrics:
+        metric_df = grouped[["Report_date", metric]]
+        metric_df.columns = ["Report_date", "value"]
+        result[FOUR_METRICS_DISPLAY[metric]] = metric_df
+    return result
+
+
 def get_four_metrics_for_plan(app_name, start_date, end_date, plan_name, table_key="main_30"):
     """Tab 2/3 Charts 1-2: 4 metrics SUM across BCs for a single plan.
     Returns dict: {metric_display_name: DataFrame(Report_date, value)}
     """
-    df = _get_df(table_key)
-    if df.empty:
-        return {}
-    df = df.copy()
-    df["Report_date"] = pd.to_datetime(df["Report_date"], errors="coerce")
-    mask = (
-        (df["App_Name"] == app_name) &
-        (df["Report_date"] >= pd.Timestamp(start_date)) &
-        (df["Report_date"] <= pd.Timestamp(end_date)) &
-        (df["Product_Name_Final"] == plan_name)
-    )
-    filtered = df.loc[mask]
+    return _four_metrics_for_plan_cached(app_name, start_date, end_date, plan_name, table_key, _cache_version)
+
+
+@_versioned_lru_cache(maxsize=256)
+def _four_metrics_for_plan_cached(app_name, start_date, end_date, plan_name, table_key, cache_version):
+    filtered = _get_rollup_rows_in_range(table_key, app_name, start_date, end_date)
+    if not filtered.empty:
+        filtered = filtered.loc[filtered["Product_Name_Final"] == plan_name]
     if filtered.empty:
         return {}
-
-    result = {}
-    for metric in FOUR_METRICS:
-        if metric not in filtered.columns:
-            continue
-        grouped = filtered.groupby("Report_date", as_index=False)[metric].sum()
-        grouped.rename(columns={metric: "value"}, inplace=True)
-        grouped = grouped.sort_values("Report_date")
-        result[FOUR_METRICS_DISPLAY[metric]] = grouped
-    return result
+    return _four_metrics_by_date(filtered)
 
 
 # =============================================================================
@@ -411,55 +745,43 @@ def get_entity_four_metrics(app_name, start_date, end_date):
     """Tab 4 Chart 1: 4 metrics SUM across BCs at entity level.
     Returns dict: {metric_display_name: DataFrame(Report_date, value)}
     """
-    df = _get_df("entity")
-    if df.empty:
-        return {}
-    df = df.copy()
-    df["Report_date"] = pd.to_datetime(df["Report_date"], errors="coerce")
-    mask = (
-        (df["App_Name"] == app_name) &
-        (df["Report_date"] >= pd.Timestamp(start_date)) &
-        (df["Report_date"] <= pd.Timestamp(end_date))
-    )
-    filtered = df.loc[mask]
+    return _entity_four_metrics_cached(app_name, start_date, end_date, _cache_version)
+
+
+@_versioned_lru_cache(maxsize=256)
+def _entity_four_metrics_cached(app_name, start_date, end_date, cache_version):
+    filtered = _get_rollup_rows_in_range("entity", app_name, start_date, end_date)
     if filtered.empty:
         return {}
+    return _four_metrics_by_date(filtered)
 
-    result = {}
-    for metric in FOUR_METRICS:
-        if metric not in filtered.columns:
-            continue
-        grouped = filtered.groupby("Report_date", as_index=False)[metric].sum()
-        grouped.rename(columns={metric: "value"}, inplace=True)
-        grouped = grouped.sort_values("Report_date")
-        result[FOUR_METRICS_DISPLAY[metric]] = grouped
-    return result
+
+def _share_of_total(values, totals):
+    """values / totals as floats, 0 where the total is 0 (one pass, no NaN round-trip)"""
+    values = values.to_numpy(dtype="float64")
+    totals = totals.to_numpy(dtype="float64")
+    return np.divide(values, totals, out=np.zeros_like(values), where=totals != 0)
 
 
 def get_rebill_contribution(app_name, start_date, end_date, bc):
     """Tab 4 Charts 2-5: Rebill_value per plan as % of total, for a specific BC.
     Returns DataFrame with columns: Plan_Name, Report_date, value (0-1 fraction), raw_value
     """
-    df = _get_df("main_30")
-    if df.empty:
-        return pd.DataFrame()
-    df = df.copy()
-    df["Report_date"] = pd.to_datetime(df["Report_date"], errors="coerce")
-    mask = (
-        (df["App_Name"] == app_name) &
-        (df["Report_date"] >= pd.Timestamp(start_date)) &
-        (df["Report_date"] <= pd.Timestamp(end_date)) &
-        (df["Billing_Cycle"] == bc)
-    )
-    filtered = df.loc[mask]
+    return _rebill_contribution_cached(app_name, start_date, end_date, bc, _cache_version)
+
+
+@_versioned_lru_cache(maxsize=256)
+def _rebill_contribution_cached(app_name, start_date, end_date, bc, cache_version):
+    filtered = _get_app_rows_in_range("main_30", app_name, start_date, end_date)
+    if not filtered.empty:
+        filtered = filtered.loc[filtered["Billing_Cycle"] == bc]
     if filtered.empty:
         return pd.DataFrame()
 
-    grouped = filtered.groupby(["Product_Name_Final", "Report_date"], as_index=False)["Rebill_value"].sum()
+    grouped = filtered.groupby(["Product_Name_Final", "Report_date"], as_index=False, observed=True)["Rebill_value"].sum()
     # Compute total per date
     date_totals = grouped.groupby("Report_date")["Rebill_value"].transform("sum")
-    grouped["pct"] = grouped["Rebill_value"] / date_totals.replace(0, float("nan"))
-    grouped["pct"] = grouped["pct"].fillna(0)
+    grouped["pct"] = _share_of_total(grouped["Rebill_value"], date_totals)
 
     result = grouped.rename(columns={
         "Product_Name_Final": "Plan_Name",
@@ -467,3 +789,38 @@ def get_rebill_contribution(app_name, start_date, end_date, bc):
         "pct": "value"
     })
     return result.sort_values(["Plan_Name", "Report_date"])
+
+
+def get_rebill_contribution_all_bcs(app_name, start_date, end_date, bcs=(1, 2, 3, 4)):
+    """Tab 4 Charts 2-5 in one pass: get_rebill_contribution for each BC.
+    Returns dict: {bc: DataFrame(Plan_Name, Report_date, value, raw_value)}
+    """
+    return _rebill_contribution_all_bcs_cached(app_name, start_date, end_date, tuple(bcs), _cache_version)
+
+
+@_versioned_lru_cache(maxsize=256)
+def _rebill_contribution_all_bcs_cached(app_name, start_date, end_date, bcs, cache_version):
+    result = {bc: pd.DataFrame() for bc in bcs}
+    filtered = _get_app_rows_in_range("main_30", app_name, start_date, end_date)
+    if not filtered.empty:
+        filtered = filtered.loc[filtered["Billing_Cycle"].isin(bcs)]
+    if filtered.empty:
+        return result
+
+    grouped = filtered.groupby(["Billing_Cycle", "Product_Name_Final", "Report_date"], as_index=False, observed=True)["Rebill_value"].sum()
+    # Compute total per BC per date
+    date_totals = grouped.groupby(["Billing_Cycle", "Report_date"])["Rebill_value"].transform("sum")
+    grouped["pct"] = _share_of_total(grouped["Rebill_value"], date_totals)
+
+    grouped = grouped.rename(columns={
+        "Product_Name_Final": "Plan_Name",
+        "Rebill_value": "raw_value",
+        "pct": "value"
+    })
+    for bc, bc_df in grouped.groupby("Billing_Cycle", sort=False):
+        result[bc] = (
+            bc_df.drop(columns="Billing_Cycle")
+            .sort_values(["Plan_Name", "Report_date"])
+            .reset_index(drop=True)
+        )
+    return result
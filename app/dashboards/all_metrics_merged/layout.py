@@ -7,6 +7,7 @@ Tab-specific filters vary per tab
 """
 
 from datetime import date, timedelta
+from functools import lru_cache
 from dash import html, dcc
 import dash_bootstrap_components as dbc
 import dash_ag_grid as dag
@@ -15,6 +16,32 @@ from app.theme import get_theme_colors
 from app.dashboards.all_metrics_merged.data import get_app_names, get_date_range, get_merged_cache_info
 
 
+MERGED_TAB_IDS = ("all-plans", "individual-plans", "merged-breakup", "entity")
+
+# Option lists are shared across renders (Dash only reads them)
+BC_OPTIONS = [{"label": str(i), "value": i} for i in range(5)]
+
+
+@lru_cache(maxsize=8)
+def _app_options(app_names):
+    """App Name select options for a tuple of app names - CACHED (treat as read-only)"""
+    return [{"label": a, "value": a} for a in app_names]
+
+
+@lru_cache(maxsize=8)
+def _filter_label_style(theme, margin_top=None):
+    """Filter title style per theme - CACHED (treat as read-only)"""
+    style = {"color": get_theme_colors(theme)["text_secondary"], "fontSize": "12px", "marginBottom": "4px"}
+    if margin_top:
+        style["marginTop"] = margin_top
+    return style
+
+
+def _filter_label(text, theme, margin_top=None):
+    """Small title above a filter control"""
+    return html.Div(text, className="filter-title", style=_filter_label_style(theme, margin_top))
+
+
 def create_merged_layout(user, theme="dark"):
     """Main layout for All Metrics Merged dashboard"""
     colors = get_theme_colors(theme)
@@ -30,6 +57,7 @@ def create_merged_layout(user, theme="dark"):
     default_app = app_names[0] if app_names else "CT-JP"
 
     merged_cache_info = get_merged_cache_info()
+    default_start = max_date - timedelta(days=90)
 
     return html.Div([
         # Header - Back left, Title center, Logout right
@@ -65,7 +93,10 @@ def create_merged_layout(user, theme="dark"):
             html.Small(f"  Last: {merged_cache_info.get('last_bq_refresh', '--')}  ", style={"color": colors["text_secondary"], "margin": "0 16px 0 8px"}),
             dbc.Button("Refresh GCS", id="refresh-gcs-btn", size="sm", className="refresh-btn-green"),
             html.Small(f"  Last: {merged_cache_info.get('last_gcs_refresh', '--')}", style={"color": colors["text_secondary"], "marginLeft": "8px"}),
-            html.Div(id="refresh-status", style={"display": "inline-block", "marginLeft": "16px"})
+            html.Div(id="refresh-status", style={"display": "inline-block", "marginLeft": "16px"}),
+            # Background refresh job and its result polling (see app.handle_refresh)
+            dcc.Store(id="refresh-job-id"),
+            dcc.Interval(id="refresh-poll", interval=2000, disabled=True),
         ], style={"textAlign": "right", "padding": "6px 0", "marginBottom": "8px"}),
 
         # =====================================================================
@@ -76,21 +107,19 @@ def create_merged_layout(user, theme="dark"):
                 dbc.Row([
                     # Start Date
                     dbc.Col([
-                        html.Div("Start Date", className="filter-title",
-                                 style={"color": colors["text_secondary"], "fontSize": "12px", "marginBottom": "4px"}),
+                        _filter_label("Start Date", theme),
                         dcc.DatePickerSingle(
                             id="merged-start-date",
                             min_date_allowed=min_date,
                             max_date_allowed=max_date,
-                            date=max_date - timedelta(days=90),
+                            date=default_start,
                             display_format="YYYY-MM-DD",
                             style={"width": "100%"}
                         ),
                     ], width=3),
                     # End Date
                     dbc.Col([
-                        html.Div("End Date", className="filter-title",
-                                 style={"color": colors["text_secondary"], "fontSize": "12px", "marginBottom": "4px"}),
+                        _filter_label("End Date", theme),
                         dcc.DatePickerSingle(
                             id="merged-end-date",
                             min_date_allowed=min_date,
@@ -102,22 +131,20 @@ def create_merged_layout(user, theme="dark"):
                     ], width=3),
                     # App Name
                     dbc.Col([
-                        html.Div("App Name", className="filter-title",
-                                 style={"color": colors["text_secondary"], "fontSize": "12px", "marginBottom": "4px"}),
+                        _filter_label("App Name", theme),
                         dbc.Select(
                             id="merged-app-name",
-                            options=[{"label": a, "value": a} for a in app_names],
+                            options=_app_options(tuple(app_names)),
                             value=default_app,
                         ),
                     ], width=3),
                     # BC Dropdown (Tab 1 only — hidden on other tabs via callback)
                     dbc.Col([
                         html.Div(id="merged-bc-filter-container", children=[
-                            html.Div("BC (Retention/Refund)", className="filter-title",
-                                     style={"color": colors["text_secondary"], "fontSize": "12px", "marginBottom": "4px"}),
+                            _filter_label("BC (Retention/Refund)", theme),
                             dbc.Select(
                                 id="merged-bc-dropdown",
-                                options=[{"label": str(i), "value": i} for i in [0, 1, 2, 3, 4]],
+                                options=BC_OPTIONS,
                                 value=4,
                             ),
                         ]),
@@ -128,8 +155,7 @@ def create_merged_layout(user, theme="dark"):
                 html.Div(id="merged-plan-filter-container", children=[
                     dbc.Row([
                         dbc.Col([
-                            html.Div("Plan Name", className="filter-title",
-                                     style={"color": colors["text_secondary"], "fontSize": "12px", "marginBottom": "4px", "marginTop": "12px"}),
+                            _filter_label("Plan Name", theme, margin_top="12px"),
                             dbc.Select(
                                 id="merged-plan-name",
                                 options=[],
@@ -157,9 +183,35 @@ def create_merged_layout(user, theme="dark"):
             className="mb-3"
         ),
 
-        # Tab content container
-        html.Div(id="merged-tab-content", children=[
-            dbc.Spinner(color="primary", size="lg")
+        # Tab content containers — one per tab, rendered lazily and kept
+        # mounted; a clientside callback shows only the active one
+        html.Div([
+            # All Plans keeps its Plan Details grid apart from the charts: the
+            # grid only depends on the app, so date/BC changes leave it alone
+            html.Div(
+                id="merged-tab-all-plans-content",
+                children=[
+                    html.Div(id="merged-plan-details-container"),
+                    html.Div(id="merged-all-plans-charts", children=[dbc.Spinner(color="primary", size="lg")]),
+                ],
+                style={"display": "block"}
+            )
+        ] + [
+            html.Div(
+                id=f"merged-tab-{tab_id}-content",
+                children=[],
+                style={"display": "none"}
+            )
+            for tab_id in MERGED_TAB_IDS[1:]
+        ] + [
+            # Filter state each tab was last rendered with
+            dcc.Store(id=f"merged-tab-{tab_id}-key")
+            for tab_id in MERGED_TAB_IDS
+        ] + [
+            # App/theme the Plan Details grid was last rendered with
+            dcc.Store(id="merged-plan-details-key"),
+            # Settled [start, end] dates (debounced from the two date pickers)
+            dcc.Store(id="merged-date-range", data=[default_start.isoformat(), max_date.isoformat()])
         ]),
 
 
@@ -29,6 +29,12 @@ Standards:
 - Pie labels hidden below 10%
 """
 
+import math
+import zlib
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
 import plotly.graph_objects as go
 from app.theme import get_theme_colors
 from app.config import APP_COLORS
@@ -44,14 +50,17 @@ APP_ORDER = [
 ]
 
 
+# APP_ORDER position per spelling of each app name (as-is, upper-case, spaced dash)
+_ORDER_MAP = {}
+for _i, _a in enumerate(APP_ORDER):
+    _ORDER_MAP[_a] = _i
+    _ORDER_MAP[_a.upper()] = _i
+    _ORDER_MAP[_a.replace("-", " - ")] = _i
+
+
 def _sort_apps(names):
     """Sort app names by canonical APP_ORDER; unknowns go to end alphabetically"""
-    order_map = {}
-    for i, a in enumerate(APP_ORDER):
-        order_map[a] = i
-        order_map[a.upper()] = i
-        order_map[a.replace("-", " - ")] = i
-    return sorted(names, key=lambda n: (order_map.get(n, order_map.get(n.upper(), 999)), n))
+    return sorted(names, key=lambda n: (_ORDER_MAP.get(n, _ORDER_MAP.get(n.upper(), 999)), n))
 
 # Distinct palette for entity/app lines
 _ENTITY_PALETTE = [
@@ -69,8 +78,18 @@ TARGET_COLOR = "#1E3A5F"    # Dark navy
 DELTA_COLOR = "#22C55E"     # Green
 
 
+def _palette_color(name):
+    """_ENTITY_PALETTE color for a name, the same in every process (str hash() is salted per process)"""
+    return _ENTITY_PALETTE[zlib.crc32(str(name).encode("utf-8")) % len(_ENTITY_PALETTE)]
+
+
 def _entity_color_map(names):
-    """Assign colors to entity names using shared APP_COLORS from config"""
+    """Assign colors to entity names using shared APP_COLORS from config - CACHED (treat as read-only)"""
+    return _entity_color_map_cached(frozenset(names))
+
+
+@lru_cache(maxsize=64)
+def _entity_color_map_cached(names):
     # Handle variants with spaces (e.g. "CT - JP" → "CT-JP")
     def _normalize(n):
         return n.replace(" - ", "-").replace(" -", "-").replace("- ", "-")
@@ -86,8 +105,7 @@ def _entity_color_map(names):
             if prefix in APP_COLORS:
                 cmap[name] = APP_COLORS[prefix]
             else:
-                idx = hash(name) % len(_ENTITY_PALETTE)
-                cmap[name] = _ENTITY_PALETTE[idx]
+                cmap[name] = _palette_color(name)
     return cmap
 
 def _empty_figure(colors, message="No data available for selected filters"):
@@ -153,30 +171,31 @@ def _format_value_k(val):
 
 def _is_all_zero_or_null(values):
     """Return True if all values are 0, NaN, or None"""
-    import pandas as pd
-    for v in values:
-        if pd.notna(v) and v != 0:
-            return False
-    return True
+    values = pd.Series(values, copy=False)
+    return not (values.notna() & (values != 0)).any()
+
+
+def _rows_by_app(df):
+    """{App_Name: that app's rows sorted by Date} from one groupby pass"""
+    return {app: adf.sort_values("Date") for app, adf in df.groupby("App_Name", sort=False, observed=True)}
 
 
 def _fix_small_yaxis(fig):
     """Fix y-axis showing repeated tick labels (e.g. '0, 0, 0') when values are near zero.
     When max value is small, Plotly creates fractional ticks that round to the same integer.
     Fix: set explicit range and limit nticks to avoid duplicate labels."""
-    import pandas as pd
+    ys = [np.asarray(trace.y, dtype=float) for trace in fig.data
+          if getattr(trace, 'y', None) is not None and len(trace.y) > 0]
     all_max = 0
-    for trace in fig.data:
-        ys = getattr(trace, 'y', None)
-        if ys is not None and len(ys) > 0:
-            valid = [v for v in ys if pd.notna(v)]
-            if valid:
-                all_max = max(all_max, max(abs(v) for v in valid))
+    if ys:
+        values = np.abs(np.concatenate(ys))
+        values = values[~np.isnan(values)]
+        if values.size:
+            all_max = float(values.max())
     if all_max == 0:
         fig.update_layout(yaxis_range=[0, 1], yaxis_nticks=3)
     elif all_max < 5:
         # Force a clean range so integer ticks don't repeat
-        import math
         nice_max = max(1, math.ceil(all_max * 1.2))
         fig.update_layout(yaxis_range=[0, nice_max], yaxis_nticks=min(nice_max + 1, 6))
 
@@ -252,30 +271,33 @@ def build_multi_app_lines(df, actual_label, target_label, format_type="dollar",
     apps = _sort_apps(df["App_Name"].unique())
     cmap = _entity_color_map(apps)
 
-    fig = go.Figure()
+    by_app = _rows_by_app(df)
+    value_fmt = "$%{y:,.0f}" if format_type == "dollar" else "%{y:,.0f}"
+    traces = []
     for app in apps:
-        adf = df[df["App_Name"] == app].sort_values("Date")
+        adf = by_app[app]
         color = cmap.get(app, "#6B7280")
 
         # Actual (solid)
-        fig.add_trace(go.Scatter(
+        traces.append(dict(
+            type="scatter",
             x=adf["Date"], y=adf["actual"],
             mode="lines", name=f"{actual_label}, {app}",
             line=dict(color=color, width=LINE_WIDTH),
-            hovertemplate=f'{actual_label}, {app}  $%{{y:,.0f}}<extra></extra>' if format_type == "dollar"
-                else f'{actual_label}, {app}  %{{y:,.0f}}<extra></extra>',
+            hovertemplate=f'{actual_label}, {app}  {value_fmt}<extra></extra>',
             showlegend=True,
         ))
         # Target (dotted)
-        fig.add_trace(go.Scatter(
+        traces.append(dict(
+            type="scatter",
             x=adf["Date"], y=adf["target"],
             mode="lines", name=f"{target_label}, {app}",
             line=dict(color=color, width=LINE_WIDTH, dash="dot"),
-            hovertemplate=f'{target_label}, {app}  $%{{y:,.0f}}<extra></extra>' if format_type == "dollar"
-                else f'{target_label}, {app}  %{{y:,.0f}}<extra></extra>',
+            hovertemplate=f'{target_label}, {app}  {value_fmt}<extra></extra>',
             showlegend=True,
         ))
 
+    fig = go.Figure(data=traces)
     layout = _base_layout(colors, format_type, date_range)
     layout["showlegend"] = True
     layout["margin"] = dict(l=60, r=130, t=40, b=50)
@@ -294,31 +316,25 @@ def build_grouped_bar(df, labels=("Actual", "Target", "Delta"), format_type="dol
     if df is None or df.empty:
         return _empty_figure(colors)
 
-    fig = go.Figure()
-
     # Format text values in 1000s
     actual_text = [_format_value_k(v) for v in df["actual"]]
     target_text = [_format_value_k(v) for v in df["target"]]
     delta_text = [_format_value_k(v) for v in df["delta"]]
 
-    fig.add_trace(go.Bar(
-        x=df["App_Name"], y=df["actual"],
-        name=labels[0], marker_color=ACTUAL_COLOR,
-        text=actual_text, textposition="outside", textfont=dict(size=10),
-        hovertemplate='%{x}<br>' + labels[0] + ': %{y:,.0f}<extra></extra>',
-    ))
-    fig.add_trace(go.Bar(
-        x=df["App_Name"], y=df["target"],
-        name=labels[1], marker_color=TARGET_COLOR,
-        text=target_text, textposition="outside", textfont=dict(size=10),
-        hovertemplate='%{x}<br>' + labels[1] + ': %{y:,.0f}<extra></extra>',
-    ))
-    fig.add_trace(go.Bar(
-        x=df["App_Name"], y=df["delta"],
-        name=labels[2], marker_color=DELTA_COLOR,
-        text=delta_text, textposition="outside", textfont=dict(size=10),
-        hovertemplate='%{x}<br>' + labels[2] + ': %{y:,.0f}<extra></extra>',
-    ))
+    fig = go.Figure(data=[
+        dict(
+            type="bar",
+            x=df["App_Name"], y=df[col],
+            name=label, marker=dict(color=color),
+            text=text, textposition="outside", textfont=dict(size=10),
+            hovertemplate='%{x}<br>' + label + ': %{y:,.0f}<extra></extra>',
+        )
+        for col, label, color, text in (
+            ("actual", labels[0], ACTUAL_COLOR, actual_text),
+            ("target", labels[1], TARGET_COLOR, target_text),
+            ("delta", labels[2], DELTA_COLOR, delta_text),
+        )
+    ])
 
     layout = _base_layout(colors, format_type)
     layout["barmode"] = "group"
@@ -363,6 +379,7 @@ def build_pie_chart(labels, values, theme="dark"):
         else:
             custom_text.append("")
 
+    cmap = _entity_color_map(labels)
     fig = go.Figure(data=[go.Pie(
         labels=labels,
         values=values,
@@ -372,7 +389,7 @@ def build_pie_chart(labels, values, theme="dark"):
         pull=[0.02] * len(labels),
         hole=0,
         marker=dict(
-            colors=[_entity_color_map(labels).get(l, "#6B7280") for l in labels],
+            colors=[cmap.get(l, "#6B7280") for l in labels],
             line=dict(color=colors["card_bg"], width=1),
         ),
     )])
@@ -409,21 +426,23 @@ def build_entity_lines(data_df, format_type="dollar", date_range=None, theme="da
     apps = _sort_apps(data_df["App_Name"].unique())
     cmap = _entity_color_map(apps)
 
-    fig = go.Figure()
+    by_app = _rows_by_app(data_df)
+    if format_type == "dollar":
+        value_fmt = "$%{y:,.2f}"
+    elif format_type == "percent":
+        value_fmt = "%{y:.2%}"
+    else:
+        value_fmt = "%{y:,.0f}"
+    traces = []
     for app in apps:
-        adf = data_df[data_df["App_Name"] == app].sort_values("Date")
+        adf = by_app[app]
         if _is_all_zero_or_null(adf[value_col]):
             continue
         color = cmap.get(app, "#6B7280")
+        ht = f'{app}  {value_fmt}<extra></extra>'
 
-        if format_type == "dollar":
-            ht = f'{app}  $%{{y:,.2f}}<extra></extra>'
-        elif format_type == "percent":
-            ht = f'{app}  %{{y:.2%}}<extra></extra>'
-        else:
-            ht = f'{app}  %{{y:,.0f}}<extra></extra>'
-
-        fig.add_trace(go.Scatter(
+        traces.append(dict(
+            type="scatter",
             x=adf["Date"], y=adf[value_col],
             mode="lines", name=app,
             line=dict(color=color, width=LINE_WIDTH),
@@ -431,6 +450,7 @@ def build_entity_lines(data_df, format_type="dollar", date_range=None, theme="da
             showlegend=True,
         ))
 
+    fig = go.Figure(data=traces)
     layout = _base_layout(colors, format_type, date_range)
     layout["showlegend"] = True
     layout["margin"] = dict(l=60, r=130, t=40, b=50)
@@ -500,9 +520,10 @@ def build_annotated_entity_lines(data_df, format_type="percent", date_range=None
     else:
         start_val = end_val = pct_change = 0
 
+    by_app = _rows_by_app(data_df)
     fig = go.Figure()
     for app in apps:
-        adf = data_df[data_df["App_Name"] == app].sort_values("Date")
+        adf = by_app[app]
         if _is_all_zero_or_null(adf[value_col]):
             continue
         color = cmap.get(app, "#6B7280")
@@ -720,8 +741,7 @@ def build_stacked_area(data_df, format_type="number", date_range=None, theme="da
         # For AFID or other string groups, use hash-based palette
         cmap = {}
         for g in groups:
-            idx = hash(str(g)) % len(_ENTITY_PALETTE)
-            cmap[g] = _ENTITY_PALETTE[idx]
+            cmap[g] = _palette_color(g)
 
     fig = go.Figure()
     for g in groups:
@@ -825,9 +845,9 @@ def build_dual_axis_approval(per_entity_df, total_df, entity_col, date_range=Non
         entities = _sort_apps(per_entity_df[entity_col].unique()) if entity_col == "App_Name" else sorted(per_entity_df[entity_col].unique())
         cmap = _entity_color_map(entities) if entity_col == "App_Name" else {}
         if not cmap:
+            cmap = {}  # never fill the shared cached map
             for e in entities:
-                idx = hash(str(e)) % len(_ENTITY_PALETTE)
-                cmap[e] = _ENTITY_PALETTE[idx]
+                cmap[e] = _palette_color(e)
 
         for ent in entities:
             edf = per_entity_df[per_entity_df[entity_col] == ent].sort_values("Report_Date")
@@ -922,8 +942,7 @@ def build_stacked_bar_100(data_df, date_range=None, theme="dark"):
     categories = sorted(data_df["Final_Category"].unique())
     cmap = {}
     for cat in categories:
-        idx = hash(cat) % len(_ENTITY_PALETTE)
-        cmap[cat] = _ENTITY_PALETTE[idx]
+        cmap[cat] = _palette_color(cat)
 
     dates = sorted(data_df["Report_Date"].unique())
 
@@ -27,7 +27,7 @@ from datetime import datetime
 import logging
 
 from app.bigquery_client import (
-    get_gcs_bucket, load_parquet_from_gcs, save_parquet_to_gcs,
+    get_gcs_bucket, load_parquet_from_gcs, save_parquet_to_gcs, copy_gcs_blob,
     get_metadata_timestamp, set_metadata_timestamp, log_debug
 )
 
@@ -149,6 +149,18 @@ def _ensure_date_col(df, col="Date"):
     return df
 
 
+# Date columns are parsed once at load, so filters compare against datetime64
+# directly and never copy or write to a cached table
+_DATE_COLUMNS = ("Date", "Report_Date")
+
+
+def _prepare_table(df):
+    """Parse a freshly loaded table's date columns for caching"""
+    for col in _DATE_COLUMNS:
+        _ensure_date_col(df, col)
+    return df
+
+
 # =============================================================================
 # PRELOAD / REFRESH
 # =============================================================================
@@ -162,7 +174,7 @@ def preload_daedalus_tables():
         try:
             arrow_table = load_parquet_from_gcs(bucket, config["active"])
             if arrow_table is not None:
-                _daedalus_cache[key] = arrow_table.to_pandas()
+                _daedalus_cache[key] = _prepare_table(arrow_table.to_pandas())
                 logger.info(f"  Daedalus [{key}]: {len(_daedalus_cache[key])} rows")
             else:
                 _daedalus_cache[key] = pd.DataFrame()
@@ -216,8 +228,8 @@ def refresh_daedalus_gcs_from_staging(skip_keys=None):
             arrow_table = load_parquet_from_gcs(bucket, config["staging"])
             if arrow_table is None:
                 continue
-            save_parquet_to_gcs(bucket, config["active"], arrow_table)
-            _daedalus_cache[key] = arrow_table.to_pandas()
+            copy_gcs_blob(bucket, config["staging"], config["active"])
+            _daedalus_cache[key] = _prepare_table(arrow_table.to_pandas())
             log_debug(f"  Daedalus [{key}]: {arrow_table.num_rows} rows activated")
             activated.append(key)
 
@@ -321,7 +333,6 @@ def get_tab1_kpi_cards():
     df = _get_df("daedalus")
     if df.empty:
         return {}
-    df = _ensure_date_col(df.copy())
     latest = df["Date"].max()
     day = df[df["Date"] == latest]
 
@@ -348,7 +359,6 @@ def get_spend_pivot(app_names, selected_date):
     df = _get_df("daedalus")
     if df.empty:
         return pd.DataFrame()
-    df = _ensure_date_col(df.copy())
     mask = (df["Date"] == pd.Timestamp(selected_date)) & (df["App_Name"].isin(app_names))
     day = df.loc[mask]
     if day.empty:
@@ -376,7 +386,6 @@ def get_users_pivot(app_names, selected_date):
     df = _get_df("daedalus")
     if df.empty:
         return pd.DataFrame()
-    df = _ensure_date_col(df.copy())
     mask = (df["Date"] == pd.Timestamp(selected_date)) & (df["App_Name"].isin(app_names))
     day = df.loc[mask]
     if day.empty:
@@ -397,7 +406,6 @@ def get_cac_pivot(app_names, selected_date):
     df = _get_df("daedalus")
     if df.empty:
         return pd.DataFrame()
-    df = _ensure_date_col(df.copy())
     mask = (df["Date"] == pd.Timestamp(selected_date)) & (df["App_Name"].isin(app_names))
     day = df.loc[mask]
     if day.empty:
@@ -422,7 +430,6 @@ def get_lines_by_app(app_names, year, month, actual_col, target_col):
     df = _get_df("daedalus")
     if df.empty:
         return pd.DataFrame()
-    df = _ensure_date_col(df.copy())
     mask = (
         (df["App_Name"].isin(app_names)) &
         (df["Date"].dt.year == year) &
@@ -444,7 +451,6 @@ def get_lines_total(app_names, year, month, actual_col, target_col):
     df = _get_df("daedalus")
     if df.empty:
         return pd.DataFrame()
-    df = _ensure_date_col(df.copy())
     mask = (
         (df["App_Name"].isin(app_names)) &
         (df["Date"].dt.year == year) &
@@ -470,7 +476,6 @@ def get_bars_by_app(app_names, selected_date, actual_col, target_col, delta_col)
     df = _get_df("daedalus")
     if df.empty:
         return pd.DataFrame()
-    df = _ensure_date_col(df.copy())
     mask = (df["Date"] == pd.Timestamp(selected_date)) & (df["App_Name"].isin(app_names))
     day = df.loc[mask]
     if day.empty:
@@ -495,7 +500,6 @@ def get_pacing_by_entity(year, month):
     df = _get_df("daedalus")
     if df.empty:
         return {}
-    df = _ensure_date_col(df.copy())
     mask = (df["Date"].dt.year == year) & (df["Date"].dt.month == month)
     filtered = df.loc[mask]
     if filtered.empty:
@@ -534,7 +538,6 @@ def get_cac_by_entity(app_names, start_date, end_date, metrics):
     df = _get_df("cac_entity")
     if df.empty:
         return {}
-    df = _ensure_date_col(df.copy())
     mask = (
         (df["App_Name"].isin(app_names)) &
         (df["Date"] >= pd.Timestamp(start_date)) &
@@ -565,7 +568,6 @@ def get_portfolio_active_subs(app_names, channels, start_date, end_date):
     df = _get_df("active_subs")
     if df.empty:
         return pd.DataFrame()
-    df = _ensure_date_col(df.copy())
     mask = (
         (df["App_Name"].isin(app_names)) &
         (df["AFID_CHANNEL"].isin(channels)) &
@@ -585,7 +587,6 @@ def get_current_subs_pivot(app_names, channels, start_date, end_date):
     df = _get_df("active_subs")
     if df.empty:
         return pd.DataFrame()
-    df = _ensure_date_col(df.copy())
     mask = (
         (df["App_Name"].isin(app_names)) &
         (df["AFID_CHANNEL"].isin(channels)) &
@@ -661,7 +662,6 @@ def get_pie_by_app(app_names, channels, selected_date):
     df = _get_df("active_subs")
     if df.empty:
         return pd.DataFrame()
-    df = _ensure_date_col(df.copy())
     mask = (
         (df["App_Name"].isin(app_names)) &
         (df["AFID_CHANNEL"].isin(channels)) &
@@ -681,7 +681,6 @@ def get_pie_by_app_channel(app_names, channels, selected_date):
     df = _get_df("active_subs")
     if df.empty:
         return pd.DataFrame()
-    df = _ensure_date_col(df.copy())
     mask = (
         (df["App_Name"].isin(app_names)) &
         (df["AFID_CHANNEL"].isin(channels)) &
@@ -702,7 +701,6 @@ def get_entity_active_subs(app_names, channels, start_date, end_date):
     df = _get_df("active_subs")
     if df.empty:
         return pd.DataFrame()
-    df = _ensure_date_col(df.copy())
     mask = (
         (df["App_Name"].isin(app_names)) &
         (df["AFID_CHANNEL"].isin(channels)) &
@@ -722,7 +720,6 @@ def _ratio_by_entity(app_names, channels, start_date, end_date, numerator, denom
     df = _get_df("active_subs")
     if df.empty:
         return pd.DataFrame()
-    df = _ensure_date_col(df.copy())
     mask = (
         (df["App_Name"].isin(app_names)) &
         (df["AFID_CHANNEL"].isin(channels)) &
@@ -746,7 +743,6 @@ def _ratio_portfolio(app_names, channels, start_date, end_date, numerator, denom
     df = _get_df("active_subs")
     if df.empty:
         return pd.DataFrame()
-    df = _ensure_date_col(df.copy())
     mask = (
         (df["App_Name"].isin(app_names)) &
         (df["AFID_CHANNEL"].isin(channels)) &
@@ -805,7 +801,6 @@ def get_historical_metric_by_app(app_names, start_date, end_date, metric):
     df = _get_df("cac_entity")
     if df.empty:
         return pd.DataFrame()
-    df = _ensure_date_col(df.copy())
     mask = (
         (df["App_Name"].isin(app_names)) &
         (df["Date"] >= pd.Timestamp(start_date)) &
@@ -825,7 +820,6 @@ def get_historical_spend_split(app_names, start_date, end_date):
     df = _get_df("cac_entity")
     if df.empty:
         return pd.DataFrame()
-    df = _ensure_date_col(df.copy())
     mask = (
         (df["App_Name"].isin(app_names)) &
         (df["Date"] >= pd.Timestamp(start_date)) &
@@ -881,7 +875,6 @@ def get_tc_lines_by_app(start_date, end_date, channels, metric_col):
     df = _get_df("traffic_channel")
     if df.empty:
         return {}
-    df = _ensure_date_col(df.copy())
     mask = (
         (df["Date"] >= pd.Timestamp(start_date)) &
         (df["Date"] <= pd.Timestamp(end_date)) &
@@ -921,7 +914,6 @@ def get_tc_pie_by_app(start_date, end_date, channels, metric_col):
     df = _get_df("traffic_channel")
     if df.empty:
         return {}
-    df = _ensure_date_col(df.copy())
     mask = (
         (df["Date"] >= pd.Timestamp(start_date)) &
         (df["Date"] <= pd.Timestamp(end_date)) &
@@ -954,7 +946,6 @@ def get_tc_stacked_by_app(start_date, end_date, channels, metric_col):
     df = _get_df("traffic_channel")
     if df.empty:
         return {}
-    df = _ensure_date_col(df.copy())
     mask = (
         (df["Date"] >= pd.Timestamp(start_date)) &
         (df["Date"] <= pd.Timestamp(end_date)) &
@@ -1008,7 +999,6 @@ def get_cac_tc_by_app(start_date, end_date, channels, metrics):
     df = _get_df("cac_tc_7d")
     if df.empty:
         return {}
-    df = _ensure_date_col(df.copy())
     mask = (
         (df["Date"] >= pd.Timestamp(start_date)) &
         (df["Date"] <= pd.Timestamp(end_date)) &
@@ -1068,7 +1058,6 @@ def get_afid_unknown_pie(app_names, afids, start_date, end_date):
     df = _get_df("afid_unknown")
     if df.empty:
         return pd.DataFrame()
-    df = _ensure_date_col(df.copy())
     mask = (
         (df["App_Name"].isin(app_names)) &
         (df["AFID"].isin(afids)) &
@@ -1089,7 +1078,6 @@ def get_afid_unknown_stacked(app_names, afids, start_date, end_date):
     df = _get_df("afid_unknown")
     if df.empty:
         return pd.DataFrame()
-    df = _ensure_date_col(df.copy())
     mask = (
         (df["App_Name"].isin(app_names)) &
         (df["AFID"].isin(afids)) &
@@ -1140,7 +1128,6 @@ def get_cpa_by_entity_daily(selected_date):
     df = _get_df("cpa_by_entity")
     if df.empty:
         return pd.DataFrame()
-    df = _ensure_date_col(df.copy())
     filtered = df[df["Date"] == pd.Timestamp(selected_date)].copy()
     if filtered.empty:
         return pd.DataFrame()
@@ -1165,7 +1152,6 @@ def get_cpa_by_application_daily(selected_date, entity_names, app_names):
     df = _get_df("cpa")
     if df.empty:
         return pd.DataFrame()
-    df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
     mask = (
         (df["Date"] == pd.Timestamp(selected_date)) &
         (df["App_Name"].isin(app_names))
@@ -1217,7 +1203,6 @@ def get_cpa_by_entity_mtd(selected_date):
     df = _get_df("cpa_by_entity_mtd")
     if df.empty:
         return pd.DataFrame()
-    df = _ensure_date_col(df.copy())
     filtered = df[df["Date"] == pd.Timestamp(selected_date)].copy()
     if filtered.empty:
         return pd.DataFrame()
@@ -1242,7 +1227,6 @@ def get_cpa_by_application_mtd(selected_date, entity_names, app_names):
     df = _get_df("cpa")
     if df.empty:
         return pd.DataFrame()
-    df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
     mask = (
         (df["Date"] == pd.Timestamp(selected_date)) &
         (df["App_Name"].isin(app_names))
@@ -1313,7 +1297,6 @@ def get_app_approval_rates(app_names, start_date, end_date):
     df = _get_df("app_level_metrics")
     if df.empty:
         return {}
-    df["Report_Date"] = pd.to_datetime(df["Report_Date"], errors="coerce")
     mask = (
         (df["App_Name"].isin(app_names)) &
         (df["Report_Date"] >= pd.Timestamp(start_date)) &
@@ -1347,7 +1330,6 @@ def get_channel_approval_rates(app_names, channel_names, start_date, end_date):
     df = _get_df("app_channel_metrics")
     if df.empty:
         return {}
-    df["Report_Date"] = pd.to_datetime(df["Report_Date"], errors="coerce")
     mask = (
         (df["App_Name"].isin(app_names)) &
         (df["Channel_Name"].isin(channel_names)) &
@@ -1392,7 +1374,6 @@ def get_afid_approval_rates(app_names, afids, start_date, end_date):
     df = _get_df("app_channel_afid_metrics")
     if df.empty:
         return {}
-    df["Report_Date"] = pd.to_datetime(df["Report_Date"], errors="coerce")
     mask = (
         (df["App_Name"].isin(app_names)) &
         (df["AFID"].isin(afids)) &
@@ -1497,7 +1478,6 @@ def _get_decline_data(cache_key, app_names, start_date, end_date,
     df = _get_df(cache_key)
     if df.empty:
         return {}
-    df["Report_Date"] = pd.to_datetime(df["Report_Date"], errors="coerce")
     mask = (
         (df["App_Name"].isin(app_names)) &
         (df["Report_Date"] >= pd.Timestamp(start_date)) &
@@ -132,7 +132,10 @@ def create_icarus_multi_layout(user, theme="dark"):
             dbc.Button("Refresh GCS", id="refresh-gcs-btn", size="sm", className="refresh-btn-green"),
             html.Small(f"  Last: {cache_info.get('last_gcs_refresh', '--')}",
                        style={"color": colors["text_secondary"], "marginLeft": "8px"}),
-            html.Div(id="refresh-status", style={"display": "inline-block", "marginLeft": "16px"})
+            html.Div(id="refresh-status", style={"display": "inline-block", "marginLeft": "16px"}),
+            # Background refresh job and its result polling (see app.handle_refresh)
+            dcc.Store(id="refresh-job-id"),
+            dcc.Interval(id="refresh-poll", interval=2000, disabled=True),
         ], style={"textAlign": "right", "padding": "6px 0", "marginBottom": "8px"}),
         
         # Tabs for Active/Inactive
@@ -0,0 +1,31 @@
+"""
+Import smoke test
+Every dashboard module must import cleanly; module-level decorators such as
+cache.memoize run at import time, so ordering mistakes crash app startup
+"""
+
+import importlib
+import pkgutil
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# app.app itself is skipped: importing it preloads BigQuery/GCS tables
+pytest.importorskip("dash")
+pytest.importorskip("dash_bootstrap_components")
+pytest.importorskip("flask_caching")
+
+
+def _dashboard_modules():
+    import app.dashboards as dashboards
+    return sorted(
+        info.name for info in pkgutil.walk_packages(dashboards.__path__, prefix="app.dashboards.")
+    )
+
+
+@pytest.mark.parametrize("module_name", _dashboard_modules())
+def test_dashboard_module_imports(module_name):
+    importlib.import_module(module_name)